@@ -0,0 +1,19 @@
+"""
+Micro-benchmarks des chemins critiques du jeu (pilote vidéo factice)
+
+Lancer depuis la racine du dépôt :
+    python -m benchmarks                       # affiche les mesures
+    python -m benchmarks --save                # écrit benchmarks/baseline.json
+    python -m benchmarks --compare             # échoue si régression > seuil
+"""
+import os
+import sys
+
+# Pilotes SDL factices : aucune fenêtre ni sortie audio
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Les modules du jeu s'importent par leur nom (comme depuis game/main.py)
+GAME_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "game")
+if GAME_DIR not in sys.path:
+    sys.path.insert(0, GAME_DIR)
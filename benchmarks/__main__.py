@@ -0,0 +1,122 @@
+import argparse
+import fnmatch
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pygame
+
+from benchmarks import cases
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def measure(setup, calls, warmup=20, alloc_calls=20):
+    """
+    Mesure un cas : latence par appel (µs) et allocations Python par appel
+
+    Les allocations sont suivies avec tracemalloc sur quelques appels séparés
+    (pour ne pas fausser les temps) ; la mémoire des pixels SDL n'y apparaît pas.
+    """
+    run = setup()
+    for _ in range(warmup):
+        run()
+
+    timings = np.empty(calls)
+    clock = time.perf_counter_ns
+    for i in range(calls):
+        start = clock()
+        run()
+        timings[i] = clock() - start
+    timings /= 1000  # ns -> µs
+
+    peaks = []
+    blocks = []
+    tracemalloc.start()
+    for _ in range(alloc_calls):
+        snapshot = tracemalloc.take_snapshot()
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+        diff = tracemalloc.take_snapshot().compare_to(snapshot, "filename")
+        blocks.append(sum(stat.count_diff for stat in diff))
+    tracemalloc.stop()
+
+    p50, p90, p99 = np.percentile(timings, [50, 90, 99])
+    return {
+        "calls": calls,
+        "mean_us": float(timings.mean()),
+        "p50_us": float(p50),
+        "p90_us": float(p90),
+        "p99_us": float(p99),
+        "max_us": float(timings.max()),
+        "alloc_peak_bytes": int(np.median(peaks)),
+        "alloc_blocks": int(np.median(blocks)),
+    }
+
+
+def compare(results, baseline, threshold, min_delta_us):
+    """Retourne la liste des cas dont la latence médiane a régressé au-delà du seuil"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        limit = base["p50_us"] * (1 + threshold)
+        if result["p50_us"] > limit and result["p50_us"] - base["p50_us"] > min_delta_us:
+            regressions.append((name, base["p50_us"], result["p50_us"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Micro-benchmarks des chemins critiques du jeu")
+    parser.add_argument("-k", "--filter", default="*", help="Motif des cas à lancer (fnmatch)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplie le nombre d'appels mesurés")
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, metavar="FICHIER",
+                        help="Écrit les résultats comme référence JSON")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, metavar="FICHIER",
+                        help="Compare à une référence JSON et échoue en cas de régression")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Régression tolérée sur la latence médiane (0.25 = +25%%)")
+    parser.add_argument("--min-delta", type=float, default=5.0,
+                        help="Écart absolu minimal (µs) pour signaler une régression")
+    args = parser.parse_args()
+
+    pygame.init()
+    cases._screen()
+
+    results = {}
+    print(f"{'cas':<26}{'p50 µs':>10}{'p90 µs':>10}{'p99 µs':>10}{'alloc o':>10}{'blocs':>8}")
+    for name, (setup, calls) in cases.CASES.items():
+        if not fnmatch.fnmatch(name, args.filter):
+            continue
+        result = measure(setup, max(1, int(calls * args.scale)))
+        results[name] = result
+        print(f"{name:<26}{result['p50_us']:>10.1f}{result['p90_us']:>10.1f}{result['p99_us']:>10.1f}"
+              f"{result['alloc_peak_bytes']:>10}{result['alloc_blocks']:>8}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "pygame": pygame.version.ver,
+                       "results": results}, f, indent=2)
+        print(f"Référence écrite : {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_delta)
+        for name, before, after in regressions:
+            print(f"RÉGRESSION {name}: {before:.1f} µs -> {after:.1f} µs")
+        if regressions:
+            sys.exit(1)
+        print("Aucune régression")
+
+
+if __name__ == "__main__":
+    main()
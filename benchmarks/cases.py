@@ -0,0 +1,275 @@
+"""Cas mesurés : chaque fonction prépare un état réaliste et retourne l'appel à chronométrer"""
+import atexit
+import contextlib
+import io
+import os
+import random
+import tempfile
+
+import numpy as np
+import pygame
+
+from bar_game import TopBar
+from game import Game
+from main_itrfc import MainMenu
+from particles import ParticleSystem
+from score import Score
+
+WIDTH, HEIGHT = 800, 580
+BAR_HEIGHT = 80
+SEED = 1234
+SCORE_LINES = 5000
+
+
+def _screen():
+    """Surface d'écran (pilote factice) partagée par les cas de dessin"""
+    screen = pygame.display.get_surface()
+    if screen is None:
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    return screen
+
+
+def _sweeping_mouse():
+    """Souris scriptée qui balaie l'écran, bouton enfoncé, pour déclencher des coupes"""
+    state = {"step": 0}
+
+    def mouse(game):
+        state["step"] += 1
+        x = (state["step"] * 37) % game.WIDTH
+        y = game.HEIGHT // 2 + int(120 * np.sin(state["step"] * 0.3))
+        return (x, y + BAR_HEIGHT), True
+
+    return mouse
+
+
+def _make_game(mode=1, extra_items=0, mouse=None, difficulty="normal"):
+    """Partie en cours (graine fixe), avec éventuellement des éléments supplémentaires"""
+    _screen()
+    game = Game(WIDTH, HEIGHT - BAR_HEIGHT, rng=random.Random(SEED), save_scores=False,
+                max_entities=64 + extra_items, difficulty=difficulty)
+    game.mouse_input = mouse or _sweeping_mouse()
+    game.set_game_mode(mode)
+    game.start_game()
+
+    if extra_items:
+        rng = np.random.default_rng(SEED)
+        img = game._load_item_image('melon')
+        for i in range(extra_items):
+            game.data.spawn(
+                "melon", img,
+                rng.uniform(60, WIDTH - 60), rng.uniform(0, game.HEIGHT),
+                rng.uniform(-10, 10), rng.uniform(-80, -60), 60,
+            )
+        # Les éléments ajoutés ne sont pas relancés par le jeu, et leurs chutes
+        # ne doivent pas terminer la partie
+        game.SPAWN_DELAY = 10 ** 9
+        game.player_lives = 10 ** 9
+
+    # Avancer un peu pour avoir des éléments en l'air
+    for _ in range(20):
+        game.update(BAR_HEIGHT)
+    return game
+
+
+def _relaunch(game, rng):
+    """
+    Relance tous les éléments quand ils sont tous retombés (cas à nombreux éléments)
+
+    Par EntityStore.spawn, comme le jeu : les compteurs (live) restent justes.
+    """
+    data = game.data
+    n = data.count
+    if not data.throw[:n].any():
+        speed_x = rng.uniform(-10, 10, n)
+        speed_y = rng.uniform(-80, -60, n)
+        for i in range(n):
+            # Réserve vide : spawn() reprend les emplacements dans l'ordre
+            data.spawn(data.keys[i], data.img[i], data.x[i], game.HEIGHT,
+                       speed_x[i], speed_y[i], data.size[i])
+    assert min(data.live.values(), default=0) >= 0, "compteurs live négatifs"
+
+
+def game_update_mode1():
+    game = _make_game(1)
+
+    def run():
+        if game.is_game_over():
+            game.start_game()
+        game.update(BAR_HEIGHT)
+    return run
+
+
+def game_update_mode2():
+    game = _make_game(2)
+    letters = game.letters
+
+    def run():
+        if game.is_game_over():
+            game.start_game()
+        game.queue_letter(letters[game.steps % len(letters)])
+        game.update(BAR_HEIGHT)
+    return run
+
+
+def game_update_256_items():
+    # Souris immobile : on mesure la physique, pas les coupes
+    game = _make_game(1, extra_items=250, mouse=lambda g: ((0, 0), False))
+    rng = np.random.default_rng(SEED)
+
+    def run():
+        _relaunch(game, rng)
+        game.update(BAR_HEIGHT)
+    return run
+
+
+def game_update_extreme():
+    # Salves de la chronologie "extreme" : la réserve reste pleine
+    # Souris immobile : on mesure les lancements et la physique, pas les coupes
+    game = _make_game(1, mouse=lambda g: ((0, 0), False), difficulty="extreme")
+    game.player_lives = 10 ** 9
+
+    def run():
+        game.update(BAR_HEIGHT)
+    return run
+
+
+def game_draw_mode1():
+    screen = _screen()
+    game = _make_game(1)
+    return lambda: game.draw(screen, y_offset=BAR_HEIGHT)
+
+
+def game_draw_dirty_mode1():
+    screen = _screen()
+    game = _make_game(1)
+
+    def run():
+        if game.is_game_over():
+            game.start_game()
+        game.update(BAR_HEIGHT)
+        game.draw_dirty(screen, y_offset=BAR_HEIGHT)
+    return run
+
+
+def game_draw_256_items():
+    screen = _screen()
+    game = _make_game(1, extra_items=250)
+    game.player_lives = 3
+    return lambda: game.draw(screen, y_offset=BAR_HEIGHT)
+
+
+def particles_10k():
+    # Gerbes relancées en continu : environ 10 000 particules vivantes à chaque image
+    screen = _screen()
+    particles = ParticleSystem(rng=np.random.default_rng(SEED))
+    rng = random.Random(SEED)
+    clip = pygame.Rect(0, BAR_HEIGHT, WIDTH, HEIGHT - BAR_HEIGHT)
+
+    def run():
+        if particles.live_count() < particles.capacity - 400:
+            for _ in range(4):
+                particles.emit(rng.uniform(100, WIDTH - 100), rng.uniform(100, 300), 100, (0, 1, 3, 7),
+                               life=(1.0, 2.0))
+        particles.update(1 / 60)
+        screen.set_clip(clip)
+        particles.draw(screen, BAR_HEIGHT)
+        screen.set_clip(None)
+    return run
+
+
+def top_bar_draw():
+    screen = _screen()
+    top_bar = TopBar(WIDTH, height=BAR_HEIGHT)
+    top_bar.start()
+
+    def run():
+        top_bar.update()
+        top_bar.draw(screen)
+    return run
+
+
+def main_menu_draw():
+    screen = _screen()
+    menu = MainMenu(WIDTH, HEIGHT)
+    return lambda: menu.draw(screen)
+
+
+def main_menu_draw_dirty():
+    # Menu au repos (écran d'attente) : rien ne change d'une image à l'autre
+    screen = _screen()
+    menu = MainMenu(WIDTH, HEIGHT)
+    menu.draw(screen)
+    return lambda: menu.draw_dirty(screen)
+
+
+def score_draw_background(particles=None):
+    screen = _screen()
+    score = Score()
+    score.rng = np.random.default_rng(SEED)
+    score.particles = score.create_particles(WIDTH, HEIGHT, particles)
+
+    def run():
+        score.draw_background(screen)
+        score.update_particles(score.particles, WIDTH, HEIGHT)
+    return run
+
+
+def score_draw_background_500():
+    return score_draw_background(500)
+
+
+def _score_file(lines=SCORE_LINES):
+    """Fichier de scores temporaire de taille réaliste"""
+    rng = random.Random(SEED)
+    handle, path = tempfile.mkstemp(prefix="bench_scores_", suffix=".txt")
+    with os.fdopen(handle, "w", encoding="utf-8") as f:
+        for i in range(lines):
+            mode = rng.choice(["Mode 1", "Mode 2"])
+            result = rng.choice(["WIN", "LOSE"])
+            f.write(f"Player{i % 50}|{mode}|{result}|{rng.randint(0, 400)}|{rng.randint(0, 3)}|3|"
+                    f"02/02/2026 09:42|{1770000000 + i}.0\n")
+    atexit.register(_remove_score_file, path)
+    return path
+
+
+def _remove_score_file(path):
+    """Supprime le fichier de scores temporaire et son index des lignes"""
+    for name in (path, path + ".idx"):
+        if os.path.exists(name):
+            os.remove(name)
+
+
+def score_load_scores():
+    score = Score()
+    score.SCORES_FILE = _score_file()
+    return score.load_scores
+
+
+def score_add_score():
+    score = Score()
+    score.SCORES_FILE = _score_file()
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            score.add_score("Bench", "Mode 1", "WIN", 1, 3, final_score=123)
+    return run
+
+
+# Nom du cas -> (préparation, nombre d'appels mesurés)
+CASES = {
+    "game.update[mode1]": (game_update_mode1, 2000),
+    "game.update[mode2]": (game_update_mode2, 2000),
+    "game.update[256 items]": (game_update_256_items, 2000),
+    "game.update[extreme]": (game_update_extreme, 2000),
+    "game.draw[mode1]": (game_draw_mode1, 500),
+    "game.draw_dirty[mode1]": (game_draw_dirty_mode1, 500),
+    "game.draw[256 items]": (game_draw_256_items, 300),
+    "particles[10k]": (particles_10k, 300),
+    "top_bar.draw": (top_bar_draw, 500),
+    "main_menu.draw": (main_menu_draw, 300),
+    "main_menu.draw_dirty": (main_menu_draw_dirty, 300),
+    "score.draw_background": (score_draw_background, 300),
+    "score.draw_background[500]": (score_draw_background_500, 300),
+    "score.load_scores": (score_load_scores, 50),
+    "score.add_score": (score_add_score, 30),
+}
@@ -0,0 +1,174 @@
+import os
+import threading
+from collections import OrderedDict
+
+import pygame
+
+
+class AssetManager:
+    """Cache d'images partagé par tout le jeu (décodage unique, conversion et LRU)"""
+
+    def __init__(self, budget_bytes=64 * 1024 * 1024):
+        # Budget mémoire maximal pour les surfaces en cache
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+
+        # Clé: (chemin, taille, alpha, smooth) -> [surface, convertie, octets]
+        self._cache = OrderedDict()
+        # Le cache peut être rempli par le thread de préchargement (decode)
+        self._lock = threading.RLock()
+
+        # Bundle pré-décodé (bundle.AssetBundle), consulté avant les fichiers
+        self.bundle = None
+        # Chemins des sons demandés, lus par la construction du bundle
+        self.sound_paths = set()
+
+        # Surfaces produites (décodées, redimensionnées ou converties), lu par le profileur
+        self.loads = 0
+
+    @staticmethod
+    def _normalize(path):
+        """Normalise le chemin pour que './images/x.png' et 'images/x.png' partagent l'entrée"""
+        return os.path.normpath(path)
+
+    @staticmethod
+    def _surface_bytes(surface):
+        """Retourne la taille mémoire approximative d'une surface"""
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
+
+    @staticmethod
+    def _convert(surface, alpha):
+        """Convertit la surface au format de l'écran si un mode vidéo est actif"""
+        if pygame.display.get_surface() is None:
+            return surface, False
+        if alpha:
+            return surface.convert_alpha(), True
+        return surface.convert(), True
+
+    def _store(self, key, surface, converted):
+        """Ajoute une surface au cache puis applique le budget mémoire"""
+        size = self._surface_bytes(surface)
+        old = self._cache.pop(key, None)
+        if old:
+            self.used_bytes -= old[2]
+        self._cache[key] = [surface, converted, size]
+        self.used_bytes += size
+        self.loads += 1
+        self._evict(keep=key)
+
+    def _evict(self, keep=None):
+        """Retire les surfaces les moins récemment utilisées au-delà du budget"""
+        for key in list(self._cache):
+            if self.used_bytes <= self.budget_bytes:
+                break
+            if key != keep:
+                self.used_bytes -= self._cache.pop(key)[2]
+
+    def _lookup(self, key, alpha):
+        """Retourne la surface en cache (convertie si l'écran est maintenant prêt)"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        self._cache.move_to_end(key)
+        if not entry[1]:
+            surface, converted = self._convert(entry[0], alpha)
+            if converted:
+                self._store(key, surface, True)
+                return surface
+        return entry[0]
+
+    def image(self, path, size=None, alpha=True, smooth=False):
+        """
+        Retourne l'image demandée, décodée une seule fois et convertie pour le blit
+
+        Args:
+            path: Chemin de l'image
+            size: (largeur, hauteur) pour une variante redimensionnée, ou None
+            alpha: True pour convert_alpha(), False pour convert()
+            smooth: True pour utiliser smoothscale au lieu de scale
+
+        Lève pygame.error / FileNotFoundError si l'image est introuvable.
+        La surface retournée est partagée : ne pas dessiner dessus (faire une copie).
+        """
+        return self._get(path, size, alpha, smooth, convert=True)
+
+    def decode(self, path, size=None, alpha=True, smooth=False):
+        """
+        Décode (et redimensionne) l'image dans le cache, sans la convertir
+
+        Utilisable depuis un autre thread : la conversion au format de l'écran
+        est faite par le thread principal au premier image() avec les mêmes
+        arguments.
+        """
+        self._get(path, size, alpha, smooth, convert=False)
+
+    def _get(self, path, size, alpha, smooth, convert):
+        path = self._normalize(path)
+        size = tuple(int(v) for v in size) if size else None
+        key = (path, size, alpha, smooth if size else False)
+
+        with self._lock:
+            if convert:
+                surface = self._lookup(key, alpha)
+            else:
+                entry = self._cache.get(key)
+                surface = entry[0] if entry else None
+        if surface is not None:
+            return surface
+
+        # Décodage et redimensionnement hors du verrou
+        surface = self.bundle.image(key) if self.bundle is not None else None
+        if surface is not None:
+            converted = False
+            if convert:
+                surface, converted = self._convert(surface, alpha)
+        elif size is None:
+            surface, converted = pygame.image.load(path), False
+            if convert:
+                surface, converted = self._convert(surface, alpha)
+        else:
+            original = self._get(path, None, alpha, False, convert)
+            if smooth:
+                surface = pygame.transform.smoothscale(original, size)
+            else:
+                surface = pygame.transform.scale(original, size)
+            converted = convert and pygame.display.get_surface() is not None
+
+        with self._lock:
+            self._store(key, surface, converted)
+        return surface
+
+    def use_bundle(self, bundle):
+        """Sert les images (et sons) présents dans le bundle sans décoder les fichiers"""
+        with self._lock:
+            self.bundle = bundle
+
+    def sound(self, path):
+        """
+        Retourne un nouveau pygame.mixer.Sound, depuis le bundle si possible
+
+        Lève pygame.error / FileNotFoundError si le son est introuvable.
+        """
+        path = self._normalize(path)
+        self.sound_paths.add(path)
+        if self.bundle is not None:
+            sound = self.bundle.sound(path)
+            if sound is not None:
+                return sound
+        return pygame.mixer.Sound(path)
+
+    def surfaces(self):
+        """Copie du cache : {(chemin, taille, alpha, smooth): surface}"""
+        with self._lock:
+            return {key: entry[0] for key, entry in self._cache.items()}
+
+    def clear(self):
+        """Vide complètement le cache"""
+        with self._lock:
+            self._cache.clear()
+            self.used_bytes = 0
+
+
+# Instance unique partagée par tous les modules du jeu
+assets = AssetManager()
@@ -0,0 +1,220 @@
+import random
+import time
+
+import numpy as np
+import pygame
+
+
+class _Sound:
+    """Son enregistré : variantes pré-calculées et limite de voix"""
+
+    def __init__(self, variants, group, max_voices, volume, rng):
+        self.variants = variants
+        self.group = group
+        self.max_voices = max_voices
+        self.volume = volume
+        # Ordre de lecture des variantes, mélangé une fois
+        self.order = list(range(len(variants)))
+        rng.shuffle(self.order)
+        self.cursor = 0
+
+
+class AudioManager:
+    """
+    Canaux du mixer répartis en groupes réservés, avec limite de voix par son
+
+    Groupes : "ui" (menus) et "sfx" (coupes, bombes...) ont leurs propres
+    canaux, réservés pour qu'un Sound.play() direct ne les prenne jamais ; la
+    musique passe par pygame.mixer.music, un flux à part. Un canal réservé de
+    plus sert seulement à mesurer la latence. Quand un son a déjà max_voices
+    voix, ou que son groupe est plein, la voix la plus ancienne est coupée et
+    réutilisée. Aucun décodage ni allocation de surface/son à la
+    lecture : les variantes (hauteur, volume) sont calculées au chargement.
+    """
+
+    FREQUENCY = 44100
+    SIZE = -16
+    CHANNELS = 2
+
+    # Nombre de canaux par groupe, dans l'ordre des canaux du mixer
+    GROUPS = {"ui": 2, "sfx": 12}
+    FREE_CHANNELS = 2  # Non réservés, pour les Sound.play() directs
+
+    def __init__(self):
+        self.buffer = 512
+        # Période mesurée du mixer (ms), None tant que measure_latency n'a pas tourné
+        self.measured_latency = None
+
+        # Nom -> _Sound
+        self.sounds = {}
+        # Groupe -> range des indices de canaux
+        self.groups = {}
+        # Par canal : objet Channel, son joué (nom) et ordre de lancement
+        self.channels = []
+        self.owner = []
+        self.started = []
+        self.plays = 0
+        # Canal réservé à measure_latency, hors des groupes (thread de préchargement)
+        self.probe = None
+        # Générateur à part : le mélange des variantes ne touche pas au hasard du jeu
+        self.rng = random.Random()
+
+    def pre_init(self, buffer=512):
+        """À appeler avant pygame.init() : format du mixer et taille du tampon (échantillons)"""
+        self.buffer = buffer
+        pygame.mixer.pre_init(self.FREQUENCY, self.SIZE, self.CHANNELS, buffer)
+
+    def start(self):
+        """Crée les groupes de canaux (après pygame.init) ; sans mixer, play() ne fait rien"""
+        if not pygame.mixer.get_init():
+            print("⚠ Mixer indisponible: jeu sans son")
+            return
+        index = 0
+        for name, count in self.GROUPS.items():
+            self.groups[name] = range(index, index + count)
+            index += count
+        pygame.mixer.set_num_channels(index + 1 + self.FREE_CHANNELS)
+        pygame.mixer.set_reserved(index + 1)
+        self.channels = [pygame.mixer.Channel(i) for i in range(index)]
+        self.probe = pygame.mixer.Channel(index)
+        self.owner = [None] * index
+        self.started = [0] * index
+
+    @property
+    def nominal_latency(self):
+        """Durée d'un tampon du mixer (ms) selon le format demandé"""
+        frequency = pygame.mixer.get_init()[0] if pygame.mixer.get_init() else self.FREQUENCY
+        return self.buffer / frequency * 1000
+
+    def measure_latency(self, runs=5):
+        """
+        Mesure la période du mixer : temps pour qu'un son d'un tampon de silence soit consommé
+
+        Le son ne peut sortir qu'au tampon suivant : la latence de sortie est
+        d'environ deux périodes. Bloque quelques dizaines de ms (à lancer hors
+        du thread principal). Retourne la médiane en ms, ou None sans mixer.
+        """
+        if self.probe is None:
+            return None
+        mixer_channels = pygame.mixer.get_init()[2]
+        silence = pygame.sndarray.make_sound(np.zeros((self.buffer, mixer_channels), np.int16))
+        channel = self.probe
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            channel.play(silence)
+            while channel.get_busy() and time.perf_counter() - start < 0.5:
+                time.sleep(0.0005)
+            samples.append((time.perf_counter() - start) * 1000)
+        self.measured_latency = float(np.median(samples))
+        return self.measured_latency
+
+    def latency_text(self):
+        """Résumé pour l'overlay debug et le démarrage"""
+        text = f"Audio: tampon {self.buffer} ({self.nominal_latency:.1f} ms)"
+        if self.measured_latency is not None:
+            text += f" | période mesurée {self.measured_latency:.1f} ms"
+        return text
+
+    @staticmethod
+    def make_variants(sound, pitches=(1.0,), gains=(1.0,)):
+        """
+        Variantes d'un son, rééchantillonné (hauteur) et amplifié (volume) avec NumPy
+
+        Returns:
+            Liste de pygame.mixer.Sound, une par (hauteur, volume)
+        """
+        samples = pygame.sndarray.array(sound)
+        frames = samples.reshape(len(samples), -1).astype(np.float32)
+        source = np.arange(len(frames))
+        variants = []
+        for pitch in pitches:
+            # Plus aigu = lu plus vite : moins d'échantillons
+            positions = np.arange(0, len(frames) - 1, pitch)
+            resampled = np.stack([np.interp(positions, source, frames[:, c]) for c in range(frames.shape[1])], axis=1)
+            for gain in gains:
+                data = np.clip(resampled * gain, -32768, 32767).astype(samples.dtype)
+                variants.append(pygame.sndarray.make_sound(np.ascontiguousarray(data.reshape((-1,) + samples.shape[1:]))))
+        return variants
+
+    def register(self, name, sound, group="sfx", max_voices=4, volume=1.0, pitches=(1.0,), gains=(1.0,)):
+        """
+        Enregistre un son sous un nom, avec ses variantes
+
+        Args:
+            sound: pygame.mixer.Sound d'origine
+            group: Groupe de canaux ("ui" ou "sfx")
+            max_voices: Voix simultanées au plus pour ce son (la plus ancienne est volée)
+            volume: Volume (0.0 à 1.0) appliqué à toutes les variantes
+            pitches, gains: Variantes pré-calculées, jouées à tour de rôle
+        """
+        variants = [sound]
+        if len(pitches) > 1 or len(gains) > 1:
+            try:
+                variants = self.make_variants(sound, pitches, gains)
+            except Exception as e:
+                print(f"⚠ Variantes de {name} impossibles: {e}")
+        for variant in variants:
+            variant.set_volume(volume)
+        self.sounds[name] = _Sound(variants, group, max_voices, volume, self.rng)
+
+    def set_volume(self, name, volume):
+        """Change le volume de toutes les variantes d'un son"""
+        entry = self.sounds.get(name)
+        if entry is None:
+            return
+        entry.volume = volume
+        for variant in entry.variants:
+            variant.set_volume(volume)
+
+    def voices(self, name):
+        """Nombre de voix du son en cours de lecture"""
+        return sum(1 for i, channel in enumerate(self.channels)
+                   if self.owner[i] == name and channel.get_busy())
+
+    def play(self, name):
+        """
+        Joue une variante du son dans son groupe
+
+        Returns:
+            L'indice du canal utilisé, ou None (son inconnu, pas de mixer)
+        """
+        entry = self.sounds.get(name)
+        if entry is None or not self.channels:
+            return None
+
+        # Un seul passage sur les canaux du groupe : canal libre, voix du son, plus ancienne voix
+        free = None
+        voices = 0
+        oldest_own = oldest = None
+        for i in self.groups[entry.group]:
+            if not self.channels[i].get_busy():
+                if free is None:
+                    free = i
+                continue
+            if oldest is None or self.started[i] < self.started[oldest]:
+                oldest = i
+            if self.owner[i] == name:
+                voices += 1
+                if oldest_own is None or self.started[i] < self.started[oldest_own]:
+                    oldest_own = i
+
+        if voices >= entry.max_voices:
+            target = oldest_own
+        elif free is not None:
+            target = free
+        else:
+            target = oldest
+
+        variant = entry.variants[entry.order[entry.cursor]]
+        entry.cursor = (entry.cursor + 1) % len(entry.order)
+
+        self.plays += 1
+        self.channels[target].play(variant)  # Coupe la voix précédente du canal
+        self.owner[target] = name
+        self.started[target] = self.plays
+        return target
+
+
+# Instance unique partagée par le jeu et les menus
+audio = AudioManager()
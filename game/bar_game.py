@@ -1,5 +1,9 @@
 import pygame
+import math
+import time
 from datetime import datetime
+from assets import assets
+from fonts import fonts
 
 
 class TopBar:
@@ -28,11 +32,11 @@ class TopBar:
         
         # Polices - Chronomètre plus petit
         try:
-            self.font_large = pygame.font.Font('./images/comic.ttf', 36)  # Réduit de 48 à 36
-            self.font_small = pygame.font.Font('./images/comic.ttf', 24)
+            self.font_large = fonts.font('./images/comic.ttf', 36)  # Réduit de 48 à 36
+            self.font_small = fonts.font('./images/comic.ttf', 24)
         except:
-            self.font_large = pygame.font.Font(None, 36)
-            self.font_small = pygame.font.Font(None, 24)
+            self.font_large = fonts.font(None, 36)
+            self.font_small = fonts.font(None, 24)
         
         # Bouton de mode de jeu - Déplacé à droite
         self.button_width = 60
@@ -46,19 +50,57 @@ class TopBar:
         self.button_pressed = False
         
         # Image du bouton
+        self.button_image_path = button_image_path
         self.button_image = None
         if button_image_path:
             try:
-                self.button_image = pygame.image.load(button_image_path)
-                self.button_image = pygame.transform.scale(self.button_image, (self.button_width - 10, self.button_height - 10))
+                self.button_image = assets.image(button_image_path, (self.button_width - 10, self.button_height - 10))
             except Exception as e:
                 print(f"Erreur: Impossible de charger l'image {button_image_path}: {e}")
                 self.button_image = None
         
+        # Les trois tailles du bouton (normal, survolé, pressé), redimensionnées une seule fois
+        self.button_images = {}
+        if self.button_image:
+            base_size = self.button_width - 10
+            for scale_factor in (1.0, 1.3, 0.9):
+                size = (int(base_size * scale_factor), int(base_size * scale_factor))
+                if scale_factor == 1.0:
+                    image = self.button_image
+                else:
+                    # Partir de l'image originale pour éviter la dégradation
+                    try:
+                        image = assets.image(self.button_image_path, size, smooth=True)
+                    except:
+                        image = pygame.transform.smoothscale(self.button_image, size)
+                self.button_images[scale_factor] = image
+        
+        # Couche statique de la barre (dégradé, date, chronomètre, bouton),
+        # recomposée seulement quand l'un de ces éléments change
+        self.background = None
+        self.layer = None
+        self.layer_state = None
+        self.timer_bg = None
+        self.drawn_progress = None  # Barre de progression à l'écran (draw_dirty)
+        self.date_text = None
+        self.date_minute = None
+        
         # Mode de jeu
         self.game_mode = "jeu1"  # Modes: "jeu1", "jeu2"
         self.available_modes = ["jeu1", "jeu2"]
     
+    @staticmethod
+    def preload(button_image_path='./images/chococo.png', button_size=60):
+        """Décode les trois tailles du bouton dans le cache partagé (thread de préchargement)"""
+        base_size = button_size - 10
+        try:
+            assets.decode(button_image_path, (base_size, base_size))
+            for scale_factor in (1.3, 0.9):
+                size = (int(base_size * scale_factor), int(base_size * scale_factor))
+                assets.decode(button_image_path, size, smooth=True)
+        except:
+            pass  # Image absente : la barre s'affichera sans bouton
+
     def get_current_date(self):
         """Retourne la date actuelle en français"""
         months = {
@@ -79,18 +121,33 @@ class TopBar:
     
     def format_time(self):
         """Formate le temps restant en MM:SS"""
-        mins = int(self.time_left // 60)
-        secs = int(self.time_left % 60)
+        # Arrondi à la seconde supérieure : 1:30 s'affiche pendant la première seconde
+        remaining = math.ceil(self.time_left)
+        mins = remaining // 60
+        secs = remaining % 60
         return f"{mins}:{secs:02d}"
     
+    def current_date(self):
+        """Date affichée, recalculée seulement quand la minute change"""
+        minute = int(time.time() // 60)
+        if minute != self.date_minute:
+            self.date_minute = minute
+            self.date_text = self.get_current_date()
+        return self.date_text
+    
     def draw_gradient(self, surface):
-        """Dessine le dégradé de fond (gris vers bleu)"""
-        for i in range(self.height):
-            ratio = i / self.height
-            r = int(self.color1[0] * (1 - ratio) + self.color2[0] * ratio)
-            g = int(self.color1[1] * (1 - ratio) + self.color2[1] * ratio)
-            b = int(self.color1[2] * (1 - ratio) + self.color2[2] * ratio)
-            pygame.draw.line(surface, (r, g, b), (0, i), (self.width, i))
+        """Dessine le dégradé de fond (gris vers bleu), calculé une seule fois"""
+        if self.background is None:
+            self.background = pygame.Surface((self.width, self.height))
+            for i in range(self.height):
+                ratio = i / self.height
+                r = int(self.color1[0] * (1 - ratio) + self.color2[0] * ratio)
+                g = int(self.color1[1] * (1 - ratio) + self.color2[1] * ratio)
+                b = int(self.color1[2] * (1 - ratio) + self.color2[2] * ratio)
+                pygame.draw.line(self.background, (r, g, b), (0, i), (self.width, i))
+            if pygame.display.get_surface():
+                self.background = self.background.convert()
+        surface.blit(self.background, (0, 0))
     
     def handle_event(self, event):
         """Gère les événements de la souris pour le bouton"""
@@ -124,36 +181,22 @@ class TopBar:
         
         print(f"Mode de jeu changé: {self.game_mode}")
     
+    def button_scale(self):
+        """Facteur d'échelle du bouton selon son état"""
+        if self.button_pressed:
+            # Image légèrement plus petite quand pressée
+            return 0.9
+        if self.button_hovered:
+            # Image plus grande au survol
+            return 1.3
+        # Taille normale
+        return 1.0
+    
     def draw_button(self, surface):
         """Dessine le bouton de mode de jeu - Seulement l'image avec effet de survol"""
-        # Image du bouton avec effet hover
+        # Image du bouton avec effet hover (tailles pré-calculées)
         if self.button_image:
-            # Calculer la taille selon l'état
-            if self.button_pressed:
-                # Image légèrement plus petite quand pressée
-                scale_factor = 0.9
-            elif self.button_hovered:
-                # Image plus grande au survol
-                scale_factor = 1.3
-            else:
-                # Taille normale
-                scale_factor = 1.0
-            
-            # Calculer la nouvelle taille
-            base_size = self.button_width - 10
-            new_width = int(base_size * scale_factor)
-            new_height = int(base_size * scale_factor)
-            
-            # Redimensionner l'image depuis l'image originale chargée
-            if scale_factor != 1.0:
-                # Recharger l'image originale pour éviter la dégradation
-                try:
-                    original_image = pygame.image.load('./images/chococo.png')
-                    scaled_image = pygame.transform.smoothscale(original_image, (new_width, new_height))
-                except:
-                    scaled_image = pygame.transform.smoothscale(self.button_image, (new_width, new_height))
-            else:
-                scaled_image = self.button_image
+            scaled_image = self.button_images[self.button_scale()]
             
             # Centrer l'image
             image_x = self.button_x + (self.button_width - scaled_image.get_width()) // 2
@@ -197,57 +240,98 @@ class TopBar:
             else:
                 pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
         
-        # Mise à jour du chronomètre
+        # Mise à jour du chronomètre (temps réel écoulé, en secondes)
         if self.timer_running and self.time_left > 0:
             current_tick = pygame.time.get_ticks()
-            if current_tick - self.last_tick >= 1000:
-                self.time_left -= 1
-                self.last_tick = current_tick
+            self.time_left -= (current_tick - self.last_tick) / 1000
+            self.last_tick = current_tick
             
             if self.time_left <= 0:
                 self.time_left = 0
                 self.timer_running = False
     
-    def draw(self, surface):
-        """Dessine la barre complète avec dégradé, date, chronomètre, bouton et barre de progression"""
+    def compose_layer(self, date, time_string, time_color):
+        """Recompose la couche statique : dégradé, date, bouton et chronomètre"""
+        if self.layer is None:
+            self.layer = pygame.Surface((self.width, self.height))
+            if pygame.display.get_surface():
+                self.layer = self.layer.convert()
+        layer = self.layer
+        
         # Dégradé de fond
-        self.draw_gradient(surface)
+        self.draw_gradient(layer)
         
         # Date à gauche
-        date_text = self.font_small.render(self.get_current_date(), True, self.white)
-        surface.blit(date_text, (20, 20))
+        layer.blit(fonts.render(self.font_small, date, self.white), (20, 20))
         
         # Bouton de mode (à droite)
-        self.draw_button(surface)
+        self.draw_button(layer)
         
         # Chronomètre au centre avec fond semi-transparent
-        time_color = self.red if self.time_left <= 10 else self.white
-        time_text = self.font_large.render(self.format_time(), True, time_color)
+        time_text = fonts.render(self.font_large, time_string, time_color)
         time_rect = time_text.get_rect(center=(self.width // 2, self.height // 2 - 10))  # Centré au milieu
         
         # Fond du chronomètre
         timer_bg = pygame.Rect(time_rect.x - 15, time_rect.y - 8, 
                                time_rect.width + 30, time_rect.height + 16)
-        # Créer une surface semi-transparente
-        bg_surface = pygame.Surface((timer_bg.width, timer_bg.height), pygame.SRCALPHA)
-        bg_surface.fill((255, 255, 255, 80))
-        surface.blit(bg_surface, (timer_bg.x, timer_bg.y))
-        pygame.draw.rect(surface, self.white, timer_bg, 2, border_radius=10)
+        # Surface semi-transparente, réutilisée tant que la taille du texte ne change pas
+        if self.timer_bg is None or self.timer_bg.get_size() != timer_bg.size:
+            self.timer_bg = pygame.Surface(timer_bg.size, pygame.SRCALPHA)
+            self.timer_bg.fill((255, 255, 255, 80))
+        layer.blit(self.timer_bg, (timer_bg.x, timer_bg.y))
+        pygame.draw.rect(layer, self.white, timer_bg, 2, border_radius=10)
         
-        surface.blit(time_text, time_rect)
+        layer.blit(time_text, time_rect)
+    
+    def draw(self, surface):
+        """Dessine la barre complète avec dégradé, date, chronomètre, bouton et barre de progression"""
+        # Couche statique recomposée seulement quand la date (minute), le chronomètre
+        # (seconde) ou l'état du bouton change
+        time_color = self.red if self.time_left <= 10 else self.white
+        state = (self.current_date(), self.format_time(), time_color, self.button_scale())
+        if state != self.layer_state:
+            self.compose_layer(*state[:3])
+            self.layer_state = state
+        surface.blit(self.layer, (0, 0))
         
-        # Barre de progression en bas
-        bar_width = self.width - 40
-        bar_height = 12
-        bar_x = 20
-        bar_y = self.height - 18
+        # Entre deux changements, seule la barre de progression est redessinée
+        self.draw_progress(surface)
+    
+    def invalidate(self):
+        """Force un rendu complet de la barre au prochain draw_dirty"""
+        self.drawn_progress = None
+    
+    def draw_dirty(self, surface):
+        """
+        Comme draw, mais ne redessine que ce qui a changé
+
+        Returns:
+            Liste des rectangles modifiés, à passer à pygame.display.update
+        """
+        time_color = self.red if self.time_left <= 10 else self.white
+        state = (self.current_date(), self.format_time(), time_color, self.button_scale())
+        if state != self.layer_state or self.drawn_progress is None:
+            self.draw(surface)
+            return [pygame.Rect(0, 0, self.width, self.height)]
         
-        # Fond de la barre
-        pygame.draw.rect(surface, self.bar_bg_color, (bar_x, bar_y, bar_width, bar_height), border_radius=6)
+        if self.progress_state() == self.drawn_progress:
+            return []
         
+        # Restaurer la couche statique sous la barre, puis la redessiner
+        rect = self.progress_rect()
+        surface.blit(self.layer, rect, rect)
+        self.draw_progress(surface)
+        return [rect]
+    
+    def progress_rect(self):
+        """Zone de la barre de progression"""
+        return pygame.Rect(20, self.height - 18, self.width - 40, 12)
+    
+    def progress_state(self):
+        """(largeur remplie, couleur) de la barre de progression"""
         # Barre de progression (qui descend avec le temps)
         progress = self.time_left / self.total_time
-        progress_width = int(bar_width * progress)
+        progress_width = int((self.width - 40) * progress)
         
         # Changer la couleur selon le temps restant
         if self.time_left <= 10:
@@ -256,9 +340,20 @@ class TopBar:
             bar_color = self.bar_color_orange
         else:
             bar_color = self.bar_color_green
+        return progress_width, bar_color
+    
+    def draw_progress(self, surface):
+        """Barre de progression en bas"""
+        bar_rect = self.progress_rect()
+        
+        # Fond de la barre
+        pygame.draw.rect(surface, self.bar_bg_color, bar_rect, border_radius=6)
         
+        progress_width, bar_color = self.progress_state()
         if progress_width > 0:
-            pygame.draw.rect(surface, bar_color, (bar_x, bar_y, progress_width, bar_height), border_radius=6)
+            pygame.draw.rect(surface, bar_color, (bar_rect.x, bar_rect.y, progress_width, bar_rect.height),
+                             border_radius=6)
+        self.drawn_progress = (progress_width, bar_color)
     
     def is_finished(self):
         """Retourne True si le temps est écoulé"""
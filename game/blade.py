@@ -0,0 +1,66 @@
+import numpy as np
+import pygame
+
+
+class Blade:
+    """Trajectoire de la lame (souris) entre deux pas de jeu"""
+
+    def __init__(self):
+        # Positions reçues depuis le dernier pas : ((x, y), bouton gauche enfoncé)
+        self.samples = []
+        # Dernier point du pas précédent, pour relier les trajectoires
+        self.last_sample = None
+
+    def reset(self):
+        """Oublie la trajectoire en cours"""
+        self.samples = []
+        self.last_sample = None
+
+    def add(self, position, pressed):
+        """Ajoute un point à la trajectoire du pas en cours"""
+        self.samples.append((position, pressed))
+
+    def handle_event(self, event):
+        """
+        Enregistre chaque position de souris reçue entre deux pas
+
+        Returns:
+            Le point ajouté ((x, y), bouton enfoncé), ou None
+        """
+        if event.type == pygame.MOUSEMOTION:
+            sample = (event.pos, bool(event.buttons[0]))
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            sample = (event.pos, True)
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            sample = (event.pos, False)
+        else:
+            return None
+        self.samples.append(sample)
+        return sample
+
+    def segments(self, position, pressed):
+        """
+        Retourne les segments coupants parcourus depuis le dernier pas
+
+        Args:
+            position: Position actuelle de la souris
+            pressed: True si le bouton gauche est enfoncé
+
+        Returns:
+            Tableau (n, 4) de segments (x0, y0, x1, y1). Un clic sans
+            mouvement donne un segment de longueur nulle.
+        """
+        samples = self.samples
+        samples.append((tuple(position), bool(pressed)))
+
+        previous = self.last_sample
+        segments = []
+        for point, down in samples:
+            if down:
+                start = previous[0] if previous and previous[1] else point
+                segments.append((start[0], start[1], point[0], point[1]))
+            previous = (point, down)
+
+        self.last_sample = previous
+        self.samples = []
+        return np.array(segments, dtype=np.float64).reshape(-1, 4)
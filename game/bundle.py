@@ -0,0 +1,214 @@
+"""
+Bundle d'images et de sons pré-décodés (assets.bundle)
+
+Les images utilisées par le jeu y sont stockées déjà redimensionnées, en
+pixels bruts, et les sons en échantillons au format du mixer. Au lancement,
+le fichier est projeté en mémoire (mmap) et les surfaces sont créées
+directement sur ses octets : aucun décodage JPEG/PNG/MP3.
+
+Construction (depuis la racine du dépôt, à refaire quand images/ ou musique/ change) :
+
+    python game/bundle.py
+
+Format : en-tête BUNDLE_HEADER (magic, position et taille de l'index), blocs de
+données alignés sur BLOCK_ALIGN, puis l'index en JSON. L'index garde la taille
+et la date de modification de chaque fichier source : une entrée dont la
+source a changé depuis la construction est ignorée (lue depuis le fichier).
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+
+import pygame
+
+# À la racine du dépôt, comme images/ et musique/, quel que soit le dossier de lancement
+BUNDLE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets.bundle")
+BUNDLE_MAGIC = b"FFBNDL2\n"
+BUNDLE_HEADER = struct.Struct("<8sQQ")
+BLOCK_ALIGN = 64
+
+
+class AssetBundle:
+    """Lecture d'un bundle projeté en mémoire"""
+
+    def __init__(self, path, data, images, sounds):
+        self.path = path
+        self._data = data
+        # (chemin, taille, alpha, smooth) -> (largeur, hauteur, format, position, longueur)
+        self.images = images
+        # chemin -> (fréquence, format, canaux, position, longueur)
+        self.sounds = sounds
+
+    @classmethod
+    def open(cls, path=BUNDLE_PATH):
+        """
+        Projette le bundle en mémoire
+
+        Returns:
+            AssetBundle, ou None si le fichier est absent ou invalide
+        """
+        try:
+            with open(path, "rb") as f:
+                # Copie à l'écriture : une surface modifiée par erreur ne touche pas le fichier
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            magic, index_offset, index_size = BUNDLE_HEADER.unpack_from(data, 0)
+            if magic != BUNDLE_MAGIC:
+                raise ValueError("en-tête inconnu")
+            index = json.loads(bytes(data[index_offset:index_offset + index_size]))
+        except (struct.error, ValueError) as e:
+            print(f"⚠ Bundle {path} ignoré: {e}")
+            data.close()
+            return None
+
+        # Sources modifiées ou supprimées depuis la construction : leurs entrées sont périmées
+        stale = {source for source, stamp in index["sources"].items() if _stamp(source) != stamp}
+        if stale:
+            print(f"⚠ Bundle {path}: {len(stale)} source(s) modifiée(s), relue(s) depuis les fichiers")
+
+        images = {}
+        for image_path, size, alpha, smooth, width, height, fmt, offset, length in index["images"]:
+            if image_path in stale:
+                continue
+            key = (image_path, tuple(size) if size else None, alpha, smooth)
+            images[key] = (width, height, fmt, offset, length)
+        sounds = {sound_path: tuple(entry) for sound_path, *entry in index["sounds"] if sound_path not in stale}
+        return cls(path, data, images, sounds)
+
+    def image(self, key):
+        """Surface de l'image (sur les octets du bundle, sans copie), ou None si absente"""
+        entry = self.images.get(key)
+        if entry is None:
+            return None
+        width, height, fmt, offset, length = entry
+        return pygame.image.frombuffer(memoryview(self._data)[offset:offset + length], (width, height), fmt)
+
+    def sound(self, path):
+        """Son pré-décodé, ou None s'il est absent ou si le mixer a un autre format"""
+        entry = self.sounds.get(path)
+        if entry is None:
+            return None
+        frequency, size, channels, offset, length = entry
+        if pygame.mixer.get_init() != (frequency, size, channels):
+            return None
+        return pygame.mixer.Sound(buffer=memoryview(self._data)[offset:offset + length])
+
+
+def _stamp(path):
+    """[taille, date de modification en ns] du fichier source, ou None s'il est absent"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _pixels(surface):
+    """Octets bruts et format d'une surface non convertie"""
+    if surface.get_flags() & pygame.SRCALPHA:
+        return pygame.image.tobytes(surface, "RGBA"), "RGBA"
+    if surface.get_colorkey() is not None:
+        # Couleur transparente : la transparence passe dans le canal alpha
+        rgba = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        rgba.blit(surface, (0, 0))
+        return pygame.image.tobytes(rgba, "RGBA"), "RGBA"
+    return pygame.image.tobytes(surface, "RGB"), "RGB"
+
+
+def write_bundle(path, images, sounds, mixer_format):
+    """
+    Écrit un bundle
+
+    Args:
+        images: {(chemin, taille, alpha, smooth): surface non convertie}
+        sounds: {chemin: échantillons bruts au format mixer_format}
+        mixer_format: (fréquence, format, canaux) du mixer des échantillons
+    """
+    index = {"images": [], "sounds": [], "sources": {}}
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(bytes(BUNDLE_HEADER.size))
+
+        def write_block(data):
+            offset = f.tell()
+            padding = -offset % BLOCK_ALIGN
+            f.write(bytes(padding))
+            f.write(data)
+            return offset + padding, len(data)
+
+        for (image_path, size, alpha, smooth), surface in images.items():
+            data, fmt = _pixels(surface)
+            offset, length = write_block(data)
+            width, height = surface.get_size()
+            index["images"].append([image_path, size, alpha, smooth, width, height, fmt, offset, length])
+            index["sources"][image_path] = _stamp(image_path)
+
+        for sound_path, data in sounds.items():
+            offset, length = write_block(data)
+            index["sounds"].append([sound_path, *mixer_format, offset, length])
+            index["sources"][sound_path] = _stamp(sound_path)
+
+        index_data = json.dumps(index, separators=(",", ":")).encode("utf-8")
+        index_offset = f.tell()
+        f.write(index_data)
+        f.seek(0)
+        f.write(BUNDLE_HEADER.pack(BUNDLE_MAGIC, index_offset, len(index_data)))
+    os.replace(tmp_path, path)
+
+
+def build(path=BUNDLE_PATH):
+    """
+    Construit le bundle avec les images et sons que le jeu demande réellement
+
+    Les écrans sont construits sans fenêtre (les surfaces restent au format
+    de leur fichier) et une partie de chaque mode est préparée ; tout ce qui
+    est passé par le cache d'images ou par assets.sound est enregistré.
+    """
+    from assets import assets
+    from audio import audio
+    from settings import Setting
+    from main_itrfc import MainMenu
+    from settings_menu import SettingsMenu
+    from bar_game import TopBar
+    from game import Game
+
+    settings = Setting(load_sounds=False)
+    audio.pre_init(settings.audio_buffer)
+    pygame.init()
+    settings.load_impact_sound()
+    width, height = settings.screen_width, settings.screen_height
+    bar_height = 80
+    MainMenu(width, height)
+    SettingsMenu(width, height, settings=settings)
+    TopBar(width, height=bar_height)
+    TopBar.preload()
+    Game.preload(width, height - bar_height, (width, height))
+    game = Game(width, height - bar_height, settings=settings, save_scores=False)
+    game.set_game_mode("jeu2")
+
+    # Les originaux qui n'ont servi qu'à produire une variante redimensionnée restent dehors
+    cached = assets.surfaces()
+    resized = {image_path for image_path, size, alpha, smooth in cached if size}
+    images = {key: surface for key, surface in cached.items()
+              if key[1] or key[0] not in resized}
+    sounds = {}
+    if pygame.mixer.get_init():
+        for sound_path in sorted(assets.sound_paths):
+            try:
+                sounds[sound_path] = pygame.mixer.Sound(sound_path).get_raw()
+            except pygame.error as e:
+                print(f"⚠ Son {sound_path} ignoré: {e}")
+
+    write_bundle(path, images, sounds, pygame.mixer.get_init())
+    total = os.path.getsize(path)
+    print(f"✓ Bundle écrit: {path} ({len(images)} images, {len(sounds)} sons, {total / 1e6:.1f} Mo)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    build(sys.argv[1] if len(sys.argv) > 1 else BUNDLE_PATH)
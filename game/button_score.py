@@ -1,27 +1,31 @@
 import pygame
+from fonts import fonts
+from widget import Widget
 
 
-class Button:
+class Button(Widget):
     """Classe de bouton simple pour le scoreboard"""
     def __init__(self, x, y, width, height, text, color):
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__((x, y, width, height))
         self.text = text
         self.color = color
         self.hover_color = tuple(min(c + 30, 255) for c in color)
-        self.is_hovered = False
+        
+    @property
+    def is_hovered(self):
+        return self.hovered
         
     def check_hover(self, pos):
-        self.is_hovered = self.rect.collidepoint(pos)
+        self.hovered = self.rect.collidepoint(pos)
         
     def for_clic(self, pos):
         return self.rect.collidepoint(pos)
         
-    def draw(self, screen):
-        color = self.hover_color if self.is_hovered else self.color
-        pygame.draw.rect(screen, color, self.rect, border_radius=10)
-        pygame.draw.rect(screen, (255, 255, 255), self.rect, 2, border_radius=10)
+    def content_key(self):
+        return self.text
         
-        font = pygame.font.Font(None, 32)
-        text_surf = font.render(self.text, True, (255, 255, 255))
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
+    def render(self, state):
+        color = self.color if state == "normal" else self.hover_color
+        font = fonts.font(None, 32)
+        text_surf = fonts.render(font, self.text, (255, 255, 255))
+        return self.render_box(color, (255, 255, 255), 2, 10, text_surf)
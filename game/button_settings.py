@@ -1,18 +1,19 @@
 import pygame
 from pygame.locals import MOUSEBUTTONDOWN, MOUSEMOTION
+from fonts import fonts
+from widget import Widget
 
 
-class Button:
+class Button(Widget):
     """Bouton cliquable."""
     
     def __init__(self, x, y, width, height, text, font, color, hover_color, text_color):
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__((x, y, width, height))
         self.text = text
         self.font = font
         self.color = color
         self.hover_color = hover_color
         self.text_color = text_color
-        self.hovered = False
     
     def handle_event(self, event):
         """Gère les événements de la souris."""
@@ -23,12 +24,11 @@ class Button:
                 return True
         return False
     
-    def draw(self, screen):
-        """Dessine le bouton."""
-        color = self.hover_color if self.hovered else self.color
-        pygame.draw.rect(screen, color, self.rect, border_radius=10)
-        pygame.draw.rect(screen, (0, 0, 0), self.rect, 2, border_radius=10)
-        
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
\ No newline at end of file
+    def content_key(self):
+        return self.text
+    
+    def render(self, state):
+        """Rend le bouton dans l'état donné."""
+        color = self.color if state == "normal" else self.hover_color
+        text_surface = fonts.render(self.font, self.text, self.text_color)
+        return self.render_box(color, (0, 0, 0), 2, 10, text_surface)
@@ -0,0 +1,283 @@
+import numpy as np
+
+
+# Types d'éléments (masque de bits)
+KIND_FRUIT = 1
+KIND_BOMB = 2
+KIND_ICE = 4
+KIND_LETTER = 8
+
+
+def kind_of(key):
+    """Retourne le type d'un élément à partir de sa clé ('melon', 'bomb', 'melon_A'...)"""
+    if key == 'bomb':
+        return KIND_BOMB
+    if key == 'ice_cube2':
+        return KIND_ICE
+    if key.startswith('letter_'):
+        return KIND_LETTER
+    return KIND_FRUIT
+
+
+class EntityView:
+    """Vue d'un emplacement du store, utilisable comme l'ancien dictionnaire d'item"""
+
+    __slots__ = ('store', 'index')
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    def __getitem__(self, name):
+        return self.store.get_field(self.index, name)
+
+    def __setitem__(self, name, value):
+        self.store.set_field(self.index, name, value)
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+
+class EntityStore:
+    """
+    Réserve d'éléments à emplacements fixes, en tableaux NumPy (structure de tableaux)
+
+    Les positions et vitesses sont dans des tableaux float, les états
+    throw/hit dans des tableaux booléens et le type dans un masque de bits.
+    Un emplacement est occupé tant que son élément est en l'air (throw) :
+    plusieurs éléments du même type ('melon'...) peuvent être lancés à la
+    fois. Les tableaux sont alloués une fois : spawn() ne fait que remplir le
+    premier emplacement libre, et échoue quand la réserve est pleine.
+    """
+
+    # Champs numériques stockés dans des tableaux
+    FLOAT_FIELDS = ('x', 'y', 'prev_x', 'prev_y', 'speed_x', 'speed_y', 'size')
+    BOOL_FIELDS = ('throw', 'hit', 'is_letter')
+    # Champs Python stockés dans des listes
+    OBJECT_FIELDS = ('img', 'assigned_letter', 'name')
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        # Emplacements utilisés au moins une fois : les calculs s'arrêtent là
+        self.count = 0
+
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        for name in self.BOOL_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=bool))
+        self.kind = np.zeros(capacity, dtype=np.uint8)
+        for name in self.OBJECT_FIELDS:
+            setattr(self, name, [None] * capacity)
+        # Type de l'élément de chaque emplacement ('melon', 'bomb', 'melon_A'...)
+        self.keys = [None] * capacity
+        # Type -> nombre d'éléments de ce type en l'air
+        self.live = {}
+        # Lettre -> emplacements en l'air, non touchés, portant cette lettre
+        # (dictionnaire utilisé comme ensemble ordonné : du plus ancien au plus récent)
+        self.by_letter = {}
+
+    def __len__(self):
+        """Nombre d'éléments en l'air (et non d'emplacements utilisés, voir count)"""
+        return self.active_count()
+
+    def view(self, index):
+        return EntityView(self, index)
+
+    def get_field(self, index, name):
+        if name in self.FLOAT_FIELDS:
+            return float(getattr(self, name)[index])
+        if name in self.BOOL_FIELDS:
+            return bool(getattr(self, name)[index])
+        if name in self.OBJECT_FIELDS:
+            return getattr(self, name)[index]
+        if name == 'kind':
+            return int(self.kind[index])
+        raise KeyError(name)
+
+    def set_field(self, index, name, value):
+        if name not in self.FLOAT_FIELDS + self.BOOL_FIELDS + self.OBJECT_FIELDS + ('kind',):
+            raise KeyError(name)
+        released = name == 'throw' and self.throw[index] and not value
+        getattr(self, name)[index] = value
+        if name == 'hit' and value:
+            self._unindex_letter(index)
+        elif released:
+            # Emplacement libéré à la main : mêmes comptes que pour un élément raté
+            self.live[self.keys[index]] -= 1
+            self._unindex_letter(index)
+
+    def _unindex_letter(self, index):
+        """Retire un emplacement touché, retombé ou libéré de l'index des lettres"""
+        letter = self.assigned_letter[index]
+        if letter is not None:
+            self.by_letter.get(letter, {}).pop(index, None)
+
+    def find_letter(self, letter, policy="lowest"):
+        """
+        Emplacement à couper pour une lettre tapée
+
+        Args:
+            policy: Choix entre plusieurs éléments portant la lettre :
+                    "lowest" (le plus bas à l'écran) ou "oldest" (le plus ancien lancé)
+
+        Returns:
+            Index de l'emplacement, ou None si aucun élément en l'air ne porte la lettre
+        """
+        slots = self.by_letter.get(letter)
+        if not slots:
+            return None
+        if policy == "lowest" and len(slots) > 1:
+            return max(slots, key=self.y.__getitem__)
+        return next(iter(slots))
+
+    def clear(self):
+        """Libère tous les emplacements"""
+        self.count = 0
+        for name in self.FLOAT_FIELDS + self.BOOL_FIELDS + ('kind',):
+            getattr(self, name)[:] = 0
+        for name in self.OBJECT_FIELDS + ('keys',):
+            values = getattr(self, name)
+            values[:] = [None] * len(values)
+        self.live.clear()
+        self.by_letter.clear()
+
+    def spawn(self, key, img, x, y, speed_x, speed_y, size, assigned_letter=None, is_letter=False, name=None):
+        """
+        Lance un élément key dans le premier emplacement libre
+
+        Args:
+            name: Nom de base de l'élément ('melon' pour 'melon_A'), par défaut key
+
+        Returns:
+            Index de l'emplacement, ou None si la réserve est pleine
+        """
+        index = int(np.argmin(self.throw))
+        if self.throw[index]:
+            return None
+        self.count = max(self.count, index + 1)
+
+        self.keys[index] = key
+        self.live[key] = self.live.get(key, 0) + 1
+        self.kind[index] = kind_of(key)
+        self.img[index] = img
+        self.assigned_letter[index] = assigned_letter
+        if assigned_letter is not None:
+            self.by_letter.setdefault(assigned_letter, {})[index] = None
+        self.name[index] = name or key
+        self.is_letter[index] = is_letter
+        # Pas d'interpolation depuis l'ancienne position
+        self.x[index] = self.prev_x[index] = x
+        self.y[index] = self.prev_y[index] = y
+        self.speed_x[index] = speed_x
+        self.speed_y[index] = speed_y
+        self.size[index] = size
+        self.hit[index] = False
+        self.throw[index] = True
+        return index
+
+    # === OPÉRATIONS VECTORISÉES ===
+
+    def snapshot(self):
+        """Mémorise les positions actuelles avant un pas de simulation"""
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def interpolated(self, indices, alpha):
+        """Positions affichées entre le pas précédent (0) et le pas actuel (1)"""
+        x = self.prev_x[indices] + (self.x[indices] - self.prev_x[indices]) * alpha
+        y = self.prev_y[indices] + (self.y[indices] - self.prev_y[indices]) * alpha
+        return x, y
+
+    def active_count(self):
+        return int(np.count_nonzero(self.throw[:self.count]))
+
+    def integrate(self, speed_factor, gravity, max_speed_y, width, height):
+        """
+        Applique la physique à tous les éléments en l'air
+
+        Returns:
+            Index des éléments sortis par le bas pendant ce pas
+        """
+        n = self.count
+        active = self.throw[:n]
+        x, y = self.x[:n], self.y[:n]
+        speed_x, speed_y = self.speed_x[:n], self.speed_y[:n]
+
+        # Déplacement puis gravité (avec vitesse de chute maximale)
+        x += np.where(active, speed_x * speed_factor, 0.0)
+        y += np.where(active, speed_y * speed_factor, 0.0)
+        speed_y += np.where(active, gravity, 0.0)
+        np.minimum(speed_y, max_speed_y, out=speed_y, where=active)
+
+        # Rebond sur les côtés de l'écran
+        left = active & (x < 0)
+        x[left] = 0
+        speed_x[left] = np.abs(speed_x[left])
+
+        right_limit = width - self.size[:n]
+        right = active & ~left & (x > right_limit)
+        x[right] = right_limit[right]
+        speed_x[right] = -np.abs(speed_x[right])
+
+        # Éléments ratés : leur emplacement est libéré
+        missed = np.flatnonzero(active & (y > height))
+        self.throw[missed] = False
+        for index in missed:
+            self.live[self.keys[index]] -= 1
+            self._unindex_letter(index)
+        return missed
+
+    def sweep_test(self, segments):
+        """
+        Index des éléments en l'air, non touchés, traversés par au moins un segment
+
+        Args:
+            segments: Tableau (n, 4) de segments (x0, y0, x1, y1) en coordonnées de jeu
+        """
+        n = self.count
+        candidates = self.throw[:n] & ~self.hit[:n]
+        if not len(segments) or not candidates.any():
+            return np.empty(0, dtype=np.intp)
+
+        # Boîte balayée pendant le pas (de prev à la position actuelle) : l'élément
+        # est affiché interpolé entre les deux, jusqu'à un pas en retard
+        x, y, prev_x, prev_y = self.x[:n], self.y[:n], self.prev_x[:n], self.prev_y[:n]
+        size = self.size[:n]
+        left, top = np.minimum(x, prev_x), np.minimum(y, prev_y)
+        right, bottom = np.maximum(x, prev_x) + size, np.maximum(y, prev_y) + size
+
+        # Phase large : rejeter les éléments hors de la boîte englobante de la trajectoire
+        xs, ys = segments[:, 0::2], segments[:, 1::2]
+        candidates &= (right >= xs.min()) & (left <= xs.max())
+        candidates &= (bottom >= ys.min()) & (top <= ys.max())
+
+        hit = np.zeros(n, dtype=bool)
+        for x0, y0, x1, y1 in segments:
+            if not candidates.any():
+                break
+            # Test segment / boîte par intervalles (méthode des dalles)
+            t_min = np.zeros(n)
+            t_max = np.ones(n)
+            inside = candidates.copy()
+            for start, delta, low, high in ((x0, x1 - x0, left, right), (y0, y1 - y0, top, bottom)):
+                if delta == 0:
+                    inside &= (low <= start) & (start <= high)
+                else:
+                    t1 = (low - start) / delta
+                    t2 = (high - start) / delta
+                    np.maximum(t_min, np.minimum(t1, t2), out=t_min)
+                    np.minimum(t_max, np.maximum(t1, t2), out=t_max)
+            inside &= t_min <= t_max
+            hit |= inside
+            candidates &= ~inside
+
+        return np.flatnonzero(hit)
+
+    def visible_indices(self, height):
+        """Index des éléments à dessiner"""
+        n = self.count
+        return np.flatnonzero(self.throw[:n] & (self.y[:n] <= height))
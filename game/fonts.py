@@ -0,0 +1,63 @@
+import os
+from collections import OrderedDict
+
+import pygame
+
+
+class FontRegistry:
+    """Registre de polices partagé et cache des textes déjà rendus"""
+
+    def __init__(self, max_texts=512):
+        # Clé: (chemin, taille) -> pygame.font.Font
+        self._fonts = {}
+
+        # Clé: (police, texte, couleur, antialias) -> surface rendue
+        self.max_texts = max_texts
+        self._texts = OrderedDict()
+
+        # Nombre de rendus réels (hors cache), lu par le profileur
+        self.renders = 0
+
+    def font(self, path, size):
+        """
+        Retourne la police (chemin, taille), créée une seule fois
+
+        Args:
+            path: Chemin du fichier TTF, ou None pour la police par défaut
+            size: Taille en points
+
+        Lève les mêmes erreurs que pygame.font.Font si le fichier est introuvable.
+        """
+        key = (os.path.normpath(path) if path else None, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(key[0], size)
+            self._fonts[key] = font
+        return font
+
+    def render(self, font, text, color, antialias=True):
+        """
+        Retourne la surface du texte, rendue seulement si elle n'est pas en cache
+
+        La surface retournée est partagée : ne pas la modifier (set_alpha, blit...).
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._texts.get(key)
+        if surface is not None:
+            self._texts.move_to_end(key)
+            return surface
+
+        surface = font.render(text, antialias, color)
+        self.renders += 1
+        self._texts[key] = surface
+        if len(self._texts) > self.max_texts:
+            self._texts.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Vide le cache des textes rendus"""
+        self._texts.clear()
+
+
+# Instance unique partagée par tous les écrans
+fonts = FontRegistry()
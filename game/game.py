@@ -1,31 +1,80 @@
 import pygame
 import random
 from score import Score
+from assets import assets
+from fonts import fonts
+from entities import EntityStore, KIND_BOMB, KIND_ICE
+from waves import WaveScheduler, TIMELINES, MAX_PER_ITEM
+from particles import ParticleSystem
+from blade import Blade
+from profiler import profiler
+from audio import audio
 
 
 class Game:
-    def __init__(self, width=800, height=580, settings=None):
-        """Initialise le jeu"""
+    def __init__(self, width=800, height=580, settings=None, rng=None, save_scores=True, max_entities=64,
+                 difficulty="normal"):
+        """
+        Initialise le jeu
+
+        Args:
+            width, height: Taille de la zone de jeu
+            settings: Paramètres (son d'impact), ou None pour jouer sans son
+            rng: Générateur aléatoire (random.Random) pour une partie reproductible,
+                 ou None pour utiliser le module random global
+            save_scores: False pour ne pas écrire la partie dans scores.txt
+            max_entities: Éléments en l'air au plus (taille de la réserve, allouée une fois)
+            difficulty: Chronologie de vagues (waves.TIMELINES)
+        """
         self.WIDTH = width
         self.HEIGHT = height
-        self.FPS = 12
+        self.FPS = 12  # Pas de simulation par seconde (physique à pas fixe)
+        self.SIM_STEP = 1 / self.FPS
+        self.MAX_FRAME_TIME = 0.25  # Évite la spirale de rattrapage après un gel
+        self.accumulator = 0.0
+        self.interpolation = 1.0
+
+        # Rendu partiel (draw_dirty) : au-delà de cette part de l'aire de jeu
+        # à restaurer, on redessine tout
+        self.DIRTY_MAX_RATIO = 0.5
+        self.drawn_frame_state = None  # None : prochaine image entièrement redessinée
+        self.drawn_items = []
+        self.drawn_hud = []
+        self.drawn_hud_state = None
+        self.drawn_particles = None
+
+        # Surfaces à la taille de l'écran, refaites seulement quand elle change
+        self.freeze_scaled = None
+        self.gameover_background = None
         
         # Référence aux settings pour accéder au son d'impact
         self.settings = settings
+        self.rng = rng if rng is not None else random
+        self.save_scores = save_scores
+
+        # Source de la souris : None pour pygame.mouse, sinon une fonction
+        # game -> ((x, y), bouton_enfoncé) (bot, simulation sans écran)
+        self.mouse_input = None
+        # Enregistrement des entrées (replay.Recorder), ou None
+        self.recorder = None
 
         # Physique
         self.GRAVITY = 1.2
+        self.MAX_FALL_SPEED = 35
         self.NORMAL_SPEED_FACTOR = 0.3
         self.SPEED_FACTOR = self.NORMAL_SPEED_FACTOR
-        self.SPAWN_DELAY = 15
-        self.spawn_timer = 0
+        self.SPAWN_DELAY = 15  # Pas entre deux vagues de la chronologie "normal"
+        self.difficulty = difficulty  # Chronologie de vagues (waves.TIMELINES)
+        self.max_entities = max_entities
+        self.SPEED_X_RANGE = (-10, 10)
+        self.SPEED_Y_RANGE = (-80, -60)
 
         # État du jeu
         self.player_lives = 3
         self.score = 0
         self.game_over = False
         self.debug_mode = False
-        self.slow_motion_timer = 0
+        self.slow_motion_timer = 0  # secondes restantes
         self.SLOW_MOTION_DURATION = 3  # secondes
         self.game_mode = 1  # Mode de jeu (1 ou 2)
         self.mode_just_changed = False  # Flag pour détecter un changement de mode
@@ -35,6 +84,11 @@ class Game:
         self.player_name = "Player"  
         self.max_score_reached = 0  # Score max atteint dans la partie
 
+        # Statistiques de la partie
+        self.steps = 0
+        self.items_spawned = 0
+        self.items_sliced = 0
+
         # COMBO
         self.combo = 1
         self.max_combo = 10
@@ -46,10 +100,20 @@ class Game:
         # Voyelles: A, E, I, O, U
         # Consonnes faciles: B, C, F, G, H
         self.letters = list('AEIOBCFGH')  # 10 lettres
+        # Plusieurs éléments avec la lettre tapée : "lowest" (le plus bas à l'écran) ou "oldest"
+        self.LETTER_POLICY = "lowest"
+        # Lettres tapées depuis le dernier pas, coupées dans l'ordre au pas suivant
+        self.key_queue = []
         
         # Liste des éléments actifs selon le mode
         self.active_items = []
 
+        # MODE 2: Sprites (fruit, lettre) pré-rendus à l'entrée du mode
+        self.base_fruits = ['melon', 'orange', 'pomegranate', 'guava']
+        self.letter_atlas = {}
+        # Cercles de lettres déjà rendus, par (lettre, couleur)
+        self.letter_circles = {}
+
         # Couleurs
         self.WHITE = (255, 255, 255)
         self.BLACK = (0, 0, 0)
@@ -61,40 +125,79 @@ class Game:
 
         # Charger ressources
         self._load_resources()
-        self.data = {}
+        self.data = EntityStore(self.max_entities)
+        # Jus et éclats des coupes (couleurs : index de ParticleSystem.PALETTE)
+        self.particles = ParticleSystem()
+        self.JUICE_COLORS = {
+            'melon': (0, 3),
+            'orange': (1,),
+            'pomegranate': (0, 3),
+            'guava': (2, 3),
+            'ice_cube2': (4, 7),
+        }
+        # MODE 1: Trajectoire de la souris entre deux pas
+        self.blade = Blade()
         self._update_active_items()
         self._generate_all_items()
 
+    @staticmethod
+    def preload(width, height, screen_size=None):
+        """
+        Décode les images de la partie dans le cache partagé, sans les convertir
+
+        Appelée depuis le thread de préchargement : le constructeur et les
+        premières coupes trouvent ensuite leurs images en cache.
+
+        Args:
+            width, height: Taille de la zone de jeu
+            screen_size: Taille de l'écran (voile de l'effet gel), ou None
+        """
+        requests = [('./images/572603.jpg', (width, height), False),
+                    ('images/freeze_overlay.png', (width, height), True),
+                    ('images/white_lives.png', None, True),
+                    ('images/ff8_logo.png', None, True),
+                    ('images/explosion.png', None, True),
+                    ('images/half_ice_cube2.png', None, True)]
+        for name in ('melon', 'orange', 'pomegranate', 'guava'):
+            requests += [(f"images/{name}.png", None, True), (f"images/half_{name}.png", None, True)]
+        requests += [('images/bomb.png', None, True), ('images/ice_cube2.png', None, True)]
+        if screen_size:
+            requests.append(('./images/gel3.png', screen_size, True))
+
+        for path, size, alpha in requests:
+            try:
+                assets.decode(path, size, alpha)
+            except:
+                pass  # Image absente : le jeu utilisera son image de remplacement
+
     def _load_resources(self):
         try:
-            bg_img = pygame.image.load('./images/572603.jpg')
-            self.background = pygame.transform.scale(bg_img, (self.WIDTH, self.HEIGHT))
+            self.background = assets.image('./images/572603.jpg', (self.WIDTH, self.HEIGHT), alpha=False)
         except:
             self.background = pygame.Surface((self.WIDTH, self.HEIGHT))
             self.background.fill((50, 50, 50))
 
         try:
             self.font_name = './images/comic.ttf'
-            self.font = pygame.font.Font(self.font_name, 42)
+            self.font = fonts.font(self.font_name, 42)
         except:
-            self.font = pygame.font.Font(None, 42)
+            self.font = fonts.font(None, 42)
             self.font_name = None
 
         try:
-            self.lives_icon = pygame.image.load('images/white_lives.png')
+            self.lives_icon = assets.image('images/white_lives.png')
         except:
             self.lives_icon = pygame.Surface((30, 30))
             self.lives_icon.fill((255, 0, 0))
 
         try:
-            self.mode_button_img = pygame.image.load('images/ff8_logo.png')
+            self.mode_button_img = assets.image('images/ff8_logo.png')
         except:
             self.mode_button_img = pygame.Surface((200, 200))
             self.mode_button_img.fill((100, 100, 100))
 
         try:
-            freeze_img = pygame.image.load('images/freeze_overlay.png')
-            self.freeze_overlay = pygame.transform.scale(freeze_img, (self.WIDTH, self.HEIGHT))
+            self.freeze_overlay = assets.image('images/freeze_overlay.png', (self.WIDTH, self.HEIGHT))
         except:
             self.freeze_overlay = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
             self.freeze_overlay.fill((200, 220, 255, 100))
@@ -109,12 +212,13 @@ class Game:
             
             self.active_items = []
             
-            # Les 4 fruits de base
-            base_fruits = ['melon', 'orange', 'pomegranate', 'guava']
+            # Pré-rendre toutes les combinaisons (fruit, lettre) une seule fois
+            if not self.letter_atlas:
+                self._build_letter_atlas()
             
             # Créer 10 fruits avec index pour leur assigner une lettre spécifique
             for i, letter in enumerate(self.letters):
-                fruit = base_fruits[i % 4]  # Alterner entre les 4 fruits
+                fruit = self.base_fruits[i % 4]  # Alterner entre les 4 fruits
                 # Créer un identifiant unique avec la lettre assignée
                 fruit_key = f"{fruit}_{letter}"
                 self.active_items.append(fruit_key)
@@ -123,10 +227,11 @@ class Game:
             self.active_items.append('bomb')
             self.active_items.append('ice_cube2')
 
+        self.waves = WaveScheduler(TIMELINES[self.difficulty], self.active_items, MAX_PER_ITEM[self.difficulty])
+
     def _create_letter_image(self, letter):
-        """Crée une image pour une lettre"""
+        """Crée une image pour une lettre (rendue une seule fois par couleur)"""
         size = 80
-        img = pygame.Surface((size, size), pygame.SRCALPHA)
         
         colors = [
             (255, 100, 100),  # Rouge
@@ -136,20 +241,28 @@ class Game:
             (255, 100, 255),  # Magenta
             (100, 255, 255),  # Cyan
         ]
-        color = random.choice(colors)
+        color = self.rng.choice(colors)
+        
+        img = self.letter_circles.get((letter, color))
+        if img is not None:
+            return img
         
+        img = pygame.Surface((size, size), pygame.SRCALPHA)
         pygame.draw.circle(img, color, (size//2, size//2), size//2 - 2)
         pygame.draw.circle(img, self.BLACK, (size//2, size//2), size//2 - 2, 3)
         
         try:
-            letter_font = pygame.font.Font(self.font_name, 50) if self.font_name else pygame.font.Font(None, 50)
+            letter_font = fonts.font(self.font_name, 50)
         except:
-            letter_font = pygame.font.Font(None, 50)
+            letter_font = fonts.font(None, 50)
         
-        text = letter_font.render(letter, True, self.BLACK)
+        text = fonts.render(letter_font, letter, self.BLACK)
         text_rect = text.get_rect(center=(size//2, size//2))
         img.blit(text, text_rect)
         
+        if pygame.display.get_surface() is not None:
+            img = img.convert_alpha()
+        self.letter_circles[(letter, color)] = img
         return img
 
     def _add_letter_to_item(self, base_img, letter):
@@ -159,13 +272,13 @@ class Game:
         
         # Créer le texte de la lettre
         try:
-            letter_font = pygame.font.Font(self.font_name, 40) if self.font_name else pygame.font.Font(None, 40)
+            letter_font = fonts.font(self.font_name, 40)
         except:
-            letter_font = pygame.font.Font(None, 40)
+            letter_font = fonts.font(None, 40)
         
         # Texte avec contour blanc pour visibilité
-        text = letter_font.render(letter, True, self.WHITE)
-        text_outline = letter_font.render(letter, True, self.BLACK)
+        text = fonts.render(letter_font, letter, self.WHITE)
+        text_outline = fonts.render(letter_font, letter, self.BLACK)
         
         # Centrer la lettre sur l'image
         img_width, img_height = new_img.get_size()
@@ -183,6 +296,23 @@ class Game:
         
         return new_img
 
+    def _load_item_image(self, fruit_name):
+        """Retourne l'image de base d'un fruit, de la bombe ou du glaçon"""
+        try:
+            return assets.image(f"images/{fruit_name}.png")
+        except:
+            img = pygame.Surface((60, 60))
+            img.fill((255, 0, 0) if fruit_name == 'bomb' else (0, 255, 0))
+            return img
+
+    def _build_letter_atlas(self):
+        """Pré-rend chaque combinaison (fruit, lettre) du Mode 2"""
+        self.letter_atlas.clear()
+        for fruit_name in self.base_fruits + ['bomb', 'ice_cube2']:
+            base_img = self._load_item_image(fruit_name)
+            for letter in self.letters:
+                self.letter_atlas[(fruit_name, letter)] = self._add_letter_to_item(base_img, letter)
+
     def _generate_random_items(self, item):
         """Génère un élément aléatoire (fruit ou lettre)"""
         is_letter = item.startswith('letter_')
@@ -199,39 +329,39 @@ class Game:
             fruit_name = item
             if self.game_mode == 2 and '_' in item:
                 parts = item.split('_')
-                if parts[0] in ['melon', 'orange', 'pomegranate', 'guava']:
+                if parts[0] in self.base_fruits:
                     fruit_name = parts[0]
                     assigned_letter = parts[1]  # La lettre assignée à ce fruit
             
-            # Charger l'image du fruit/bombe/glaçon
-            try:
-                img = pygame.image.load(f"images/{fruit_name}.png")
-            except:
-                img = pygame.Surface((60, 60))
-                img.fill((255, 0, 0) if fruit_name == 'bomb' else (0, 255, 0))
             item_size = 60
             
-            # MODE 2: Ajouter une lettre sur l'item
+            # MODE 2: Utiliser le sprite pré-rendu avec la lettre
             if self.game_mode == 2:
                 # Si pas de lettre assignée (bombe ou glaçon), en choisir une aléatoire
                 if assigned_letter is None:
-                    assigned_letter = random.choice(self.letters)
+                    assigned_letter = self.rng.choice(self.letters)
                 
-                # Superposer la lettre sur l'image
-                img = self._add_letter_to_item(img, assigned_letter)
-
-        self.data[item] = {
-            'img': img,
-            'x': random.randint(item_size, self.WIDTH - item_size),  # Tenir compte de la taille
-            'y': self.HEIGHT,
-            'speed_x': random.randint(-10, 10),
-            'speed_y': random.randint(-80, -60),
-            'throw': True,
-            'hit': False,
-            'is_letter': is_letter,
-            'size': item_size,
-            'assigned_letter': assigned_letter
-        }
+                img = self.letter_atlas.get((fruit_name, assigned_letter))
+                if img is None:
+                    img = self._add_letter_to_item(self._load_item_image(fruit_name), assigned_letter)
+            else:
+                # Charger l'image du fruit/bombe/glaçon
+                img = self._load_item_image(fruit_name)
+
+        index = self.data.spawn(
+            item,
+            img,
+            self.rng.randint(item_size, self.WIDTH - item_size),  # Tenir compte de la taille
+            self.HEIGHT,
+            self.rng.randint(*self.SPEED_X_RANGE),
+            self.rng.randint(*self.SPEED_Y_RANGE),
+            item_size,
+            assigned_letter=assigned_letter,
+            is_letter=is_letter,
+            name=item if is_letter else fruit_name
+        )
+        if index is not None:
+            self.items_spawned += 1
 
     def _generate_all_items(self):
         """Génère tous les éléments selon le mode actif"""
@@ -241,23 +371,22 @@ class Game:
 
     def _draw_text(self, display, text, size, x, y, color=None):
         color = color or self.BLACK
-        font = pygame.font.Font(self.font_name, size) if self.font_name else pygame.font.Font(None, size)
-        text_surface = font.render(text, True, color)
+        font = fonts.font(self.font_name, size)
+        text_surface = fonts.render(font, text, color)
         rect = text_surface.get_rect()
         rect.midtop = (x, y)
         display.blit(text_surface, rect)
 
+    def _lives_blits(self, x, y, lives, image_path):
+        try:
+            img = assets.image(image_path)
+        except:
+            img = pygame.Surface((30, 30))
+            img.fill((255, 0, 0))
+        return [(img, (int(x + 35 * i), y)) for i in range(lives)]
+
     def _draw_lives(self, display, x, y, lives, image_path):
-        for i in range(lives):
-            try:
-                img = pygame.image.load(image_path)
-            except:
-                img = pygame.Surface((30, 30))
-                img.fill((255, 0, 0))
-            rect = img.get_rect()
-            rect.x = int(x + 35 * i)
-            rect.y = y
-            display.blit(img, rect)
+        display.blits(self._lives_blits(x, y, lives, image_path), False)
 
     def set_player_name(self, name):
         """Définit le nom du joueur"""
@@ -293,18 +422,26 @@ class Game:
             # Si le mode a changé, nettoyer TOUT et régénérer
             if old_mode != mode:
                 self.mode_just_changed = True
+                if self.recorder:
+                    self.recorder.mode(mode)
                 self._update_active_items()
                 self._generate_all_items()
                 # Reset complet pour éviter les mélanges
-                self.spawn_timer = 0
                 self.slow_motion_timer = 0
                 self.SPEED_FACTOR = self.NORMAL_SPEED_FACTOR
+                self.particles.clear()
+                self.key_queue.clear()
+                self.invalidate()
 
     def start_game(self):
+        if self.recorder:
+            self.recorder.start()
         self.player_lives = 3
         self.score = 0
         self.max_score_reached = 0
-        self.spawn_timer = 0
+        self.steps = 0
+        self.items_spawned = 0
+        self.items_sliced = 0
         self.game_over = False
         self.mode_just_changed = False
         self._update_active_items()
@@ -312,10 +449,18 @@ class Game:
         self.slow_motion_timer = 0
         self.SPEED_FACTOR = self.NORMAL_SPEED_FACTOR
         self.combo = 1
+        self.blade.reset()
+        self.accumulator = 0.0
+        self.interpolation = 1.0
+        self.particles.clear()
+        self.key_queue.clear()
+        self.invalidate()
 
     def end_game(self):
         """Termine la partie et sauvegarde le score"""
         if not self.game_over:
+            if self.recorder:
+                self.recorder.end()
             self.game_over = True
             
             # On sauvegarde TOUJOURS le score, même si c'est 0
@@ -326,6 +471,9 @@ class Game:
             # Format: afficher le mode de jeu proprement
             mode_text = f"Mode {self.game_mode}"
             
+            if not self.save_scores:
+                return
+            
             # Passer le score actuel directement (même s'il est 0)
             self.score_manager.add_score(
                 player_name=self.player_name,
@@ -341,272 +489,458 @@ class Game:
 
     def toggle_debug(self):
         self.debug_mode = not self.debug_mode
+        # Les mesures ne coûtent rien tant que l'overlay est masqué
+        profiler.set_enabled(self.debug_mode)
+        self.invalidate()
+
+    def handle_mouse_input(self, event):
+        """Enregistre les mouvements de souris pour le Mode 1 (coupe balayée)"""
+        if self.game_mode == 1 and not self.game_over:
+            sample = self.blade.handle_event(event)
+            if sample and self.recorder:
+                self.recorder.sample(*sample)
 
     def handle_keyboard_input(self, event):
         """Gère les entrées clavier pour le Mode 2 (fruits avec lettres)"""
+        if event.type == pygame.KEYDOWN:
+            self.queue_letter(pygame.key.name(event.key).upper())
+
+    def queue_letter(self, letter):
+        """MODE 2: Ajoute une lettre tapée à la file du prochain pas"""
+        if self.game_mode != 2 or self.game_over:
+            return
+        if len(letter) != 1 or letter not in self.letters:
+            return
+        if self.recorder:
+            self.recorder.key(letter)
+        self.key_queue.append(letter)
+
+    def press_letter(self, letter):
+        """MODE 2: Coupe l'élément en l'air portant cette lettre (selon LETTER_POLICY)"""
         if self.game_mode != 2 or self.game_over:
             return
         
-        if event.type == pygame.KEYDOWN:
-            key_name = pygame.key.name(event.key).upper()
+        # Vérifier que c'est une lettre valide
+        if len(letter) != 1 or letter not in self.letters:
+            return
+        
+        # Élément en l'air avec cette lettre assignée (index des lettres, sans parcours)
+        data = self.data
+        index = data.find_letter(letter, self.LETTER_POLICY)
+        if index is None:
+            return
+        item_data = data.view(index)
+        item_data['hit'] = True
+        self.items_sliced += 1
+        
+        # Nom de base du fruit (sans la lettre)
+        base_name = data.name[index]
+        kind = item_data['kind']
+        self._splash(item_data, base_name)
+        
+        if kind == KIND_BOMB:
+            # BOMBE TOUCHÉE
+            self.player_lives -= 3
+            self.combo = 1
+            try:
+                item_data['img'] = assets.image("images/explosion.png")
+            except:
+                item_data['img'] = pygame.Surface((60, 60))
+                item_data['img'].fill((255, 100, 0))
+            if self.player_lives <= 0:
+                self.end_game()
+        
+        elif kind == KIND_ICE:
+            # GLAÇON TOUCHÉ - RALENTISSEMENT
+            self.slow_motion_timer = self.SLOW_MOTION_DURATION
             
-            # Vérifier que c'est une lettre valide
-            if len(key_name) == 1 and key_name in self.letters:
-                
-                # Chercher tous les items avec cette lettre assignée
-                for item_key, item_data in self.data.items():
-                    if item_data['throw'] and not item_data['hit']:
-                        # Vérifier si cet item a la lettre assignée
-                        if item_data.get('assigned_letter') == key_name:
-                            item_data['hit'] = True
-                            
-                            # Extraire le nom de base du fruit (sans la lettre)
-                            if '_' in item_key:
-                                base_name = item_key.split('_')[0]
-                            else:
-                                base_name = item_key
-                            
-                            if base_name == 'bomb':
-                                # BOMBE TOUCHÉE
-                                self.player_lives -= 3
-                                self.combo = 1
-                                try:
-                                    item_data['img'] = pygame.image.load("images/explosion.png")
-                                except:
-                                    item_data['img'] = pygame.Surface((60, 60))
-                                    item_data['img'].fill((255, 100, 0))
-                                if self.player_lives <= 0:
-                                    self.end_game()
-                            
-                            elif base_name == 'ice_cube2':
-                                # GLAÇON TOUCHÉ - RALENTISSEMENT
-                                self.slow_motion_timer = self.SLOW_MOTION_DURATION * self.FPS
-                                
-                                # Créer un effet visuel "brisé" pour le glaçon
-                                try:
-                                    # Essayer de charger l'image half_ice_cube2
-                                    ice_img = pygame.image.load("images/half_ice_cube2.png")
-                                    item_data['img'] = ice_img
-                                except:
-                                    # Si l'image n'existe pas, créer un effet visuel bleu clair
-                                    ice_surface = pygame.Surface((60, 60), pygame.SRCALPHA)
-                                    # Dessiner des éclats de glace (plusieurs rectangles bleus)
-                                    ice_surface.fill((150, 220, 255, 200))  # Bleu clair translucide
-                                    # Ajouter des lignes blanches pour effet "brisé"
-                                    pygame.draw.line(ice_surface, (255, 255, 255), (10, 10), (50, 50), 2)
-                                    pygame.draw.line(ice_surface, (255, 255, 255), (50, 10), (10, 50), 2)
-                                    pygame.draw.line(ice_surface, (200, 230, 255), (30, 0), (30, 60), 2)
-                                    item_data['img'] = ice_surface
-                                
-                                if self.settings:
-                                    self.settings.play_impact_sound()
-                                
-                                self.combo = min(self.combo + 1, self.max_combo)
-                                self.score += self.combo
-                                self.max_score_reached = max(self.max_score_reached, self.score)
-                            
-                            else:
-                                # C'EST UN FRUIT
-                                try:
-                                    item_data['img'] = pygame.image.load(f"images/half_{base_name}.png")
-                                except:
-                                    item_data['img'] = pygame.Surface((60, 60))
-                                    item_data['img'].fill((0, 255, 0))
-                                
-                                if self.settings:
-                                    self.settings.play_impact_sound()
-                                
-                                self.combo = min(self.combo + 1, self.max_combo)
-                                self.score += self.combo
-                                self.max_score_reached = max(self.max_score_reached, self.score)
-                            
-                            # Sortir après avoir trouvé le premier item
-                            break
+            # Créer un effet visuel "brisé" pour le glaçon
+            try:
+                # Essayer de charger l'image half_ice_cube2
+                ice_img = assets.image("images/half_ice_cube2.png")
+                item_data['img'] = ice_img
+            except:
+                # Si l'image n'existe pas, créer un effet visuel bleu clair
+                ice_surface = pygame.Surface((60, 60), pygame.SRCALPHA)
+                # Dessiner des éclats de glace (plusieurs rectangles bleus)
+                ice_surface.fill((150, 220, 255, 200))  # Bleu clair translucide
+                # Ajouter des lignes blanches pour effet "brisé"
+                pygame.draw.line(ice_surface, (255, 255, 255), (10, 10), (50, 50), 2)
+                pygame.draw.line(ice_surface, (255, 255, 255), (50, 10), (10, 50), 2)
+                pygame.draw.line(ice_surface, (200, 230, 255), (30, 0), (30, 60), 2)
+                item_data['img'] = ice_surface
+            
+            if self.settings:
+                self.settings.play_impact_sound()
+            
+            self.combo = min(self.combo + 1, self.max_combo)
+            self.score += self.combo
+            self.max_score_reached = max(self.max_score_reached, self.score)
+        
+        else:
+            # C'EST UN FRUIT
+            try:
+                item_data['img'] = assets.image(f"images/half_{base_name}.png")
+            except:
+                item_data['img'] = pygame.Surface((60, 60))
+                item_data['img'].fill((0, 255, 0))
+            
+            if self.settings:
+                self.settings.play_impact_sound()
+            
+            self.combo = min(self.combo + 1, self.max_combo)
+            self.score += self.combo
+            self.max_score_reached = max(self.max_score_reached, self.score)
+
+    def _splash(self, item, name):
+        """Gerbe de jus (fruit, glaçon) ou d'éclats (bombe) au centre de l'élément touché"""
+        center_x = item['x'] + item['size'] / 2
+        center_y = item['y'] + item['size'] / 2
+        if name == 'bomb':
+            self.particles.emit(center_x, center_y, 160, (5, 6, 7, 1),
+                                speed=(120, 480), life=(0.4, 1.1), drops=0.3)
+        else:
+            self.particles.emit(center_x, center_y, 48, self.JUICE_COLORS.get(name, (0, 3)))
+
+    def _slice_item(self, key, value):
+        """MODE 1: Applique la coupe d'un élément touché à la souris"""
+        value['hit'] = True
+        self.items_sliced += 1
+        self._splash(value, key)
+
+        if key == 'bomb':
+            self.player_lives -= 3
+            self.combo = 1
+            try:
+                value['img'] = assets.image("images/explosion.png")
+            except:
+                value['img'] = pygame.Surface((60, 60))
+                value['img'].fill((255, 100, 0))
+            if self.player_lives <= 0:
+                self.end_game()
+        else:
+            # Effet visuel pour fruit ou glaçon coupé
+            if key == 'ice_cube2':
+                # Effet spécial pour le glaçon
+                try:
+                    value['img'] = assets.image("images/half_ice_cube2.png")
+                except:
+                    # Effet visuel bleu "brisé"
+                    ice_surface = pygame.Surface((60, 60), pygame.SRCALPHA)
+                    ice_surface.fill((150, 220, 255, 200))
+                    pygame.draw.line(ice_surface, (255, 255, 255), (10, 10), (50, 50), 2)
+                    pygame.draw.line(ice_surface, (255, 255, 255), (50, 10), (10, 50), 2)
+                    pygame.draw.line(ice_surface, (200, 230, 255), (30, 0), (30, 60), 2)
+                    value['img'] = ice_surface
+            else:
+                # Fruits normaux
+                try:
+                    value['img'] = assets.image(f"images/half_{key}.png")
+                except:
+                    value['img'] = pygame.Surface((60, 60))
+                    value['img'].fill((0, 255, 0))
+
+            # JOUER LE SON D'IMPACT (même son pour tous)
+            if self.settings:
+                self.settings.play_impact_sound()
+
+            self.combo = min(self.combo + 1, self.max_combo)
+            self.score += self.combo
+            self.max_score_reached = max(self.max_score_reached, self.score)
+
+            if key == 'ice_cube2':
+                self.slow_motion_timer = self.SLOW_MOTION_DURATION
+
+    def advance(self, dt, y_offset=0):
+        """
+        Avance la simulation du temps réel écoulé, par pas fixes de SIM_STEP
+
+        Args:
+            dt: Temps réel écoulé depuis la dernière image (secondes)
+            y_offset: Décalage vertical de la zone de jeu
+        """
+        if self.recorder:
+            self.recorder.frame(dt)
+        self.accumulator += min(dt, self.MAX_FRAME_TIME)
+        while self.accumulator >= self.SIM_STEP:
+            self.update(y_offset)
+            self.accumulator -= self.SIM_STEP
+        # Fraction du pas suivant déjà écoulée, pour interpoler l'affichage
+        self.interpolation = self.accumulator / self.SIM_STEP
+        # Les particules suivent le temps réel (fluides à toutes les fréquences d'affichage)
+        self.particles.update(min(dt, self.MAX_FRAME_TIME))
 
     def update(self, y_offset=0):
+        """Avance la simulation d'un pas fixe"""
         if self.game_over:
             return
 
+        # Positions avant ce pas (pour l'interpolation à l'affichage)
+        self.data.snapshot()
+
+        # MODE 2: Toutes les lettres tapées depuis le dernier pas, dans l'ordre
+        if self.key_queue:
+            for letter in self.key_queue:
+                self.press_letter(letter)
+            self.key_queue.clear()
+            if self.game_over:
+                return
+
         # MODE 1: Gestion souris
         if self.game_mode == 1:
-            current_position = pygame.mouse.get_pos()
-            mouse_pressed = pygame.mouse.get_pressed()
+            if self.mouse_input:
+                current_position, button_down = self.mouse_input(self)
+            else:
+                current_position = pygame.mouse.get_pos()
+                button_down = pygame.mouse.get_pressed()[0]
+            if self.recorder:
+                self.recorder.tick(current_position, button_down)
         
-        self.spawn_timer += 1
+        self.steps += 1
 
         # Slow motion (fonctionne dans les deux modes)
         if self.slow_motion_timer > 0:
             self.SPEED_FACTOR = 0
-            self.slow_motion_timer -= 1
+            self.slow_motion_timer -= self.SIM_STEP
         else:
             self.SPEED_FACTOR = self.NORMAL_SPEED_FACTOR
 
-        for key, value in self.data.items():
-            if value['throw']:
-                value['x'] += value['speed_x'] * self.SPEED_FACTOR
-                value['y'] += value['speed_y'] * self.SPEED_FACTOR
-                value['speed_y'] += self.GRAVITY
-
-                if value['speed_y'] > 35:
-                    value['speed_y'] = 35
-                
-                # Empêcher les fruits de sortir par les côtés de l'écran
-                item_size = value.get('size', 60)
-                if value['x'] < 0:
-                    value['x'] = 0
-                    value['speed_x'] = abs(value['speed_x'])  # Rebondir
-                elif value['x'] > self.WIDTH - item_size:
-                    value['x'] = self.WIDTH - item_size
-                    value['speed_x'] = -abs(value['speed_x'])  # Rebondir
-
-                # Élément raté
-                if value['y'] > self.HEIGHT:
-                    value['throw'] = False
-                    
-                    if self.game_mode == 1:
-                        if not value['hit'] and key != 'bomb':
-                            self.player_lives -= 1
-                            self.combo = 1
-                            if self.player_lives <= 0:
-                                self.end_game()
-                    else:
-                        # Mode 2 : pénaliser tous les fruits ratés (sauf bombe et glaçon)
-                        # Extraire le nom de base
-                        if '_' in key:
-                            base_name = key.split('_')[0]
-                        else:
-                            base_name = key
-                        
-                        # Pénaliser si c'est un fruit (pas bombe ni glaçon)
-                        if not value['hit'] and base_name not in ['bomb', 'ice_cube2']:
-                            self.player_lives -= 1
-                            self.combo = 1
-                            if self.player_lives <= 0:
-                                self.end_game()
-
-                # MODE 1: Collision souris
-                if self.game_mode == 1 and not value['hit'] and mouse_pressed[0]:
-                    item_size = value.get('size', 60)
-                    if value['x'] < current_position[0] < value['x'] + item_size and \
-                       value['y'] + y_offset < current_position[1] < value['y'] + y_offset + item_size:
-                        value['hit'] = True
-
-                        if key == 'bomb':
-                            self.player_lives -= 3
-                            self.combo = 1
-                            try:
-                                value['img'] = pygame.image.load("images/explosion.png")
-                            except:
-                                value['img'] = pygame.Surface((60, 60))
-                                value['img'].fill((255, 100, 0))
-                            if self.player_lives <= 0:
-                                self.end_game()
-                        else:
-                            # Effet visuel pour fruit ou glaçon coupé
-                            if key == 'ice_cube2':
-                                # Effet spécial pour le glaçon
-                                try:
-                                    value['img'] = pygame.image.load("images/half_ice_cube2.png")
-                                except:
-                                    # Effet visuel bleu "brisé"
-                                    ice_surface = pygame.Surface((60, 60), pygame.SRCALPHA)
-                                    ice_surface.fill((150, 220, 255, 200))
-                                    pygame.draw.line(ice_surface, (255, 255, 255), (10, 10), (50, 50), 2)
-                                    pygame.draw.line(ice_surface, (255, 255, 255), (50, 10), (10, 50), 2)
-                                    pygame.draw.line(ice_surface, (200, 230, 255), (30, 0), (30, 60), 2)
-                                    value['img'] = ice_surface
-                            else:
-                                # Fruits normaux
-                                try:
-                                    value['img'] = pygame.image.load(f"images/half_{key}.png")
-                                except:
-                                    value['img'] = pygame.Surface((60, 60))
-                                    value['img'].fill((0, 255, 0))
-
-                            # JOUER LE SON D'IMPACT (même son pour tous)
-                            if self.settings:
-                                self.settings.play_impact_sound()
-
-                            self.combo = min(self.combo + 1, self.max_combo)
-                            self.score += self.combo
-                            self.max_score_reached = max(self.max_score_reached, self.score)
-
-                            if key == 'ice_cube2':
-                                self.slow_motion_timer = self.SLOW_MOTION_DURATION * self.FPS
-
-            else:
-                if self.spawn_timer >= self.SPAWN_DELAY:
-                    self._generate_random_items(key)
-                    self.spawn_timer = 0
-
-    def draw(self, display, y_offset=0):
-        display.blit(self.background, (0, y_offset))
-
+        # Physique vectorisée : déplacement, gravité, rebonds, éléments ratés
+        missed = self.data.integrate(
+            self.SPEED_FACTOR, self.GRAVITY, self.MAX_FALL_SPEED, self.WIDTH, self.HEIGHT
+        )
+
+        # Élément raté : Mode 1 pénalise tout sauf la bombe,
+        # Mode 2 pénalise seulement les fruits (pas bombe ni glaçon)
+        if len(missed):
+            spared = KIND_BOMB if self.game_mode == 1 else KIND_BOMB | KIND_ICE
+            penalized = missed[~self.data.hit[missed] & (self.data.kind[missed] & spared == 0)]
+            if len(penalized):
+                self.player_lives -= len(penalized)
+                self.combo = 1
+                if self.player_lives <= 0:
+                    self.end_game()
+
+        # MODE 1: Collision souris sur toute la trajectoire depuis le dernier pas
+        if self.game_mode == 1:
+            segments = self.blade.segments(current_position, button_down)
+            segments[:, 1::2] -= y_offset
+            for index in self.data.sweep_test(segments):
+                self._slice_item(self.data.keys[index], self.data.view(index))
+
+        # Vague de la chronologie (plusieurs éléments, du même type ou non) ; si
+        # tous ses types sont à leur limite, elle reste due et est retentée au pas suivant
+        wave = self.waves.tick(self.SPAWN_DELAY)
+        if wave:
+            spawned = False
+            for group in wave:
+                item = self.waves.pick(group, self.data.live)
+                if item is not None:
+                    self._generate_random_items(item)
+                    spawned = True
+            if spawned:
+                self.waves.fired()
+
+    def _hud_state(self):
+        """Ce dont dépend le HUD : il n'est redessiné (draw_dirty) que si cela change"""
+        return (self.score, self.combo, self.game_mode, self.player_lives)
+
+    def _hud_blits(self, y_offset):
+        """Textes et vies du HUD, sous forme de liste (surface, position)"""
         # Score
-        score_text = self.font.render(f'Score : {self.score}', True, self.WHITE)
-        display.blit(score_text, (0, y_offset))
+        score_text = fonts.render(self.font, f'Score : {self.score}', self.WHITE)
 
         # Combo
-        combo_text = self.font.render(f'Combo x{self.combo}', True, self.ORANGE)
-        display.blit(combo_text, (0, y_offset + 40))
+        combo_text = fonts.render(self.font, f'Combo x{self.combo}', self.ORANGE)
 
         # Mode
         mode_color = self.GREEN if self.game_mode == 1 else self.YELLOW
-        mode_text = self.font.render(f'Mode {self.game_mode}', True, mode_color)
-        display.blit(mode_text, (0, y_offset + 80))
+        mode_text = fonts.render(self.font, f'Mode {self.game_mode}', mode_color)
         
         # Instructions
-        instruction_font = pygame.font.Font(self.font_name, 24) if self.font_name else pygame.font.Font(None, 24)
+        instruction_font = fonts.font(self.font_name, 24)
         instruction = "Cliquez sur les fruits!" if self.game_mode == 1 else "Tapez les lettres au clavier!"
-        instruction_text = instruction_font.render(instruction, True, self.WHITE)
-        display.blit(instruction_text, (0, y_offset + 120))
+        instruction_text = fonts.render(instruction_font, instruction, self.WHITE)
+
+        blits = [
+            (score_text, (0, y_offset)),
+            (combo_text, (0, y_offset + 40)),
+            (mode_text, (0, y_offset + 80)),
+            (instruction_text, (0, y_offset + 120)),
+        ]
 
         # Vies
-        self._draw_lives(display, 690, y_offset + 5, self.player_lives, 'images/ff8_vie4(1).png')
+        blits.extend(self._lives_blits(690, y_offset + 5, self.player_lives, 'images/ff8_vie4(1).png'))
+        return blits
+
+    def _item_blits(self, y_offset):
+        """Éléments visibles, à leur position interpolée"""
+        data = self.data
+        visible = data.visible_indices(self.HEIGHT)
+        xs, ys = data.interpolated(visible, self.interpolation)
+        return [(data.img[i], (x, y + y_offset)) for i, x, y in zip(visible, xs, ys)]
+
+    def _freeze_surface(self, display):
+        """Voile de l'effet gel à la taille de l'écran, ou None hors ralenti"""
+        if self.slow_motion_timer <= 0:
+            return None
+        size = display.get_size()
+        if self.freeze_overlay.get_size() == size:
+            return self.freeze_overlay
+        # Mis à l'échelle une seule fois par taille d'écran
+        if self.freeze_scaled is None or self.freeze_scaled.get_size() != size:
+            try:
+                self.freeze_scaled = assets.image('./images/gel3.png', size)
+            except:
+                self.freeze_scaled = pygame.transform.scale(self.freeze_overlay, size)
+        return self.freeze_scaled
+
+    def invalidate(self):
+        """Force un rendu complet à la prochaine image (draw_dirty)"""
+        self.drawn_frame_state = None
+
+    def draw(self, display, y_offset=0, overlays=()):
+        """
+        Dessine toute l'aire de jeu
+
+        Args:
+            overlays: Liste (surface, position) dessinée par-dessus, ex: l'aide en bas de l'écran
+        """
+        display.blit(self.background, (0, y_offset))
+
+        # HUD
+        hud = self._hud_blits(y_offset)
+        display.blits(hud, False)
 
         # Éléments
-        for value in self.data.values():
-            if value['throw'] and value['y'] <= self.HEIGHT:
-                display.blit(value['img'], (value['x'], value['y'] + y_offset))
+        items = self._item_blits(y_offset)
+        display.blits(items, False)
+
+        # Jus et éclats, sans déborder sur la barre du haut
+        clip = display.get_clip()
+        display.set_clip(clip.clip((0, y_offset, self.WIDTH, self.HEIGHT)))
+        self.particles.draw(display, y_offset)
+        display.set_clip(clip)
 
         # Effet gel (fonctionne dans les deux modes)
-        if self.slow_motion_timer > 0:
-            screen_width, screen_height = display.get_size()
-            if self.freeze_overlay.get_width() != screen_width or self.freeze_overlay.get_height() != screen_height:
-                try:
-                    freeze_img = pygame.image.load('./images/gel3.png')
-                    freeze_scaled = pygame.transform.scale(freeze_img, (screen_width, screen_height))
-                except:
-                    freeze_scaled = pygame.transform.scale(self.freeze_overlay, (screen_width, screen_height))
-            else:
-                freeze_scaled = self.freeze_overlay
-            display.blit(freeze_scaled, (0, y_offset))
+        freeze = self._freeze_surface(display)
+        if freeze:
+            display.blit(freeze, (0, y_offset))
 
         # Debug
         if self.debug_mode:
-            debug_font = pygame.font.Font(None, 24)
-            active_items = len([v for v in self.data.values() if v['throw']])
-            debug_text = debug_font.render(
-                f"FPS: {self.FPS} | Items: {active_items} | Mode: {self.game_mode}",
-                True, self.ORANGE
+            debug_font = fonts.font(None, 24)
+            active_items = self.data.active_count()
+            debug_text = fonts.render(
+                debug_font,
+                f"Simulation: {self.FPS} pas/s | Items: {active_items} | "
+                f"Particules: {self.particles.live_count()} | Mode: {self.game_mode}",
+                self.ORANGE
             )
             display.blit(debug_text, (10, y_offset + 160))
+            audio_text = fonts.render(debug_font, audio.latency_text(), self.ORANGE)
+            display.blit(audio_text, (10, y_offset + 185))
+            profiler.draw(display, 10, y_offset + 210, self.ORANGE)
+
+        display.blits(overlays, False)
+
+        # Ce qui est à l'écran, pour le prochain draw_dirty
+        self.drawn_frame_state = (y_offset, freeze is not None, display.get_size())
+        self.drawn_items = [pygame.Rect(pos, surface.get_size()) for surface, pos in items]
+        self.drawn_hud = [pygame.Rect(pos, surface.get_size()) for surface, pos in hud]
+        self.drawn_hud_state = self._hud_state()
+        self.drawn_particles = self.particles.bounds(y_offset)
+
+    def draw_dirty(self, display, y_offset=0, overlays=()):
+        """
+        Redessine seulement ce qui a changé depuis l'image précédente
+
+        Les zones occupées par les éléments (avant et après leur déplacement) et
+        par le HUD s'il a changé sont restaurées depuis le fond, puis les
+        couches qui les touchent y sont redessinées. Le rendu est complet après
+        invalidate(), en mode debug, quand le gel commence ou finit, ou quand
+        trop de surface est à restaurer.
+
+        Returns:
+            Liste des rectangles modifiés, à passer à pygame.display.update
+        """
+        play_area = pygame.Rect(0, y_offset, self.WIDTH, self.HEIGHT)
+        freeze = self._freeze_surface(display)
+        if self.debug_mode or self.drawn_frame_state != (y_offset, freeze is not None, display.get_size()):
+            self.draw(display, y_offset, overlays)
+            return [play_area]
+
+        hud = self._hud_blits(y_offset)
+        items = self._item_blits(y_offset)
+        item_rects = [pygame.Rect(pos, surface.get_size()) for surface, pos in items]
+
+        dirty = self.drawn_items + item_rects
+        hud_state = self._hud_state()
+        if hud_state != self.drawn_hud_state:
+            hud_rects = [pygame.Rect(pos, surface.get_size()) for surface, pos in hud]
+            dirty += self.drawn_hud + hud_rects
+        else:
+            hud_rects = self.drawn_hud
+
+        # Particules : une seule zone (ancienne et nouvelle étendue), où elles sont
+        # dessinées une fois ; les zones qui la touchent y sont fusionnées
+        particle_rect = self.particles.bounds(y_offset)
+        if particle_rect or self.drawn_particles:
+            merged = (particle_rect or self.drawn_particles).union(self.drawn_particles or particle_rect)
+            others = []
+            for rect in dirty:
+                if rect.colliderect(merged):
+                    merged.union_ip(rect)
+                else:
+                    others.append(rect)
+            dirty = others + [merged]
+
+        dirty = [rect.clip(play_area) for rect in dirty]
+        dirty = [rect for rect in dirty if rect.width and rect.height]
+        if sum(rect.width * rect.height for rect in dirty) > self.DIRTY_MAX_RATIO * play_area.width * play_area.height:
+            self.draw(display, y_offset, overlays)
+            return [play_area]
+
+        # Couches dans l'ordre de draw(), sans le fond : sous et sur les particules
+        below = hud + items
+        below_rects = [pygame.Rect(pos, surface.get_size()) for surface, pos in below]
+        above = [(freeze, (0, y_offset))] if freeze else []
+        above.extend(overlays)
+        above_rects = [pygame.Rect(pos, surface.get_size()) for surface, pos in above]
+
+        clip = display.get_clip()
+        for rect in dirty:
+            display.set_clip(rect)
+            display.blit(self.background, rect, rect.move(0, -y_offset))
+            display.blits([below[i] for i in rect.collidelistall(below_rects)], False)
+            if particle_rect and rect.colliderect(particle_rect):
+                self.particles.draw(display, y_offset)
+            display.blits([above[i] for i in rect.collidelistall(above_rects)], False)
+        display.set_clip(clip)
+
+        self.drawn_items = item_rects
+        self.drawn_hud = hud_rects
+        self.drawn_hud_state = hud_state
+        self.drawn_particles = particle_rect
+        return dirty
 
     def show_gameover_screen(self, display, clock):
         """Affiche l'écran game over"""
-        screen_width, screen_height = display.get_size()
-        overlay = pygame.Surface((screen_width, screen_height))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(200)
-        
+
         waiting = True
         while waiting:
             clock.tick(self.FPS)
-            display.fill((0, 0, 0))
+            screen_width, screen_height = display.get_size()
             
-            bg_scaled = pygame.transform.scale(self.background, (screen_width, screen_height))
-            display.blit(bg_scaled, (0, 0))
-            display.blit(overlay, (0, 0))
+            # Fond mis à l'échelle et assombri, composé une fois par taille d'écran
+            if self.gameover_background is None or self.gameover_background.get_size() != (screen_width, screen_height):
+                background = pygame.transform.scale(self.background, (screen_width, screen_height))
+                overlay = pygame.Surface((screen_width, screen_height))
+                overlay.fill((0, 0, 0))
+                overlay.set_alpha(200)
+                background.blit(overlay, (0, 0))
+                self.gameover_background = background
+            display.blit(self.gameover_background, (0, 0))
             
             center_x = screen_width // 2
             
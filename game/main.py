@@ -1,6 +1,11 @@
+import time
+IMPORT_START = time.perf_counter()
+
+import argparse
 import pygame
 from pygame.locals import QUIT, KEYDOWN, K_ESCAPE, K_SPACE, K_r
 import sys
+import random
 from bar_game import TopBar
 from game import Game
 from main_itrfc import MainMenu
@@ -8,44 +13,118 @@ from settings_menu import SettingsMenu
 from settings import Setting
 from slider import Slider
 from score import Score
+from fonts import fonts
+from profiler import profiler
+from startup import StartupReport, Preloader
+from assets import assets
+from bundle import AssetBundle
+from audio import audio
+from replay import Recorder
 
 def main():
-    pygame.mixer.pre_init(44100, -16, 2, 512)
+    parser = argparse.ArgumentParser(description="Final Fantasy Fruits")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="Temps des imports, de pygame.init, de chaque constructeur et du premier affichage")
+    parser.add_argument("--record", metavar="FICHIER",
+                        help="Enregistre graine et entrées pour rejouer la session (python game/replay.py FICHIER)")
+    args = parser.parse_args()
+
+    report = StartupReport(args.startup_report, start=IMPORT_START)
+    report.mark("imports")
+
+    record_path = args.record
+    recorder = None
+
+    # Le son d'impact et la musique sont chargés sur le thread de préchargement
+    settings = report.measure("Setting()", Setting, load_sounds=False)
+
+    audio.pre_init(settings.audio_buffer)
     pygame.init()
+    audio.start()
+    report.mark("pygame.init")
 
-    settings = Setting()
-    settings.play_music()
+    # Images et sons pré-décodés (python game/bundle.py), sinon lus depuis les fichiers
+    assets.use_bundle(AssetBundle.open())
+    report.mark("bundle")
 
-    WIDTH, HEIGHT = 800, 580
+    # Taille logique : tout est dessiné à cette taille puis mis à l'échelle par SDL
+    WIDTH, HEIGHT = settings.screen_width, settings.screen_height
     BAR_HEIGHT = 80
     
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    screen = settings.apply_screen()
     pygame.display.set_caption("Final Fantasy Fruits")
+    report.mark("display.set_mode")
+
+    # Le menu n'attend que ses propres ressources : premier affichage au plus tôt
+    main_menu = report.measure("MainMenu()", MainMenu, WIDTH, HEIGHT)
+    main_menu.draw(screen)
+    pygame.display.flip()
+    report.mark("premier affichage")
+
+    # Ressources des autres écrans et audio, décodées pendant que le menu tourne
+    score_manager = report.measure("Score()", Score)
+    preload = Preloader([
+        ("audio", settings.load_audio),
+        ("images de la partie", lambda: Game.preload(WIDTH, HEIGHT - BAR_HEIGHT, (WIDTH, HEIGHT))),
+        ("images de la barre", TopBar.preload),
+        ("tableau des scores", score_manager.preload),
+    ]).start()
+
+    # Construits une fois le préchargement terminé (cache déjà rempli)
+    settings_menu = None
+    top_bar = None
+    game = None
+
+    def finish_startup():
+        """Attend le préchargement puis construit les autres écrans"""
+        nonlocal settings_menu, top_bar, game, recorder
+        report.measure("attente du préchargement", preload.wait)
+        # MODIFICATION : Passer settings au SettingsMenu
+        settings_menu = report.measure("SettingsMenu()", SettingsMenu, WIDTH, HEIGHT, settings=settings)
+        top_bar = report.measure("TopBar()", TopBar, WIDTH, height=BAR_HEIGHT)
+        # Passer settings au Game
+        if record_path:
+            seed = random.getrandbits(32)
+            game = report.measure("Game()", Game, WIDTH, HEIGHT - BAR_HEIGHT, settings=settings,
+                                  rng=random.Random(seed))
+            recorder = Recorder(record_path, seed).attach(game, y_offset=BAR_HEIGHT)
+        else:
+            game = report.measure("Game()", Game, WIDTH, HEIGHT - BAR_HEIGHT, settings=settings)
+        report.print(extra=[("préchargement: " + name, seconds) for name, seconds in preload.timings])
 
-    main_menu = MainMenu(WIDTH, HEIGHT)
-    
-    # MODIFICATION : Passer settings au SettingsMenu
-    settings_menu = SettingsMenu(WIDTH, HEIGHT, settings=settings)
-    
-    score_manager = Score()  
-    top_bar = TopBar(WIDTH, height=BAR_HEIGHT)
-    
-    # Passer settings au Game
-    game = Game(WIDTH, HEIGHT - BAR_HEIGHT, settings=settings)
-    
     clock = pygame.time.Clock()
     game_state = "MENU"
+    previous_state = game_state  # Le premier affichage du menu est déjà fait
     running = True
 
     while running:
+        # Un autre écran a été affiché, ou la fenêtre a été redimensionnée / ré-exposée :
+        # le prochain rendu partiel doit tout redessiner
+        redraw_all = game_state != previous_state
+        previous_state = game_state
+        if pygame.event.peek([pygame.VIDEORESIZE, pygame.WINDOWEXPOSED]):
+            redraw_all = True
+
         if game_state == "MENU":
-            main_menu.draw(screen)
+            if redraw_all:
+                main_menu.invalidate()
+            if settings.dirty_rects:
+                dirty = main_menu.draw_dirty(screen)
+            else:
+                main_menu.draw(screen)
+
+            if game is None and preload.done():
+                finish_startup()
 
             for event in pygame.event.get():
                 # Gérer les événements de la TopBar pour le changement de mode
-                top_bar.handle_event(event)
+                if top_bar:
+                    top_bar.handle_event(event)
                 
                 action = main_menu.handle_event(event)
+                if action in ("START", "SETTINGS", "SCORES") and game is None:
+                    # Clic avant la fin du préchargement : les autres écrans l'attendent
+                    finish_startup()
 
                 if action == "START":
                     game_state = "PLAYING"
@@ -59,25 +138,41 @@ def main():
                 elif action == "SCORES":
                     game_state = "SCORES"
             
-            # Synchroniser le mode entre TopBar et Game
-            topbar_mode = top_bar.get_game_mode()
-            game.set_game_mode(topbar_mode)
-            
-            # Mettre à jour la TopBar pour l'effet hover
-            top_bar.update()
+            if game is not None:
+                # Synchroniser le mode entre TopBar et Game
+                topbar_mode = top_bar.get_game_mode()
+                game.set_game_mode(topbar_mode)
+                
+                # Mettre à jour la TopBar pour l'effet hover
+                top_bar.update()
             
-            pygame.display.flip()
+            if settings.dirty_rects:
+                pygame.display.update(dirty)
+            else:
+                pygame.display.flip()
             clock.tick(60)
 
         elif game_state == "SETTINGS":
-            settings_menu.draw(screen)
+            if redraw_all:
+                settings_menu.invalidate()
+            if settings.dirty_rects:
+                dirty = settings_menu.draw_dirty(screen)
+            else:
+                settings_menu.draw(screen)
             for event in pygame.event.get():
                 if event.type == QUIT:
                     running = False
                 action = settings_menu.handle_event(event)
                 if action == "BACK":
                     game_state = "MENU"
-            pygame.display.flip()
+                elif action == "FULLSCREEN":
+                    # Nouvelle fenêtre : même taille logique, tout est redessiné
+                    screen = settings.apply_screen()
+                    settings_menu.invalidate()
+            if settings.dirty_rects:
+                pygame.display.update(dirty)
+            else:
+                pygame.display.flip()
             clock.tick(60)
 
         elif game_state == "SCORES":
@@ -89,11 +184,18 @@ def main():
                 running = False
 
         elif game_state == "PLAYING":
+            profiler.begin_frame()
+            if redraw_all:
+                game.invalidate()
+                top_bar.invalidate()
 
             for event in pygame.event.get():
                 # Gérer les événements de la TopBar
                 top_bar.handle_event(event)
                 
+                # MODE 1: Trajectoire de la souris pour la coupe
+                game.handle_mouse_input(event)
+                
                 if event.type == QUIT:
                     running = False
                 elif event.type == KEYDOWN:
@@ -132,30 +234,44 @@ def main():
                 top_bar.pause()
                 game_state = "GAME_OVER"
 
-            top_bar.update()
-            game.update(y_offset=BAR_HEIGHT)
-            screen.fill((0, 0, 0))
-            top_bar.draw(screen)
+            profiler.mark("events")
 
-    
-            game.draw(screen, y_offset=BAR_HEIGHT)
+            top_bar.update()
+            profiler.mark("top_bar.update")
+            # Simulation à pas fixe, indépendante de la fréquence d'affichage
+            game.advance(clock.get_time() / 1000, y_offset=BAR_HEIGHT)
+            profiler.mark("game.update")
 
             # Instructions adaptées au mode
-            font_small = pygame.font.Font(None, 20)
+            font_small = fonts.font(None, 20)
             if game.get_game_mode() == 1:
-                instructions = font_small.render(
+                instructions = fonts.render(
+                    font_small,
                     "MODE 1 - ESPACE: Timer | R: Reset | D: Debug | ESC: Menu",
-                    True, (255, 255, 255)
+                    (255, 255, 255)
                 )
             else:
-                instructions = font_small.render(
+                instructions = fonts.render(
+                    font_small,
                     "MODE 2 - Tapez les lettres au clavier! | ESPACE: Timer | R: Reset | ESC: Menu",
-                    True, (255, 255, 255)
+                    (255, 255, 255)
                 )
-            screen.blit(instructions, (10, HEIGHT - 25))
+            overlays = [(instructions, (10, HEIGHT - 25))]
 
-            pygame.display.flip()
-            clock.tick(game.FPS)
+            if settings.dirty_rects:
+                # Seules les zones modifiées sont restaurées et envoyées à l'écran
+                dirty = top_bar.draw_dirty(screen)
+                dirty += game.draw_dirty(screen, y_offset=BAR_HEIGHT, overlays=overlays)
+                profiler.mark("game.draw")
+                pygame.display.update(dirty)
+            else:
+                screen.fill((0, 0, 0))
+                top_bar.draw(screen)
+                game.draw(screen, y_offset=BAR_HEIGHT, overlays=overlays)
+                profiler.mark("game.draw")
+                pygame.display.flip()
+            profiler.mark("display.flip")
+            clock.tick(settings.max_fps)
 
         elif game_state == "GAME_OVER":
             action = game.show_gameover_screen(screen, clock)
@@ -169,6 +285,8 @@ def main():
                 game_state = "MENU"
                 top_bar.reset()
 
+    if recorder:
+        recorder.close()
     pygame.quit()
     sys.exit()
 
@@ -1,6 +1,10 @@
 import pygame
 import sys
 from button_menu import Button_menu
+from widget import IconButton, draw_dirty
+from assets import assets
+from audio import audio
+from fonts import fonts
 
 
 class MainMenu:
@@ -26,9 +30,9 @@ class MainMenu:
         self.TITLE_DARK_BLUE = (25, 60, 100)  # Bleu foncé pour l'ombre
         
         # === CHARGER L'IMAGE DE FOND ===
+        self.background_path = './images/572603.jpg'
         try:
-            bg_img = pygame.image.load('./images/572603.jpg')
-            self.background = pygame.transform.scale(bg_img, (width, height))
+            self.background = assets.image(self.background_path, (width, height), alpha=False)
         except:
             # Fond par défaut si l'image n'existe pas
             self.background = pygame.Surface((width, height))
@@ -37,8 +41,7 @@ class MainMenu:
         
         # === CHARGER LES ICÔNES ===
         try:
-            self.scores_icon = pygame.image.load('./images/scores.png')
-            self.scores_icon = pygame.transform.scale(self.scores_icon, (50, 50))
+            self.scores_icon = assets.image('./images/scores.png', (50, 50))
         except:
             # Créer une icône par défaut si l'image n'existe pas
             self.scores_icon = pygame.Surface((50, 50), pygame.SRCALPHA)
@@ -46,8 +49,7 @@ class MainMenu:
             print("Warning: scores_icon.png not found, using default icon")
         
         try:
-            self.settings_icon = pygame.image.load('./images/fruit_settings.png')
-            self.settings_icon = pygame.transform.scale(self.settings_icon, (50, 50))
+            self.settings_icon = assets.image('./images/fruit_settings.png', (50, 50))
         except:
             # Créer une icône d'engrenage par défaut
             self.settings_icon = pygame.Surface((50, 50), pygame.SRCALPHA)
@@ -57,8 +59,8 @@ class MainMenu:
         
         # === FONTS ===
         try:
-            self.title_font = pygame.font.Font('./images/comic.ttf', 80)
-            self.button_font = pygame.font.Font('./images/comic.ttf', 35)
+            self.title_font = fonts.font('./images/comic.ttf', 80)
+            self.button_font = fonts.font('./images/comic.ttf', 35)
         except:
             self.title_font = pygame.font.SysFont("arialblack", 80)
             self.button_font = pygame.font.SysFont("arial", 35, bold=True)
@@ -82,38 +84,50 @@ class MainMenu:
             self.button_font, self.BROWN
         )
 
+        # Sons du menu, sur les canaux réservés à l'interface
         try:
-            self.sound_hover = pygame.mixer.Sound("./musique/menu-move.ogg")
-            self.sound_click = pygame.mixer.Sound("./musique/game-start.ogg")
-
-            self.sound_hover.set_volume(0.3)
-            self.sound_click.set_volume(0.5)
+            audio.register("menu.hover", assets.sound("./musique/menu-move.ogg"), "ui", max_voices=1, volume=0.3)
+            audio.register("menu.click", assets.sound("./musique/game-start.ogg"), "ui", max_voices=1, volume=0.5)
+            self.sound_hover = "menu.hover"
+            self.sound_click = "menu.click"
         except:
             print("Warning: sounds not found")
             self.sound_hover = None
             self.sound_click = None
 
-        # === ÉTATS HOVER (anti-spam son) ===
-        self.hover_states = {
-            "play": False,
-            "quit": False,
-            "settings": False,
-            "scores": False
-        }
-        
-        
         # Settings en haut à droite
-        self.settings_button_rect = pygame.Rect(width - 70, 20, 60, 60)
+        self.settings_button = IconButton((width - 70, 20, 60, 60), self.settings_icon,
+                                          self.BLUE_GRAY, self.BLUE_GRAY_LIGHT, self.WHITE)
+        self.settings_button_rect = self.settings_button.rect
         
         # Scores en haut à gauche
-        self.scores_button_rect = pygame.Rect(10, 20, 60, 60)
+        self.scores_button = IconButton((10, 20, 60, 60), self.scores_icon,
+                                        self.BLUE_GRAY, self.BLUE_GRAY_LIGHT, self.WHITE)
+        self.scores_button_rect = self.scores_button.rect
         
-        # États de hover
-        self.settings_hovered = False
-        self.scores_hovered = False
+        self.widgets = [self.play_button, self.quit_button, self.settings_button, self.scores_button]
+
+        # Couches translucides du titre (lueur, contour), rendues une fois
+        self.title_layers = {}
+
+        # Fond + voile + titre, pré-composés pour une taille d'écran
+        self.static_layer = None
+        self.static_size = None
+        self.full_redraw = True  # Prochain draw_dirty : tout l'écran
     
+    def _title_layer(self, text, color, alpha):
+        """Retourne une couche translucide du titre, rendue une seule fois"""
+        key = (text, color, alpha)
+        layer = self.title_layers.get(key)
+        if layer is None:
+            layer = self.title_font.render(text, True, color)
+            layer.set_alpha(alpha)
+            self.title_layers[key] = layer
+        return layer
+
     def draw_fancy_title(self, screen):
         """Dessine un titre fantaisiste style Final Fantasy avec effet de lueur"""
+        center_x = screen.get_width() // 2
         title_line1 = "FINAL FANTASY"
         title_line2 = "FRUITS"
         
@@ -124,87 +138,92 @@ class MainMenu:
         # Dessiner les deux lignes du titre
         for title_text, title_y in [(title_line1, title_y1), (title_line2, title_y2)]:
             # Effet de lueur bleu sobre
+            shadow_surface = self._title_layer(title_text, self.TITLE_DARK_BLUE, 40)
             for offset in range(6, 0, -2):
-                shadow_surface = self.title_font.render(title_text, True, self.TITLE_DARK_BLUE)
-                shadow_surface.set_alpha(40)
-                shadow_rect = shadow_surface.get_rect(center=(self.width//2, title_y))
+                shadow_rect = shadow_surface.get_rect(center=(center_x, title_y))
                 screen.blit(shadow_surface, (shadow_rect.x + offset, shadow_rect.y + offset))
             
             # Ombre noire pour la profondeur
-            shadow_text = self.title_font.render(title_text, True, self.BLACK)
-            shadow_rect = shadow_text.get_rect(center=(self.width//2 + 3, title_y + 3))
+            shadow_text = fonts.render(self.title_font, title_text, self.BLACK)
+            shadow_rect = shadow_text.get_rect(center=(center_x + 3, title_y + 3))
             screen.blit(shadow_text, shadow_rect)
             
             # Texte principal bleu sobre
-            main_text = self.title_font.render(title_text, True, self.TITLE_BLUE)
-            main_rect = main_text.get_rect(center=(self.width//2, title_y))
+            main_text = fonts.render(self.title_font, title_text, self.TITLE_BLUE)
+            main_rect = main_text.get_rect(center=(center_x, title_y))
             screen.blit(main_text, main_rect)
             
             # Contour blanc léger
-            white_text = self.title_font.render(title_text, True, self.WHITE)
-            white_text.set_alpha(80)
+            white_text = self._title_layer(title_text, self.WHITE, 80)
             for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                white_rect = white_text.get_rect(center=(self.width//2 + dx, title_y + dy))
+                white_rect = white_text.get_rect(center=(center_x + dx, title_y + dy))
                 screen.blit(white_text, white_rect)
     
-    def draw(self, screen):
-        """Dessine le menu principal"""
+    def build_static_layer(self, size):
+        """Pré-compose le fond, le voile et le titre (ce qui ne change jamais) pour cette taille"""
+        layer = pygame.Surface(size)
+        
         # Dessiner le fond d'écran du jeu
-        screen.blit(self.background, (0, 0))
+        background = self.background
+        if background.get_size() != size:
+            try:
+                background = assets.image(self.background_path, size, alpha=False)
+            except:
+                background = pygame.transform.scale(self.background, size)
+        layer.blit(background, (0, 0))
         
         # Ajouter un overlay semi-transparent pour améliorer la lisibilité
-        overlay = pygame.Surface((self.width, self.height))
+        overlay = pygame.Surface(size)
         overlay.set_alpha(150)  # Transparence 
         overlay.fill(self.BLACK)
-        screen.blit(overlay, (0, 0))
+        layer.blit(overlay, (0, 0))
         
         # Titre fantaisiste style Final Fantasy
-        self.draw_fancy_title(screen)
-        
-        # Dessiner les boutons principaux
-        self.play_button.draw(screen)
-        self.quit_button.draw(screen)
-        
-        # === DESSINER BOUTON SETTINGS (en haut à droite) ===
-        # Fond du bouton avec effet hover
-        settings_color = self.BLUE_GRAY_LIGHT if self.settings_hovered else self.BLUE_GRAY
-        pygame.draw.rect(screen, settings_color, self.settings_button_rect, border_radius=10)
-        pygame.draw.rect(screen, self.WHITE, self.settings_button_rect, 3, border_radius=10)
-        
-        # Centrer l'icône dans le bouton
-        icon_x = self.settings_button_rect.x + (self.settings_button_rect.width - 50) // 2
-        icon_y = self.settings_button_rect.y + (self.settings_button_rect.height - 50) // 2
-        screen.blit(self.settings_icon, (icon_x, icon_y))
-        
-        # === DESSINER BOUTON SCORES (en haut à gauche) ===
-        # Fond du bouton avec effet hover
-        scores_color = self.BLUE_GRAY_LIGHT if self.scores_hovered else self.BLUE_GRAY
-        pygame.draw.rect(screen, scores_color, self.scores_button_rect, border_radius=10)
-        pygame.draw.rect(screen, self.WHITE, self.scores_button_rect, 3, border_radius=10)
-        
-        # Centrer l'icône dans le bouton
-        icon_x = self.scores_button_rect.x + (self.scores_button_rect.width - 50) // 2
-        icon_y = self.scores_button_rect.y + (self.scores_button_rect.height - 50) // 2
-        screen.blit(self.scores_icon, (icon_x, icon_y))
-        
-        # Mettre à jour les états hover
+        self.draw_fancy_title(layer)
+        
+        if pygame.display.get_surface():
+            layer = layer.convert()
+        self.static_layer = layer
+        self.static_size = size
+    
+    def update_hover(self):
+        """Met à jour le survol des boutons (son joué une fois à l'entrée, anti-spam)"""
         mouse_pos = pygame.mouse.get_pos()
-        self.settings_hovered = self.settings_button_rect.collidepoint(mouse_pos)
-        self.scores_hovered = self.scores_button_rect.collidepoint(mouse_pos)
-        # === SON AU SURVOL ===
-        def handle_hover(name, rect):
-            is_hovered = rect.collidepoint(mouse_pos)
-            if is_hovered and not self.hover_states[name]:
-                if self.sound_hover:
-                    self.sound_hover.play()
-            self.hover_states[name] = is_hovered
+        for widget in self.widgets:
+            if widget.update_hover(mouse_pos) and self.sound_hover:
+                audio.play(self.sound_hover)
+    
+    def draw(self, screen):
+        """Dessine le menu principal"""
+        # Fond, voile et titre : une seule surface, recomposée seulement si la taille change
+        if self.static_size != screen.get_size():
+            self.build_static_layer(screen.get_size())
+        screen.blit(self.static_layer, (0, 0))
+        
+        # Boutons (surfaces en cache par état)
+        self.update_hover()
+        for widget in self.widgets:
+            widget.draw(screen)
+        self.full_redraw = False
+    
+    def invalidate(self):
+        """Force un rendu complet au prochain draw_dirty (l'écran a été recouvert)"""
+        self.full_redraw = True
+    
+    def draw_dirty(self, screen):
+        """
+        Comme draw, mais ne redessine que les boutons dont l'état a changé
 
-        handle_hover("play", self.play_button.rect)
-        handle_hover("quit", self.quit_button.rect)
-        handle_hover("settings", self.settings_button_rect)
-        handle_hover("scores", self.scores_button_rect)
+        Returns:
+            Liste des rectangles modifiés, à passer à pygame.display.update
+        """
+        if self.full_redraw or self.static_size != screen.get_size():
+            self.draw(screen)
+            return [screen.get_rect()]
+        
+        self.update_hover()
+        return draw_dirty(screen, self.static_layer, self.widgets)
 
-    
     def handle_event(self, event):
         """Gère les événements du menu et retourne l'action correspondante"""
         if event.type == pygame.QUIT:
@@ -212,24 +231,24 @@ class MainMenu:
         
         if self.play_button.is_clicked(event):
             if self.sound_click:
-                self.sound_click.play()
+                audio.play(self.sound_click)
             return "START"
         
         if self.quit_button.is_clicked(event):
             if self.sound_click:
-                self.sound_click.play()
+                audio.play(self.sound_click)
             return "QUIT"
         
         # Gestion des clics sur les boutons icônes
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.settings_button_rect.collidepoint(event.pos):
                 if self.sound_click:
-                    self.sound_click.play()
+                    audio.play(self.sound_click)
                 return "SETTINGS"
             
             if self.scores_button_rect.collidepoint(event.pos):
                 if self.sound_click:
-                    self.sound_click.play()
+                    audio.play(self.sound_click)
                 return "SCORES"
         
         return None
\ No newline at end of file
@@ -0,0 +1,159 @@
+import numpy as np
+import pygame
+
+
+class ParticleSystem:
+    """
+    Particules de jus et d'éclats (coupes, explosions) en tableaux NumPy
+
+    Capacité fixe, allouée une fois : une nouvelle gerbe réutilise les
+    emplacements les plus anciens quand tout est occupé. Deux rendus :
+    les gouttes (sprite > 0) sont des disques pré-rendus dessinés avec
+    Surface.blits, les éclats fins (sprite == 0) sont des points 2x2 écrits
+    directement dans les pixels de l'écran (surfarray), ce qui permet de
+    garder des milliers de particules à 60 images/s.
+    """
+
+    GRAVITY = 900.0  # px/s²
+    ALPHA_LEVELS = 8
+    RADII = (2, 3)  # Rayons des sprites 1 et 2
+
+    # Couleurs des gerbes (index dans PALETTE)
+    PALETTE = (
+        (220, 30, 60),    # Jus rouge (melon, grenade)
+        (255, 140, 0),    # Jus orange
+        (120, 200, 60),   # Jus vert (goyave)
+        (255, 120, 160),  # Pulpe rose
+        (180, 230, 255),  # Éclats de glace
+        (255, 220, 80),   # Flammes
+        (90, 90, 90),     # Débris de bombe
+        (255, 255, 255),  # Étincelles
+    )
+
+    def __init__(self, capacity=10000, rng=None):
+        self.capacity = capacity
+        # Générateur à part : les effets visuels ne changent pas le hasard de la partie
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.uint8)
+        self.sprite = np.zeros(capacity, dtype=np.uint8)
+        self.cursor = 0
+
+        self.palette = np.array(self.PALETTE, dtype=np.float32)
+        # Sprites indexés à plat : ((couleur * 2) + rayon) * ALPHA_LEVELS + niveau
+        self.sprites = None
+
+    def _build_sprites(self):
+        """Un disque pré-rendu par (couleur, rayon, niveau d'alpha)"""
+        sprites = []
+        convert = pygame.display.get_surface() is not None
+        for color in self.PALETTE:
+            for radius in self.RADII:
+                for level in range(self.ALPHA_LEVELS):
+                    alpha = 255 * (level + 1) // self.ALPHA_LEVELS
+                    surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                    pygame.draw.circle(surf, color + (alpha,), (radius, radius), radius)
+                    sprites.append(surf.convert_alpha() if convert else surf)
+        return sprites
+
+    def clear(self):
+        self.life[:] = 0
+
+    def live_count(self):
+        return int(np.count_nonzero(self.life > 0))
+
+    def emit(self, x, y, count, colors, speed=(80, 320), life=(0.35, 0.8), drops=0.25):
+        """
+        Lance une gerbe de particules depuis (x, y)
+
+        Args:
+            count: Nombre de particules
+            colors: Index de couleurs (PALETTE), tirés au hasard
+            speed: Vitesse initiale (min, max) en px/s, dans toutes les directions
+            life: Durée de vie (min, max) en secondes
+            drops: Part des particules dessinées en gouttes (sprites)
+        """
+        count = min(count, self.capacity)
+        index = (self.cursor + np.arange(count)) % self.capacity
+        self.cursor = (self.cursor + count) % self.capacity
+
+        rng = self.rng
+        angle = rng.uniform(0, 2 * np.pi, count)
+        velocity = rng.uniform(speed[0], speed[1], count)
+        self.pos[index] = (x, y)
+        self.vel[index, 0] = np.cos(angle) * velocity
+        # Légèrement vers le haut : le jus gicle avant de retomber
+        self.vel[index, 1] = np.sin(angle) * velocity - speed[0]
+        self.life[index] = self.max_life[index] = rng.uniform(life[0], life[1], count)
+        self.color[index] = rng.choice(np.asarray(colors, dtype=np.uint8), count)
+        self.sprite[index] = np.where(rng.random(count) < drops, rng.integers(1, 3, count), 0)
+
+    def update(self, dt):
+        """Avance les particules de dt secondes"""
+        if not (self.life > 0).any():
+            return
+        # Tout le tableau d'un coup : plus rapide que de sélectionner les vivantes
+        self.vel[:, 1] += self.GRAVITY * dt
+        self.pos += self.vel * dt
+        self.life -= dt
+
+    def bounds(self, y_offset=0):
+        """Rectangle (coordonnées écran) couvrant les particules vivantes, ou None"""
+        live = self.life > 0
+        if not live.any():
+            return None
+        pos = self.pos[live]
+        left, top = pos.min(axis=0)
+        right, bottom = pos.max(axis=0)
+        # Les gouttes débordent de leur rayon, les points de 1 px à droite et en bas
+        margin = max(self.RADII) + 1
+        return pygame.Rect(int(left) - margin, int(top) + y_offset - margin,
+                           int(right) - int(left) + 2 * margin + 1, int(bottom) - int(top) + 2 * margin + 1)
+
+    def draw(self, surface, y_offset=0):
+        """Dessine les particules vivantes dans la zone de clip de la surface"""
+        live = np.flatnonzero(self.life > 0)
+        if not len(live):
+            return
+        if self.sprites is None:
+            self.sprites = self._build_sprites()
+
+        clip = surface.get_clip()
+        fade = self.life[live] / self.max_life[live]
+        x = self.pos[live, 0].astype(np.intp)
+        y = self.pos[live, 1].astype(np.intp) + y_offset
+
+        # Gouttes : sprites pré-rendus (le clip de la surface s'applique)
+        drops = self.sprite[live] > 0
+        if drops.any():
+            level = np.minimum((fade[drops] * self.ALPHA_LEVELS).astype(np.intp), self.ALPHA_LEVELS - 1)
+            sprite = ((self.color[live][drops].astype(np.intp) * 2 + self.sprite[live][drops] - 1)
+                      * self.ALPHA_LEVELS + level)
+            radius = np.take(self.RADII, self.sprite[live][drops] - 1)
+            sprites = self.sprites
+            surface.blits([(sprites[i], (px, py)) for i, px, py in
+                           zip(sprite.tolist(), (x[drops] - radius).tolist(), (y[drops] - radius).tolist())], False)
+
+        # Éclats : points 2x2 mélangés directement dans les pixels, limités au clip
+        dots = ~drops
+        if not dots.any():
+            return
+        try:
+            pixels = pygame.surfarray.pixels3d(surface)
+        except (ValueError, pygame.error):
+            return  # Format d'écran sans accès direct aux pixels : éclats non dessinés
+        xs, ys = x[dots], y[dots]
+        color = self.palette[self.color[live][dots]]
+        alpha = fade[dots, np.newaxis]
+        for dx in (0, 1):
+            for dy in (0, 1):
+                px, py = xs + dx, ys + dy
+                inside = (px >= clip.left) & (px < clip.right) & (py >= clip.top) & (py < clip.bottom)
+                px, py = px[inside], py[inside]
+                under = pixels[px, py]
+                pixels[px, py] = under + (color[inside] - under) * alpha[inside]
+        del pixels
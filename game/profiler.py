@@ -0,0 +1,114 @@
+import time
+from collections import deque
+
+import pygame
+
+from assets import assets
+from fonts import fonts
+from widget import Widget
+
+
+class FrameProfiler:
+    """
+    Mesure du temps réel de chaque image, découpé par phase, pour l'overlay debug
+
+    Désactivé, chaque appel se limite à un test de booléen.
+    """
+
+    def __init__(self, history=120):
+        self.enabled = False
+
+        # Durées des dernières images (secondes, d'un début d'image au suivant)
+        self.frame_times = deque(maxlen=history)
+        # Durées des phases sur les dernières images : nom -> deque
+        self.phases = {}
+
+        # Surfaces créées pendant l'image précédente, comptées par les caches
+        # du jeu (images, widgets, textes) là où ils les produisent
+        self.image_loads = 0
+        self.widget_renders = 0
+        self.text_renders = 0
+        self._counters_start = (0, 0, 0)
+
+        self._frame_start = 0.0
+        self._last_mark = 0.0
+
+    @staticmethod
+    def _counters():
+        return (assets.loads, Widget.renders, fonts.renders)
+
+    def set_enabled(self, enabled):
+        """Active ou désactive les mesures"""
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        self.frame_times.clear()
+        self.phases.clear()
+        self._frame_start = 0.0
+        self._counters_start = self._counters()
+
+    def begin_frame(self):
+        """Début d'une image : clôt la mesure de l'image précédente"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start:
+            self.frame_times.append(now - self._frame_start)
+        self._frame_start = self._last_mark = now
+
+        counters = self._counters()
+        self.image_loads, self.widget_renders, self.text_renders = (
+            value - start for value, start in zip(counters, self._counters_start))
+        self._counters_start = counters
+
+    def mark(self, name):
+        """Fin de la phase name : enregistre le temps écoulé depuis la marque précédente"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        samples = self.phases.get(name)
+        if samples is None:
+            samples = self.phases[name] = deque(maxlen=60)
+        samples.append(now - self._last_mark)
+        self._last_mark = now
+
+    @property
+    def fps(self):
+        """Images par seconde mesurées sur l'historique"""
+        if not self.frame_times:
+            return 0.0
+        return len(self.frame_times) / sum(self.frame_times)
+
+    def draw(self, surface, x, y, color=(255, 128, 0)):
+        """Dessine le graphe des temps d'image et le détail par phase"""
+        font = fonts.font(None, 20)
+        width, height = 240, 60
+        budget = 1 / 60  # Ligne de référence : 16,7 ms
+
+        # Graphe des temps d'image (échelle : 2 x budget en haut)
+        pygame.draw.rect(surface, (0, 0, 0), (x, y, width, height))
+        budget_y = y + height - height // 2
+        pygame.draw.line(surface, (0, 160, 0), (x, budget_y), (x + width, budget_y))
+        if len(self.frame_times) > 1:
+            step = width / (self.frame_times.maxlen - 1)
+            points = [
+                (x + i * step, y + height - min(height, frame / (2 * budget) * height))
+                for i, frame in enumerate(self.frame_times)
+            ]
+            pygame.draw.lines(surface, color, False, points)
+        pygame.draw.rect(surface, (255, 255, 255), (x, y, width, height), 1)
+
+        last = self.frame_times[-1] * 1000 if self.frame_times else 0.0
+        lines = [f"FPS mesuré: {self.fps:.1f} | image: {last:.1f} ms"]
+        for name, samples in self.phases.items():
+            lines.append(f"{name}: {sum(samples) / len(samples) * 1000:.2f} ms")
+        lines.append(f"Images: {self.image_loads} | Widgets: {self.widget_renders} | Rendus texte: {self.text_renders}")
+
+        text_y = y + height + 4
+        for line in lines:
+            surface.blit(fonts.render(font, line, color), (x, text_y))
+            text_y += 18
+
+
+# Instance unique partagée par la boucle principale et l'overlay debug
+profiler = FrameProfiler()
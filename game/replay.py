@@ -0,0 +1,312 @@
+"""
+Enregistrement et relecture déterministes des entrées d'une session
+
+Un enregistrement contient la graine du générateur aléatoire de la partie et,
+dans l'ordre où le jeu les a reçues, toutes ses entrées : durée de chaque
+image, position de la souris lue à chaque pas, trajectoire de la lame, lettres
+tapées (Mode 2), changements de mode, débuts et fins de partie. Rejouées dans
+le même ordre sur un Game construit avec la même graine, elles redonnent
+exactement la même partie, image par image.
+
+Enregistrer une session (depuis la racine du dépôt) :
+
+    python game/main.py --record session.rec
+
+La rejouer sans écran, le plus vite possible ou en temps réel :
+
+    python game/replay.py session.rec
+    python game/replay.py session.rec --realtime --draw dirty
+
+Format : en-tête RECORD_HEADER (magic, taille de l'en-tête JSON), en-tête JSON
+(graine et paramètres du jeu), puis les enregistrements : un octet de code
+suivi des valeurs de RECORDS[code].
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import struct
+import sys
+import time
+
+import numpy as np
+
+RECORD_MAGIC = b"FFREC01\n"
+RECORD_HEADER = struct.Struct("<8sI")
+
+# Codes des enregistrements
+FRAME = 1   # Image : durée passée à Game.advance (secondes)
+TICK = 2    # Pas de simulation : position et bouton de la souris lus par update (Mode 1)
+SAMPLE = 3  # Point de la trajectoire de la lame reçu entre deux pas (Mode 1)
+KEY = 4     # Lettre tapée (Mode 2), coupée au pas suivant
+MODE = 5    # Changement de mode de jeu
+START = 6   # Début de partie
+END = 7     # Fin de partie (minuteur ou vies)
+DIGEST = 8  # Empreinte de l'état du jeu à la fin de l'enregistrement
+
+RECORDS = {
+    FRAME: struct.Struct("<d"),
+    TICK: struct.Struct("<ddB"),  # Exacte même pour une souris simulée (bot)
+    SAMPLE: struct.Struct("<hhB"),
+    KEY: struct.Struct("<c"),
+    MODE: struct.Struct("<B"),
+    START: struct.Struct(""),
+    END: struct.Struct(""),
+    DIGEST: struct.Struct("<20s"),
+}
+
+
+def state_digest(game):
+    """Empreinte (SHA-1) de l'état de la partie : compteurs et positions des éléments"""
+    data = game.data
+    n = data.count
+    digest = hashlib.sha1()
+    digest.update(struct.pack("<8q", game.score, game.player_lives, game.steps, game.items_spawned,
+                              game.items_sliced, game.combo, game.game_mode, game.game_over))
+    for array in (data.x[:n], data.y[:n], data.speed_x[:n], data.speed_y[:n], data.throw[:n], data.hit[:n]):
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.digest()
+
+
+class Recorder:
+    """
+    Écrit les entrées reçues par un Game dans un fichier d'enregistrement
+
+    Game appelle les méthodes ci-dessous quand game.recorder est défini ;
+    attach() doit suivre immédiatement la construction du jeu (avec
+    rng=random.Random(seed)) pour que la relecture parte du même état.
+    """
+
+    def __init__(self, path, seed):
+        self.path = path
+        self.seed = seed
+        self.game = None
+        self.file = None
+        self._frame = RECORDS[FRAME]
+        self._tick = RECORDS[TICK]
+        self._sample = RECORDS[SAMPLE]
+
+    def attach(self, game, y_offset=0):
+        """Ouvre le fichier, écrit l'en-tête et branche l'enregistrement sur le jeu"""
+        header = json.dumps({
+            "seed": self.seed,
+            "width": game.WIDTH,
+            "height": game.HEIGHT,
+            "y_offset": y_offset,
+            "difficulty": game.difficulty,
+            "max_entities": game.max_entities,
+        }).encode("utf-8")
+        self.file = open(self.path, "wb")
+        self.file.write(RECORD_HEADER.pack(RECORD_MAGIC, len(header)))
+        self.file.write(header)
+
+        # Les gerbes de particules aussi : même coût de rendu à la relecture
+        game.particles.rng = np.random.default_rng(self.seed)
+        game.recorder = self
+        self.game = game
+        return self
+
+    def frame(self, dt):
+        self.file.write(bytes((FRAME,)) + self._frame.pack(dt))
+
+    def tick(self, position, pressed):
+        self.file.write(bytes((TICK,)) + self._tick.pack(position[0], position[1], bool(pressed)))
+
+    def sample(self, position, pressed):
+        self.file.write(bytes((SAMPLE,)) + self._sample.pack(position[0], position[1], bool(pressed)))
+
+    def key(self, letter):
+        self.file.write(bytes((KEY,)) + letter.encode("ascii"))
+
+    def mode(self, mode):
+        self.file.write(bytes((MODE, mode)))
+
+    def start(self):
+        self.file.write(bytes((START,)))
+
+    def end(self):
+        self.file.write(bytes((END,)))
+
+    def close(self):
+        """Écrit l'empreinte de l'état final et ferme le fichier"""
+        if self.file is None:
+            return
+        self.file.write(bytes((DIGEST,)) + state_digest(self.game))
+        self.file.close()
+        self.file = None
+        self.game.recorder = None
+        print(f"✓ Session enregistrée: {self.path} ({os.path.getsize(self.path) / 1e3:.1f} Ko)")
+
+
+def read_records(data, offset=0):
+    """Décode les enregistrements : liste de (code, valeur)"""
+    records = []
+    size = len(data)
+    while offset < size:
+        code = data[offset]
+        record = RECORDS.get(code)
+        if record is None:
+            raise ValueError(f"code d'enregistrement inconnu {code} à l'octet {offset}")
+        values = record.unpack_from(data, offset + 1)
+        offset += 1 + record.size
+        if code in (TICK, SAMPLE):
+            values = ((values[0], values[1]), bool(values[2]))
+        elif code == KEY:
+            values = values[0].decode("ascii")
+        elif values:
+            values = values[0]
+        records.append((code, values))
+    return records
+
+
+class Replay:
+    """Rejoue un enregistrement sur un Game, sans écran"""
+
+    def __init__(self, header, records):
+        self.header = header
+        self.records = records
+        self._stream = None
+
+    @classmethod
+    def open(cls, path):
+        """Lit un fichier d'enregistrement (ValueError s'il est invalide)"""
+        with open(path, "rb") as f:
+            data = f.read()
+        try:
+            magic, header_size = RECORD_HEADER.unpack_from(data, 0)
+        except struct.error:
+            raise ValueError("fichier trop court")
+        if magic != RECORD_MAGIC:
+            raise ValueError("en-tête inconnu")
+        start = RECORD_HEADER.size
+        header = json.loads(data[start:start + header_size])
+        return cls(header, read_records(data, start + header_size))
+
+    def make_game(self, settings=None):
+        """Game dans l'état de début d'enregistrement (graine et paramètres de l'en-tête)"""
+        from game import Game
+
+        header = self.header
+        game = Game(header["width"], header["height"], settings=settings, rng=random.Random(header["seed"]),
+                    save_scores=False, max_entities=header["max_entities"], difficulty=header["difficulty"])
+        game.particles.rng = np.random.default_rng(header["seed"])
+        return game
+
+    def _tick(self, game):
+        """Source de la souris du jeu : position enregistrée pour ce pas"""
+        code, value = next(self._stream, (None, None))
+        if code != TICK:
+            raise ValueError(f"relecture désynchronisée au pas {game.steps} (code {code})")
+        return value
+
+    def play(self, game=None, realtime=False, display=None, dirty=True):
+        """
+        Rejoue toutes les entrées
+
+        Args:
+            game: Jeu à piloter, ou None pour make_game()
+            realtime: True pour respecter la durée enregistrée des images
+            display: Surface où dessiner chaque image, ou None pour la simulation seule
+            dirty: Rendu partiel (draw_dirty) plutôt que complet, si display
+
+        Returns:
+            Statistiques : temps des images, état final, empreinte identique ou non
+        """
+        if game is None:
+            game = self.make_game()
+        y_offset = self.header["y_offset"]
+        game.mouse_input = self._tick
+        self._stream = iter(self.records)
+
+        frame_times = []
+        recorded = None
+        elapsed = 0.0
+        start = time.perf_counter()
+        for code, value in self._stream:
+            if code == FRAME:
+                frame_start = time.perf_counter()
+                game.advance(value, y_offset)
+                if display is not None:
+                    if dirty:
+                        game.draw_dirty(display, y_offset)
+                    else:
+                        game.draw(display, y_offset)
+                frame_times.append(time.perf_counter() - frame_start)
+                if realtime:
+                    elapsed += value
+                    delay = start + elapsed - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+            elif code == SAMPLE:
+                game.blade.add(*value)
+            elif code == KEY:
+                game.queue_letter(value)
+            elif code == MODE:
+                game.set_game_mode(value)
+            elif code == START:
+                game.start_game()
+            elif code == END:
+                game.end_game()
+            elif code == DIGEST:
+                recorded = value
+            else:
+                raise ValueError(f"relecture désynchronisée au pas {game.steps} (code {code})")
+        wall_time = time.perf_counter() - start
+        game.mouse_input = None
+
+        times = np.asarray(frame_times or [0.0]) * 1000
+        p50, p90, p99 = np.percentile(times, [50, 90, 99])
+        return {
+            "frames": len(frame_times),
+            "steps": game.steps,
+            "wall_time": wall_time,
+            "frame_ms": {"p50": float(p50), "p90": float(p90), "p99": float(p99), "max": float(times.max())},
+            "score": game.score,
+            "lives": game.player_lives,
+            "items_spawned": game.items_spawned,
+            "items_sliced": game.items_sliced,
+            "identical": None if recorded is None else recorded == state_digest(game),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Relecture sans écran d'une session enregistrée")
+    parser.add_argument("path", help="Fichier d'enregistrement (main.py --record)")
+    parser.add_argument("--realtime", action="store_true", help="Respecter la durée des images")
+    parser.add_argument("--draw", choices=["none", "full", "dirty"], default="none",
+                        help="Dessiner chaque image (hors écran) pour mesurer le rendu")
+    args = parser.parse_args()
+
+    # Pilotes SDL factices : aucune fenêtre ni sortie audio
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    pygame.init()
+
+    try:
+        replay = Replay.open(args.path)
+    except (OSError, ValueError) as e:
+        print(f"⚠ Enregistrement {args.path} illisible: {e}")
+        sys.exit(1)
+
+    display = None
+    if args.draw != "none":
+        header = replay.header
+        # Écran factice à la taille du jeu : les images sont converties comme en partie
+        display = pygame.display.set_mode((header["width"], header["height"] + header["y_offset"]))
+    try:
+        stats = replay.play(realtime=args.realtime, display=display, dirty=args.draw == "dirty")
+    except ValueError as e:
+        # Le jeu ne réagit plus comme pendant l'enregistrement (règles ou physique modifiées)
+        print(f"⚠ {e}")
+        sys.exit(1)
+    print(json.dumps(stats, indent=2))
+    pygame.quit()
+    if stats["identical"] is False:
+        print("⚠ État final différent de l'enregistrement")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,17 @@
 import pygame
-import math
-import random
+import numpy as np
+from collections import OrderedDict
 from datetime import datetime
 from button_score import Button
+from fonts import fonts
+from score_log import get_score_log
 
 
 class Score:
     """Classe pour gérer l'affichage et la sauvegarde des scores avec un style Fruit Ninja"""
+
+    PARTICLE_COUNT = 30
+    ALPHA_LEVELS = 16  # Niveaux de transparence des sprites de particules
     
     def __init__(self):
         # Colors
@@ -23,126 +28,158 @@ class Score:
         self.SCORES_FILE = "scores.txt"
         
         # Animation variables
-        self.particles = []
+        self.particles = None
         self.wave_offset = 0
+        self.rng = np.random.default_rng()
+
+        # Fond pré-rendu par taille d'écran, sprites des particules par (couleur, rayon, alpha)
+        self.gradients = {}
+        self.particle_sprites = None
+
+        # Colonnes des lignes du tableau : (rang, contenu) -> [(texte rendu, x)]
+        self.row_cache = OrderedDict()
+        self.max_rows = 64
+        self.header_bg = None
+        self.row_bg = None
         
     def draw_title(self, screen, text, size, color):
         """Dessine un titre centré avec effet de style"""
         try:
-            font = pygame.font.Font('./images/comic.ttf', size)
+            font = fonts.font('./images/comic.ttf', size)
         except:
-            font = pygame.font.Font(None, size)
+            font = fonts.font(None, size)
         
-        title_surf = font.render(text, True, color)
+        title_surf = fonts.render(font, text, color)
         title_rect = title_surf.get_rect(center=(screen.get_width() // 2, 60))
         
         # Ombre
-        shadow_surf = font.render(text, True, (0, 0, 0))
+        shadow_surf = fonts.render(font, text, (0, 0, 0))
         shadow_rect = shadow_surf.get_rect(center=(screen.get_width() // 2 + 3, 63))
         screen.blit(shadow_surf, shadow_rect)
         
         # Titre
         screen.blit(title_surf, title_rect)
     
-    def create_particles(self, screen_width, screen_height):
-        """Crée des particules pour l'effet Fruit Ninja"""
-        particles = []
-        for _ in range(30):
-            # Générer une position aléatoire sur l'écran
-            x = random.uniform(0, screen_width)
-            y = random.uniform(0, screen_height)
-            
-            # Générer une vitesse aléatoire
-            speed_x = random.uniform(-2, 2)
-            speed_y = random.uniform(-2, 2)
-            
+    def create_particles(self, screen_width, screen_height, count=None):
+        """
+        Crée des particules pour l'effet Fruit Ninja
+
+        Returns:
+            Dictionnaire de tableaux NumPy (une ligne par particule) :
+            pos (x, y), speed, size, alpha, color (0 = orange, 1 = jaune)
+        """
+        count = self.PARTICLE_COUNT if count is None else count
+        rng = self.rng
+        return {
+            # Position et vitesse aléatoires
+            'pos': rng.uniform((0, 0), (screen_width, screen_height), (count, 2)),
+            'speed': rng.uniform(-2, 2, (count, 2)),
             # Taille et couleur aléatoires
-            size = random.uniform(2, 5)
-            color = self.ORANGE if random.random() > 0.5 else self.YELLOW
-            
-            particle = {
-                'x': [x, y],
-                'speed': [speed_x, speed_y],
-                'size': size,
-                'alpha': 255,
-                'color': color
-            }
-            particles.append(particle)
-        return particles
+            'size': rng.uniform(2, 5, count),
+            'alpha': np.full(count, 255, dtype=np.int16),
+            'color': (rng.random(count) <= 0.5).astype(np.intp),
+        }
     
     def update_particles(self, particles, screen_width, screen_height):
         """Met à jour les particules pour l'animation"""
-        for particle in particles:
-            particle['x'][0] += particle['speed'][0]
-            particle['x'][1] += particle['speed'][1]
-            particle['alpha'] = max(0, particle['alpha'] - 2)
-            
-            # Réinitialiser si hors écran ou invisible
-            if (particle['x'][0] < 0 or particle['x'][0] > screen_width or 
-                particle['x'][1] < 0 or particle['x'][1] > screen_height or 
-                particle['alpha'] <= 0):
-                particle['x'][0] = random.uniform(0, screen_width)
-                particle['x'][1] = random.uniform(0, screen_height)
-                particle['alpha'] = 255
-    
+        pos = particles['pos']
+        pos += particles['speed']
+        alpha = particles['alpha']
+        np.maximum(alpha - 2, 0, out=alpha)
+
+        # Réinitialiser si hors écran ou invisible
+        reset = ((pos[:, 0] < 0) | (pos[:, 0] > screen_width) |
+                 (pos[:, 1] < 0) | (pos[:, 1] > screen_height) | (alpha <= 0))
+        count = np.count_nonzero(reset)
+        if count:
+            pos[reset] = self.rng.uniform((0, 0), (screen_width, screen_height), (count, 2))
+            alpha[reset] = 255
+
+    def gradient(self, size):
+        """Dégradé de fond pour cette taille d'écran, calculé une seule fois"""
+        surface = self.gradients.get(size)
+        if surface is None:
+            screen_width, screen_height = size
+            progress = np.arange(screen_height) / screen_height
+            column = np.stack([20 + progress * 30, 20 + progress * 40, 40 + progress * 20], axis=1)
+            pixels = np.repeat(column.astype(np.uint8)[np.newaxis], screen_width, axis=0)
+            surface = pygame.surfarray.make_surface(pixels)
+            if pygame.display.get_surface():
+                surface = surface.convert()
+            self.gradients[size] = surface
+        return surface
+
+    def _build_particle_sprites(self):
+        """Un disque pré-rendu par (couleur, rayon, niveau d'alpha), indexé à plat"""
+        sprites = []
+        for color in (self.ORANGE, self.YELLOW):
+            for radius in range(2, 6):
+                for level in range(self.ALPHA_LEVELS):
+                    alpha = 255 * level // (self.ALPHA_LEVELS - 1)
+                    surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                    pygame.draw.circle(surf, color + (alpha,), (radius, radius), radius)
+                    sprites.append(surf)
+        return sprites
+
+    def preload(self):
+        """Prépare le tableau des scores hors de l'affichage : sprites et journal (thread de préchargement)"""
+        if self.particle_sprites is None:
+            self.particle_sprites = self._build_particle_sprites()
+        self.log.refresh()
+
     def draw_background(self, screen):
         """Dessine un fond style Fruit Ninja avec dégradé et particules"""
         screen_width, screen_height = screen.get_size()
         
         # Dégradé de fond
-        for y in range(screen_height):
-            progress = y / screen_height
-            r = int(20 + progress * 30)
-            g = int(20 + progress * 40)
-            b = int(40 + progress * 20)
-            pygame.draw.line(screen, (r, g, b), (0, y), (screen_width, y))
+        screen.blit(self.gradient((screen_width, screen_height)), (0, 0))
         
-        # Vagues décoratives
+        # Vagues décoratives : les trois courbes en un seul calcul
         self.wave_offset += 0.5
-        for i in range(3):
-            points = []
-            for x in range(0, screen_width + 10, 10):
-                y = screen_height // 2 + math.sin((x + self.wave_offset + i * 100) * 0.01) * (30 + i * 20)
-                points.append((x, y))
-            
-            if len(points) > 1:
+        waves = np.arange(3)[:, np.newaxis]
+        xs = np.arange(0, screen_width + 10, 10)
+        ys = (screen_height // 2 + np.sin((xs + self.wave_offset + waves * 100) * 0.01)
+              * (30 + waves * 20))
+        if len(xs) > 1:
+            for i in range(3):
+                points = np.column_stack((xs, ys[i])).tolist()
                 pygame.draw.lines(screen, (60 + i * 20, 70 + i * 20, 90 + i * 20), False, points, 2)
         
         # Dessiner les particules
-        for particle in self.particles:
-            if particle['alpha'] > 0:
-                surf = pygame.Surface((int(particle['size'] * 2), int(particle['size'] * 2)), pygame.SRCALPHA)
-                color_with_alpha = particle['color'] + (int(particle['alpha']),)
-                pygame.draw.circle(surf, color_with_alpha, 
-                                 (int(particle['size']), int(particle['size'])), 
-                                 int(particle['size']))
-                screen.blit(surf, (int(particle['x'][0] - particle['size']), 
-                                  int(particle['x'][1] - particle['size'])))
+        particles = self.particles
+        if particles is None:
+            return
+        if self.particle_sprites is None:
+            self.particle_sprites = self._build_particle_sprites()
+
+        visible = particles['alpha'] > 0
+        size = particles['size'][visible]
+        radius = np.clip(size.astype(np.intp), 2, 5)
+        level = -(-particles['alpha'][visible] * (self.ALPHA_LEVELS - 1) // 255)
+        sprite = (particles['color'][visible] * 4 + radius - 2) * self.ALPHA_LEVELS + level
+        corner = (particles['pos'][visible] - size[:, np.newaxis]).astype(np.intp)
+
+        sprites = self.particle_sprites
+        screen.blits([(sprites[i], (x, y)) for i, (x, y) in zip(sprite.tolist(), corner.tolist())], False)
     
+    @property
+    def log(self):
+        """Journal des scores (ajout seul + index trié) associé à SCORES_FILE"""
+        return get_score_log(self.SCORES_FILE)
+
     def load_scores(self):
-        """Charge les scores depuis le fichier scores.txt"""
+        """Retourne tous les scores triés, depuis l'index en mémoire (relu seulement si le fichier change)"""
         try:
-            with open(self.SCORES_FILE, "r", encoding="utf-8") as f:
-                scores = []
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        parts = line.split("|")
-                        if len(parts) >= 7:
-                            score_entry = {
-                                "player": parts[0],
-                                "mode": parts[1],  # Changé de "word" à "mode"
-                                "result": parts[2],
-                                "score": int(parts[3]),
-                                "attempts": int(parts[4]),
-                                "max_attempts": int(parts[5]),
-                                "date": parts[6],
-                                "timestamp": float(parts[7]) if len(parts) > 7 else 0
-                            }
-                            scores.append(score_entry)
-                return scores
-        except FileNotFoundError:
+            self.log.refresh()
+            return self.log.scores()
+        except Exception as e:
+            print(f"Erreur lors du chargement: {e}")
             return []
+
+    def top_scores(self, n, mode=None):
+        """Retourne les n meilleurs scores, tous modes confondus ou pour un mode ("Mode 1"...)"""
+        try:
+            return self.log.top(n, mode)
         except Exception as e:
             print(f"Erreur lors du chargement: {e}")
             return []
@@ -150,16 +187,13 @@ class Score:
     def save_all_scores(self, scores):
         """Sauvegarde tous les scores dans le fichier"""
         try:
-            with open(self.SCORES_FILE, "w", encoding="utf-8") as f:
-                for score in scores:
-                    line = f"{score['player']}|{score['mode']}|{score['result']}|{score['score']}|{score['attempts']}|{score['max_attempts']}|{score['date']}|{score['timestamp']}\n"
-                    f.write(line)
+            self.log.write_all(scores)
         except Exception as e:
             print(f"Erreur lors de la sauvegarde: {e}")
 
     def add_score(self, player_name, word, result, attempts, max_attempts, final_score=None):
         """
-        Ajoute un nouveau score à scores.txt
+        Ajoute un nouveau score à la fin de scores.txt et dans l'index trié
         
         Args:
             player_name: Nom du joueur
@@ -169,8 +203,6 @@ class Score:
             max_attempts: Nombre maximum d'erreurs autorisées
             final_score: Score final de la partie (NOUVEAU - obligatoire)
         """
-        scores = self.load_scores()
-        
         # Utiliser le score final passé en paramètre
         if final_score is not None:
             score_value = final_score  # On prend le score tel quel, même si c'est 0
@@ -192,25 +224,72 @@ class Score:
             "timestamp": datetime.now().timestamp()
         }
         
-        scores.append(new_score)
-        
-        # Trier par score décroissant, puis par date
-        scores.sort(key=lambda x: (-x["score"], -x["timestamp"]))
-        
-        # Sauvegarder dans le fichier
-        self.save_all_scores(scores)
+        # Ajout en fin de fichier + insertion triée dans l'index
+        try:
+            self.log.append(new_score)
+        except Exception as e:
+            print(f"Erreur lors de la sauvegarde: {e}")
+            return
         
         print(f"✓ Score sauvegardé: {player_name} - {word} - {result} - {score_value} points")
 
     def clear_scores(self):
         """Efface tous les scores du fichier"""
         try:
-            with open(self.SCORES_FILE, "w", encoding="utf-8") as f:
-                f.write("")
+            self.log.write_all([])
             print("Scores effacés")
         except Exception as e:
             print(f"Erreur lors de l'effacement: {e}")
 
+    def row_blits(self, rank, score_entry, font, x, y):
+        """
+        Blits d'une ligne du tableau (fond alterné + six colonnes) à la position (x, y)
+
+        Le fond et les textes sont dessinés directement sur l'écran : les bords
+        lissés des lettres se mélangent au vrai fond. Les colonnes (textes et
+        positions) sont en cache tant que le rang et le contenu ne changent pas.
+        """
+        date_value = score_entry["date"].split()[0]
+        key = (rank, score_entry["player"], score_entry["mode"], score_entry["result"],
+               score_entry["score"], date_value)
+        columns = self.row_cache.get(key)
+        if columns is not None:
+            self.row_cache.move_to_end(key)
+        else:
+            # Rank avec style
+            rank_color = self.YELLOW if rank < 3 else self.GRAY
+            # Mode avec couleur selon le mode
+            mode_value = score_entry["mode"]
+            mode_color = self.GREEN if "1" in mode_value else self.BLUE
+            # Couleur selon résultat
+            result_color = self.GREEN if score_entry["result"] == "WIN" else self.RED
+
+            # Colonnes (x relatif à la ligne) ; le score est TOUJOURS affiché, même si 0
+            columns = [
+                (fonts.render(font, text, color), column_x)
+                for text, color, column_x in (
+                    (f"#{rank+1}", rank_color, 10),
+                    (score_entry["player"][:12], self.WHITE, 60),
+                    (mode_value, mode_color, 200),
+                    (score_entry["result"], result_color, 300),
+                    (str(score_entry["score"]), self.YELLOW, 400),
+                    (date_value, self.GRAY, 500),
+                )
+            ]
+            self.row_cache[key] = columns
+            if len(self.row_cache) > self.max_rows:
+                self.row_cache.popitem(last=False)
+
+        blits = []
+        # Fond alterné pour les lignes avec effet semi-transparent
+        if rank % 2 == 0:
+            if self.row_bg is None:
+                self.row_bg = pygame.Surface((760, 32), pygame.SRCALPHA)
+                self.row_bg.fill((255, 255, 255, 10))
+            blits.append((self.row_bg, (x, y)))
+        blits += [(text, (x + column_x, y + 2)) for text, column_x in columns]
+        return blits
+
     def page_scores(self, screen, clock):
         """Affiche l'historique des scores en temps réel depuis scores.txt avec tous les effets"""
         
@@ -225,9 +304,14 @@ class Score:
         while True:
             pos = pygame.mouse.get_pos()
             
-            # Recharger les scores depuis le fichier à chaque frame
-            scores_data = self.load_scores()
-            max_scroll = max(0, len(scores_data) * 35 - 300)
+            # Scores depuis l'index : le fichier n'est relu que s'il a changé
+            try:
+                self.log.refresh()
+                total = self.log.count()
+            except Exception as e:
+                print(f"Erreur lors du chargement: {e}")
+                total = 0
+            max_scroll = max(0, total * 35 - 300)
             
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -255,25 +339,26 @@ class Score:
             self.draw_title(screen, "SCOREBOARD", 40, self.WHITE)
             
             # Afficher les scores
-            font = pygame.font.Font(None, 28)
+            font = fonts.font(None, 28)
             y_offset = 150
             
-            if not scores_data:
-                no_scores = font.render("No scores yet! Play to add scores.", True, self.GRAY)
+            if not total:
+                no_scores = fonts.render(font, "No scores yet! Play to add scores.", self.GRAY)
                 screen.blit(no_scores, (screen.get_width() // 2 - no_scores.get_width() // 2, 250))
             else:
                 # En-têtes du tableau avec fond semi-transparent
-                header_font = pygame.font.Font(None, 26)
-                header_bg = pygame.Surface((760, 30), pygame.SRCALPHA)
-                header_bg.fill((255, 255, 255, 30))
-                screen.blit(header_bg, (20, y_offset - 5))
+                header_font = fonts.font(None, 26)
+                if self.header_bg is None:
+                    self.header_bg = pygame.Surface((760, 30), pygame.SRCALPHA)
+                    self.header_bg.fill((255, 255, 255, 30))
+                screen.blit(self.header_bg, (20, y_offset - 5))
                 
-                rank_text = header_font.render("#", True, self.WHITE)
-                player_text = header_font.render("Player", True, self.WHITE)
-                mode_text = header_font.render("Mode", True, self.WHITE)
-                result_text = header_font.render("Result", True, self.WHITE)
-                score_text = header_font.render("Score", True, self.WHITE)
-                date_text = header_font.render("Date", True, self.WHITE)
+                rank_text = fonts.render(header_font, "#", self.WHITE)
+                player_text = fonts.render(header_font, "Player", self.WHITE)
+                mode_text = fonts.render(header_font, "Mode", self.WHITE)
+                result_text = fonts.render(header_font, "Result", self.WHITE)
+                score_text = fonts.render(header_font, "Score", self.WHITE)
+                date_text = fonts.render(header_font, "Date", self.WHITE)
                 
                 screen.blit(rank_text, (30, y_offset))
                 screen.blit(player_text, (80, y_offset))
@@ -288,52 +373,25 @@ class Score:
                 pygame.draw.line(screen, self.WHITE, (20, y_offset), (780, y_offset), 2)
                 y_offset += 10
                 
-                # Afficher chaque score
-                for i, score_entry in enumerate(scores_data):
-                    item_y = y_offset + (i * 35) - scroll_offset
-                    
-                    # Ne dessiner que si visible
-                    if item_y < y_offset - 40 or item_y > y_offset + 300:
-                        continue
-                    
-                    # Fond alterné pour les lignes avec effet semi-transparent
-                    if i % 2 == 0:
-                        row_bg = pygame.Surface((760, 32), pygame.SRCALPHA)
-                        row_bg.fill((255, 255, 255, 10))
-                        screen.blit(row_bg, (20, item_y - 2))
-                    
-                    # Rank avec style
-                    rank_color = self.YELLOW if i < 3 else self.GRAY
-                    rank = font.render(f"#{i+1}", True, rank_color)
-                    
-                    # Player
-                    player = font.render(score_entry["player"][:12], True, self.WHITE)
-                    
-                    # Mode avec couleur selon le mode
-                    mode_value = score_entry["mode"]
-                    mode_color = self.GREEN if "1" in mode_value else self.BLUE
-                    mode = font.render(mode_value, True, mode_color)
-                    
-                    # Couleur selon résultat
-                    result_color = self.GREEN if score_entry["result"] == "WIN" else self.RED
-                    result = font.render(score_entry["result"], True, result_color)
-                    
-                    # Score - TOUJOURS affiché, même si 0
-                    score_val = font.render(str(score_entry["score"]), True, self.YELLOW)
-                    
-                    # Date
-                    date = font.render(score_entry["date"].split()[0], True, self.GRAY)
-                    
-                    screen.blit(rank, (30, item_y))
-                    screen.blit(player, (80, item_y))
-                    screen.blit(mode, (220, item_y))
-                    screen.blit(result, (320, item_y))
-                    screen.blit(score_val, (420, item_y))
-                    screen.blit(date, (520, item_y))
+                # Ne lire et dessiner que les lignes visibles
+                # (item_y entre y_offset - 40 et y_offset + 300)
+                first = max(0, -((40 - scroll_offset) // 35))
+                last = (scroll_offset + 300) // 35
+                try:
+                    visible = self.log.page(first, last - first + 1)
+                except Exception as e:
+                    print(f"Erreur lors du chargement: {e}")
+                    visible = []
+
+                blits = []
+                for i, score_entry in enumerate(visible):
+                    blits += self.row_blits(first + i, score_entry, font,
+                                            20, y_offset + (first + i) * 35 - scroll_offset - 2)
+                screen.blits(blits, False)
                 
                 # Indicateur de scroll avec effet
                 if max_scroll > 0:
-                    info_text = font.render("Use mouse wheel to scroll", True, self.GRAY)
+                    info_text = fonts.render(font, "Use mouse wheel to scroll", self.GRAY)
                     screen.blit(info_text, (screen.get_width() // 2 - info_text.get_width() // 2, 470))
             
             # Boutons avec effets de survol
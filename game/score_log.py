@@ -0,0 +1,430 @@
+import bisect
+import heapq
+import itertools
+import os
+import struct
+import time
+import zlib
+from array import array
+
+# En-tête de l'index des lignes : magic, inode du fichier, crc32 de la dernière ligne
+# indexée, nombre de lignes, début de la dernière ligne indexée, octets indexés
+INDEX_MAGIC = b"FSIDX2\n"
+INDEX_HEADER = struct.Struct("<QIQQQ")
+
+
+def parse_score_line(line):
+    """Convertit une ligne 'player|mode|result|score|attempts|max|date|timestamp' en dict (ou None)"""
+    line = line.strip()
+    if not line:
+        return None
+    parts = line.split("|")
+    if len(parts) < 7:
+        return None
+    try:
+        return {
+            "player": parts[0],
+            "mode": parts[1],
+            "result": parts[2],
+            "score": int(parts[3]),
+            "attempts": int(parts[4]),
+            "max_attempts": int(parts[5]),
+            "date": parts[6],
+            "timestamp": float(parts[7]) if len(parts) > 7 else 0
+        }
+    except ValueError:
+        return None
+
+
+def format_score_line(score):
+    """Convertit un score (dict) en ligne du fichier"""
+    return (f"{score['player']}|{score['mode']}|{score['result']}|{score['score']}|"
+            f"{score['attempts']}|{score['max_attempts']}|{score['date']}|{score['timestamp']}\n")
+
+
+def sort_key(score):
+    """Ordre du classement : score décroissant, puis le plus récent d'abord"""
+    return (-score["score"], -score["timestamp"])
+
+
+class SortedScores:
+    """Liste de scores maintenue triée, avec insertion incrémentale"""
+
+    def __init__(self):
+        self.keys = []
+        self.entries = []
+
+    def insert(self, score):
+        key = sort_key(score)
+        index = bisect.bisect_right(self.keys, key)
+        self.keys.insert(index, key)
+        self.entries.insert(index, score)
+
+    def rebuild(self, scores):
+        self.entries = sorted(scores, key=sort_key)
+        self.keys = [sort_key(score) for score in self.entries]
+
+
+class ScoreLog:
+    """
+    Journal des scores en ajout seul, avec index trié en mémoire
+
+    Chaque partie ajoute une ligne à la fin du fichier ; l'index (global et
+    par mode) est mis à jour par insertion triée. Le fichier est réécrit
+    trié (compaction) seulement quand la partie non triée devient longue.
+
+    refresh() détecte les modifications faites par un autre processus
+    (mtime/taille) et ne relit que les octets ajoutés quand le fichier a
+    seulement grandi.
+
+    Un index des lignes (path + ".idx") donne la position de chaque ligne
+    du début du fichier dans l'ordre du classement. Il est écrit à chaque
+    compaction, et à la première ouverture d'un gros fichier sans index
+    (le fichier lui-même n'est alors pas modifié). Pour l'affichage
+    (count/page), le journal s'ouvre en lecture paresseuse : seules les
+    lignes ajoutées après l'index sont lues, et une page du classement est
+    obtenue en lisant quelques lignes indexées.
+    """
+
+    COMPACT_THRESHOLD = 256  # Lignes ajoutées avant réécriture triée
+    REFRESH_INTERVAL = 0.5  # Secondes minimum entre deux vérifications du fichier
+    INDEX_MIN_LINES = 2000  # En dessous, tout lire reste plus simple que l'index
+
+    def __init__(self, path):
+        self.path = path
+        self.loaded = False
+        self.all = SortedScores()
+        self.by_mode = {}
+        self.appended = 0  # Lignes ajoutées depuis la dernière compaction
+
+        # État du fichier à la dernière lecture : octets lus (lignes complètes), stat
+        self.offset = 0
+        self.file_state = None
+        self.last_check = 0.0
+
+        # Lecture paresseuse : position (début, longueur) des lignes indexées,
+        # dans l'ordre du classement, + lignes ajoutées après l'index
+        self.index_path = path + ".idx"
+        self.starts = None
+        self.lengths = None
+        self.tail = None
+
+    def _index(self, score):
+        if not self.loaded:
+            # Lecture paresseuse : seule la fin non indexée est en mémoire
+            self.tail.insert(score)
+            return
+        self.all.insert(score)
+        mode = self.by_mode.get(score["mode"])
+        if mode is None:
+            mode = self.by_mode[score["mode"]] = SortedScores()
+        mode.insert(score)
+
+    def _rebuild(self, scores):
+        self.all.rebuild(scores)
+        self.by_mode = {}
+        for score in self.all.entries:
+            mode = self.by_mode.get(score["mode"])
+            if mode is None:
+                mode = self.by_mode[score["mode"]] = SortedScores()
+            mode.entries.append(score)
+            mode.keys.append(sort_key(score))
+
+    def _stat(self):
+        """(inode, taille, mtime) du fichier, ou None s'il n'existe pas"""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _read_lines(self, offset):
+        """
+        Lit les lignes complètes à partir de offset
+
+        Returns:
+            ([(score, début, longueur)] dans l'ordre du fichier, nouvel offset)
+        """
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return [], 0
+        # Ignorer une dernière ligne incomplète (écriture en cours)
+        end = data.rfind(b"\n") + 1
+        lines = []
+        start = offset
+        for raw in data[:end].split(b"\n")[:-1]:
+            score = parse_score_line(raw.decode("utf-8", errors="replace"))
+            if score:
+                lines.append((score, start, len(raw) + 1))
+            start += len(raw) + 1
+        return lines, offset + end
+
+    def _read_from(self, offset):
+        """Lit les lignes complètes à partir de offset ; retourne (scores, nouvel offset)"""
+        lines, end = self._read_lines(offset)
+        return [score for score, _, _ in lines], end
+
+    def load(self):
+        """
+        Lit tout le fichier une fois et construit l'index
+
+        Returns:
+            Les lignes lues [(score, début, longueur)], dans l'ordre du fichier
+        """
+        self.file_state = self._stat()
+        lines, self.offset = self._read_lines(0)
+        self._rebuild([score for score, _, _ in lines])
+        self.appended = 0
+        self.loaded = True
+        self.starts = self.lengths = self.tail = None
+        self.last_check = time.monotonic()
+        return lines
+
+    def _write_index(self, lines, end):
+        """
+        Enregistre la position des lignes du fichier dans l'ordre du classement
+
+        Args:
+            lines: [(score, début, longueur)] de toutes les lignes avant end
+            end: Octets du fichier couverts par l'index
+        """
+        state = self._stat()
+        ranked = sorted(lines, key=lambda line: sort_key(line[0]))
+        starts = array("Q", [start for _, start, _ in ranked])
+        lengths = array("I", [length for _, _, length in ranked])
+
+        # La dernière ligne du fichier sert de contrôle : fichier réécrit ou non
+        last_start = checksum = 0
+        if lines:
+            last_start = max(starts)
+            with open(self.path, "rb") as f:
+                f.seek(last_start)
+                checksum = zlib.crc32(f.read(end - last_start))
+
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(INDEX_MAGIC)
+            f.write(INDEX_HEADER.pack(state[0], checksum, len(lines), last_start, end))
+            starts.tofile(f)
+            lengths.tofile(f)
+        os.replace(temp_path, self.index_path)
+
+    def _open_index(self):
+        """
+        Passe en lecture paresseuse si l'index des lignes correspond au fichier
+
+        Returns:
+            False si l'index est absent ou périmé (le fichier doit être lu en entier)
+        """
+        try:
+            with open(self.index_path, "rb") as f:
+                if f.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+                    return False
+                inode, checksum, count, last_start, end = INDEX_HEADER.unpack(f.read(INDEX_HEADER.size))
+                starts = array("Q")
+                starts.fromfile(f, count)
+                lengths = array("I")
+                lengths.fromfile(f, count)
+        except (OSError, EOFError, struct.error):
+            return False
+
+        # Même fichier (pas remplacé depuis l'index), lignes indexées intactes
+        state = self._stat()
+        if not state or state[0] != inode or state[1] < end:
+            return False
+        if count:
+            with open(self.path, "rb") as f:
+                f.seek(last_start)
+                if zlib.crc32(f.read(end - last_start)) != checksum:
+                    return False
+
+        self.loaded = False
+        self.starts = starts
+        self.lengths = lengths
+        self.tail = SortedScores()
+        self.file_state = state
+        scores, self.offset = self._read_from(end)
+        self.tail.rebuild(scores)
+        self.appended = len(scores)
+        self.last_check = time.monotonic()
+        return True
+
+    def open_view(self):
+        """Prépare count()/page() : index des lignes si possible, sinon lecture complète"""
+        if self.loaded or self.starts is not None:
+            return
+        if self._open_index():
+            return
+        lines = self.load()
+        # Gros fichier sans index valide : l'indexer tel quel pour les prochains lancements
+        if len(lines) >= self.INDEX_MIN_LINES:
+            try:
+                self._write_index(lines, self.offset)
+            except OSError:
+                pass  # Sans index, la prochaine ouverture lira tout le fichier
+
+    def count(self):
+        """Nombre total de scores"""
+        self.open_view()
+        if self.loaded:
+            return len(self.all.entries)
+        return len(self.starts) + len(self.tail.entries)
+
+    def page(self, start, count):
+        """Scores de rang start à start + count - 1 (tous modes), sans tout lire si possible"""
+        self.open_view()
+        if self.loaded:
+            return self.all.entries[start:start + count]
+
+        sorted_lines = len(self.starts)
+        tail = self.tail
+        if start >= sorted_lines + len(tail.entries) or count <= 0:
+            return []
+        if not sorted_lines:
+            return tail.entries[start:start + count]
+
+        # Au plus len(tail) scores de la fin non indexée précèdent le rang start :
+        # lire les lignes indexées à partir du rang start - len(tail) suffit
+        first = max(0, start - len(tail.entries))
+        last = min(sorted_lines, start + count)
+        lines = []
+        with open(self.path, "rb") as f:
+            for rank in range(first, last):
+                f.seek(self.starts[rank])
+                score = parse_score_line(f.read(self.lengths[rank]).decode("utf-8", errors="replace"))
+                if score:
+                    lines.append(score)
+        if not lines:
+            return []
+
+        # Rang (global) du premier élément fusionné
+        skipped_tail = bisect.bisect_left(tail.keys, sort_key(lines[0])) if first else 0
+        rank = first + skipped_tail
+        merged = heapq.merge(lines, tail.entries[skipped_tail:], key=sort_key)
+        return list(itertools.islice(merged, start - rank, start - rank + count))
+
+    def refresh(self, force=False):
+        """
+        Met à jour l'index si le fichier a changé depuis la dernière lecture
+
+        Returns:
+            True si l'index a changé
+        """
+        if not self.loaded and self.starts is None:
+            self.open_view()
+            return True
+
+        now = time.monotonic()
+        if not force and now - self.last_check < self.REFRESH_INTERVAL:
+            return False
+        self.last_check = now
+
+        state = self._stat()
+        if state == self.file_state:
+            return False
+
+        old = self.file_state
+        if state and old and state[0] == old[0] and state[1] > old[1] and old[1] >= self.offset:
+            # Le fichier a seulement grandi : ne lire que la fin
+            scores, self.offset = self._read_from(self.offset)
+            for score in scores:
+                self._index(score)
+            self.appended += len(scores)
+            self.file_state = state
+        elif self.loaded:
+            # Fichier remplacé, tronqué ou réécrit : relecture complète
+            self.load()
+        else:
+            self.starts = self.lengths = self.tail = None
+            self.open_view()
+        return True
+
+    def ensure_loaded(self):
+        if not self.loaded:
+            self.load()
+
+    def scores(self, mode=None):
+        """Tous les scores triés (ou ceux d'un mode) ; liste partagée, ne pas modifier"""
+        self.ensure_loaded()
+        if mode is None:
+            return self.all.entries
+        sorted_scores = self.by_mode.get(mode)
+        return sorted_scores.entries if sorted_scores else []
+
+    def top(self, n, mode=None):
+        """Les n meilleurs scores (tous modes ou un mode)"""
+        return self.scores(mode)[:n]
+
+    def append(self, score):
+        """Ajoute un score à la fin du fichier et dans l'index"""
+        # Intégrer d'abord les lignes ajoutées par d'autres processus
+        self.refresh(force=True)
+
+        line = format_score_line(score).encode("utf-8")
+        if self.file_state and self.file_state[1] > self.offset:
+            # Dernière ligne du fichier sans retour à la ligne : la terminer et l'indexer
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                tail = parse_score_line(f.read().decode("utf-8", errors="replace"))
+            if tail:
+                self._index(tail)
+            line = b"\n" + line
+        with open(self.path, "ab") as f:
+            f.write(line)
+        self._index(score)
+
+        # Notre propre ligne est déjà indexée : ne pas la relire
+        expected_size = (self.file_state[1] if self.file_state else 0) + len(line)
+        state = self._stat()
+        if state and state[1] == expected_size:
+            self.offset = expected_size
+            self.file_state = state
+
+        self.appended += 1
+        if self.appended >= self.COMPACT_THRESHOLD:
+            self.compact()
+
+    def compact(self):
+        """Réécrit le fichier dans l'ordre du classement"""
+        self.ensure_loaded()
+        self.write_all(self.all.entries)
+
+    def write_all(self, scores):
+        """Remplace tout le contenu du fichier (écriture atomique) et l'index"""
+        temp_path = self.path + ".tmp"
+        lines = []
+        offset = 0
+        with open(temp_path, "wb") as f:
+            for score in sorted(scores, key=sort_key):
+                line = format_score_line(score).encode("utf-8")
+                f.write(line)
+                lines.append((score, offset, len(line)))
+                offset += len(line)
+        os.replace(temp_path, self.path)
+        self._rebuild(scores)
+        self.appended = 0
+        self.loaded = True
+        self.starts = self.lengths = self.tail = None
+        self.file_state = self._stat()
+        self.offset = self.file_state[1] if self.file_state else 0
+
+        try:
+            self._write_index(lines, offset)
+        except OSError:
+            pass  # Sans index, la prochaine ouverture lira tout le fichier
+
+
+# Un journal par fichier, partagé par toutes les instances de Score
+_logs = {}
+
+
+def get_score_log(path):
+    """Retourne le journal (unique dans le processus) associé à ce fichier"""
+    key = os.path.abspath(path)
+    log = _logs.get(key)
+    if log is None:
+        log = _logs[key] = ScoreLog(path)
+    return log
@@ -1,5 +1,7 @@
 import pygame
 from pygame.locals import FULLSCREEN
+from assets import assets
+from audio import audio
 
 
 class Setting:
@@ -17,31 +19,64 @@ class Setting:
     VERT = (0, 200, 0)
     BLEU = (0, 100, 255)
     
-    def __init__(self):
-        # Paramètres de l'écran
+    def __init__(self, load_sounds=True):
+        """
+        Args:
+            load_sounds: False pour différer le chargement du son d'impact
+                         (load_audio, par exemple sur le thread de préchargement)
+        """
+        # Paramètres de l'écran : taille logique, celle à laquelle tout est dessiné
         self.screen_width = 800
-        self.screen_height = 600
+        self.screen_height = 580
         self.bg_color = self.BLANC
 
         # Option plein écran
         self.fullscreen = False
 
+        # Rendu partiel (partie et menus) : seules les zones modifiées sont envoyées à l'écran
+        self.dirty_rects = True
+
+        # Fréquence d'affichage : synchro verticale (cadence de l'écran) si le pilote
+        # l'accepte, et plafond en images par seconde (0 = aucun plafond logiciel)
+        self.vsync = True
+        self.max_fps = 144
+
         # Musique et sons
         self.music_file = "./musique/Swing De Chocobo (Final Fantasy Series).mp3"
         self.music_volume = 0.5  # Volume entre 0.0 et 1.0
         self.sound_volume = 0.7  # Volume des effets sonores
+        # Tampon du mixer en échantillons : plus petit = moins de latence, plus de risque de craquements
+        self.audio_buffer = 512
         
         # Son d'impact unique pour tous les éléments
         self.impact_sound_file = "./musique/impact (1).mp3"
         self.impact_sound = None
-        self.load_impact_sound()
+        if load_sounds:
+            self.load_impact_sound()
 
     def apply_screen(self):
-        """Retourne la surface de l'écran selon le mode plein écran."""
-        if self.fullscreen:
-            screen = pygame.display.set_mode((0, 0), FULLSCREEN)
-        else:
-            screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        """
+        Retourne la surface de l'écran selon le mode plein écran.
+
+        La surface garde toujours la taille logique ; SDL la met à l'échelle
+        (une seule fois, à la présentation) vers la fenêtre redimensionnable ou
+        le plein écran, et ramène la souris en coordonnées logiques.
+        """
+        size = (self.screen_width, self.screen_height)
+        flags = pygame.SCALED | (FULLSCREEN if self.fullscreen else pygame.RESIZABLE)
+        try:
+            try:
+                screen = pygame.display.set_mode(size, flags, vsync=int(self.vsync))
+            except pygame.error:
+                # Synchro verticale refusée : seul max_fps limite alors la cadence
+                if not self.vsync:
+                    raise
+                screen = pygame.display.set_mode(size, flags)
+        except pygame.error as e:
+            # Pas de rendu accéléré disponible : fenêtre à la taille logique, sans mise à l'échelle
+            if self.fullscreen:
+                print(f"⚠ Plein écran mis à l'échelle indisponible: {e}")
+            screen = pygame.display.set_mode(size)
         return screen
 
     def play_music(self):
@@ -55,6 +90,13 @@ class Setting:
                 print(f"Impossible de charger la musique: {e}")
                 print(f"Vérifiez que le fichier existe: {self.music_file}")
 
+    def load_audio(self):
+        """Charge le son d'impact puis lance la musique"""
+        self.load_impact_sound()
+        self.play_music()
+        if audio.measure_latency(runs=3) is not None:
+            print(f"✓ {audio.latency_text()}")
+
     def set_music_volume(self, volume):
         """Ajuste le volume de la musique."""
         self.music_volume = max(0.0, min(1.0, volume))
@@ -63,14 +105,15 @@ class Setting:
     def set_sound_volume(self, volume):
         """Ajuste le volume des effets sonores."""
         self.sound_volume = max(0.0, min(1.0, volume))
-        if self.impact_sound:
-            self.impact_sound.set_volume(self.sound_volume)
+        audio.set_volume("impact", self.sound_volume)
     
     def load_impact_sound(self):
         """Charge le son d'impact."""
         try:
-            self.impact_sound = pygame.mixer.Sound(self.impact_sound_file)
-            self.impact_sound.set_volume(self.sound_volume)
+            self.impact_sound = assets.sound(self.impact_sound_file)
+            # Quelques hauteurs et volumes différents, pour que les coupes en série ne sonnent pas pareil
+            audio.register("impact", self.impact_sound, "sfx", max_voices=4, volume=self.sound_volume,
+                           pitches=(0.9, 1.0, 1.12), gains=(0.8, 1.0))
             print(f"✓ Son d'impact chargé: {self.impact_sound_file}")
         except pygame.error as e:
             print(f"⚠ Impossible de charger le son d'impact: {e}")
@@ -80,4 +123,4 @@ class Setting:
     def play_impact_sound(self):
         """Joue le son d'impact."""
         if self.impact_sound:
-            self.impact_sound.play()
\ No newline at end of file
+            audio.play("impact")
\ No newline at end of file
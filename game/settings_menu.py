@@ -3,6 +3,9 @@ from pygame.locals import MOUSEBUTTONDOWN, MOUSEMOTION
 from slider import Slider
 from button_settings import Button
 from settings import Setting
+from assets import assets
+from fonts import fonts
+from widget import Label, draw_dirty
 
 class SettingsMenu:
     """Menu des paramètres avec curseurs audio et boutons."""
@@ -26,22 +29,22 @@ class SettingsMenu:
         # Paramètres locaux
         self.music_volume = settings.music_volume if settings else 0.5
         self.sound_volume = settings.sound_volume if settings else 0.7
-        self.fullscreen = False
+        self.fullscreen = settings.fullscreen if settings else False
         
         # Polices
         try:
-            self.font_title = pygame.font.Font('./images/comic.ttf', 64)
-            self.font_label = pygame.font.Font('./images/comic.ttf', 36)
-            self.font_button = pygame.font.Font('./images/comic.ttf', 32)
+            self.font_title = fonts.font('./images/comic.ttf', 64)
+            self.font_label = fonts.font('./images/comic.ttf', 36)
+            self.font_button = fonts.font('./images/comic.ttf', 32)
         except:
-            self.font_title = pygame.font.Font(None, 64)
-            self.font_label = pygame.font.Font(None, 36)
-            self.font_button = pygame.font.Font(None, 32)
+            self.font_title = fonts.font(None, 64)
+            self.font_label = fonts.font(None, 36)
+            self.font_button = fonts.font(None, 32)
         
         # Charger le fond
+        self.background_path = './images/572603.jpg'
         try:
-            bg_img = pygame.image.load('./images/572603.jpg')
-            self.background = pygame.transform.scale(bg_img, (width, height))
+            self.background = assets.image(self.background_path, (width, height), alpha=False)
         except:
             self.background = pygame.Surface((width, height))
             self.background.fill((50, 50, 50))
@@ -66,7 +69,7 @@ class SettingsMenu:
         # Bouton plein écran
         self.fullscreen_button = Button(
             center_x - 100, 420, 200, 50,
-            "Plein écran: OFF",
+            "Plein écran: " + ("ON" if self.fullscreen else "OFF"),
             self.font_button,
             self.VIOLET, self.ORANGE, self.BLANC
         )
@@ -78,6 +81,27 @@ class SettingsMenu:
             self.font_button,
             self.GRIS, self.GRIS_CLAIR, self.BLANC
         )
+        
+        # Libellés des volumes, re-rendus seulement quand la valeur affichée change
+        self.music_label = Label("", self.font_label, self.NOIR, (center_x - 150, 180))
+        self.sound_label = Label("", self.font_label, self.NOIR, (center_x - 150, 300))
+        self.update_labels()
+        
+        self.widgets = [
+            self.music_label, self.music_slider,
+            self.sound_label, self.sound_slider,
+            self.fullscreen_button, self.back_button,
+        ]
+        
+        # Fond + voile + titre, pré-composés pour une taille d'écran
+        self.static_layer = None
+        self.static_size = None
+        self.full_redraw = True  # Prochain draw_dirty : tout l'écran
+
+    def update_labels(self):
+        """Textes des volumes affichés"""
+        self.music_label.text = f"Musique: {int(self.music_slider.value * 100)}%"
+        self.sound_label.text = f"Son d'impact: {int(self.sound_slider.value * 100)}%"
 
     def set_music_volume(self, volume):
         """VOLUME MUSIQUE RÉEL - change IMMÉDIATEMENT"""
@@ -99,52 +123,80 @@ class SettingsMenu:
         # Curseurs  SYNCHRO MANUELLE (pas de callback)
         if self.music_slider.handle_event(event):
             self.set_music_volume(self.music_slider.value)
+            self.update_labels()
             
         if self.sound_slider.handle_event(event):
             self.set_sound_volume(self.sound_slider.value)
+            self.update_labels()
             
         # Boutons
         if self.fullscreen_button.handle_event(event):
             self.fullscreen = not self.fullscreen
             self.fullscreen_button.text = "Plein écran: " + ("ON" if self.fullscreen else "OFF")
+            if self.settings:
+                self.settings.fullscreen = self.fullscreen
+            # L'écran doit être rouvert par la boucle principale (Setting.apply_screen)
+            return "FULLSCREEN"
             
         if self.back_button.handle_event(event):
             return "BACK"
         
         return None
 
-    def draw(self, screen):
-        """Dessine le menu des paramètres."""
+    def build_static_layer(self, size):
+        """Pré-compose le fond, le voile et le titre pour cette taille d'écran"""
+        layer = pygame.Surface(size)
+        
         # Fond
-        screen.blit(self.background, (0, 0))
+        background = self.background
+        if background.get_size() != size:
+            try:
+                background = assets.image(self.background_path, size, alpha=False)
+            except:
+                background = pygame.transform.scale(self.background, size)
+        layer.blit(background, (0, 0))
         
         # Overlay semi-transparent
-        overlay = pygame.Surface((self.width, self.height))
+        overlay = pygame.Surface(size)
         overlay.set_alpha(200)
         overlay.fill(self.BLANC)
-        screen.blit(overlay, (0, 0))
+        layer.blit(overlay, (0, 0))
         
         # Titre
-        title = self.font_title.render("PARAMÈTRES", True, self.ORANGE)
-        title_rect = title.get_rect(center=(self.width // 2, 80))
-        screen.blit(title, title_rect)
-        
-        # Musique
-        music_label = self.font_label.render(
-            f"Musique: {int(self.music_slider.value * 100)}%",
-            True, self.NOIR
-        )
-        screen.blit(music_label, (self.width // 2 - 150, 180))
-        self.music_slider.draw(screen)
-        
-        # Effets sonores (son d'impact)
-        sound_label = self.font_label.render(
-            f"Son d'impact: {int(self.sound_slider.value * 100)}%",
-            True, self.NOIR
-        )
-        screen.blit(sound_label, (self.width // 2 - 150, 300))
-        self.sound_slider.draw(screen)
-        
-        # Boutons
-        self.fullscreen_button.draw(screen)
-        self.back_button.draw(screen)
\ No newline at end of file
+        title = fonts.render(self.font_title, "PARAMÈTRES", self.ORANGE)
+        title_rect = title.get_rect(center=(size[0] // 2, 80))
+        layer.blit(title, title_rect)
+        
+        if pygame.display.get_surface():
+            layer = layer.convert()
+        self.static_layer = layer
+        self.static_size = size
+
+    def draw(self, screen):
+        """Dessine le menu des paramètres."""
+        # Fond, voile et titre en une seule surface
+        if self.static_size != screen.get_size():
+            self.build_static_layer(screen.get_size())
+        screen.blit(self.static_layer, (0, 0))
+        
+        # Libellés, curseurs et boutons (surfaces en cache)
+        for widget in self.widgets:
+            widget.draw(screen)
+        self.full_redraw = False
+
+    def invalidate(self):
+        """Force un rendu complet au prochain draw_dirty (l'écran a été recouvert)"""
+        self.full_redraw = True
+
+    def draw_dirty(self, screen):
+        """
+        Comme draw, mais ne redessine que les widgets qui ont changé
+
+        Returns:
+            Liste des rectangles modifiés, à passer à pygame.display.update
+        """
+        if self.full_redraw or self.static_size != screen.get_size():
+            self.draw(screen)
+            return [screen.get_rect()]
+        
+        return draw_dirty(screen, self.static_layer, self.widgets)
@@ -0,0 +1,217 @@
+"""
+Simulation de parties sans écran, pour régler le jeu hors ligne
+
+Exemple :
+    python game/simulator.py --games 2000 --mode 1 --set GRAVITY=1.5 --set SPAWN_DELAY=10
+    python game/simulator.py --games 500 --set difficulty='"hard"'
+"""
+import argparse
+import ast
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+# Pilotes SDL factices : aucune fenêtre ni sortie audio
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from entities import KIND_BOMB
+from game import Game
+
+
+class GreedyBot:
+    """Bot qui vise toujours l'élément le plus bas (le plus urgent) en évitant la bombe"""
+
+    def __init__(self, rng, skill=0.8):
+        self.rng = rng
+        self.skill = skill  # Probabilité d'agir à chaque pas
+        self.position = (0, 0)
+
+    def _target(self, game):
+        """Index du fruit en l'air le plus bas, ou None"""
+        data = game.data
+        n = data.count
+        candidates = np.flatnonzero(data.throw[:n] & ~data.hit[:n] & (data.kind[:n] != KIND_BOMB))
+        if not len(candidates):
+            return None
+        return candidates[np.argmax(data.y[candidates])]
+
+    def mouse(self, game):
+        """MODE 1: Position et bouton de la souris pour ce pas"""
+        target = self._target(game)
+        if target is None or self.rng.random() > self.skill:
+            return self.position, False
+
+        data = game.data
+        size = data.size[target]
+        goal = (data.x[target] + size / 2, data.y[target] + size / 2)
+
+        # Lever la lame si le trajet direct traverse la bombe
+        path = np.array([[self.position[0], self.position[1], goal[0], goal[1]]])
+        crossed = game.data.sweep_test(path)
+        pressed = not np.any(data.kind[crossed] == KIND_BOMB)
+
+        self.position = goal
+        return goal, pressed
+
+    def keys(self, game):
+        """MODE 2: Lettres tapées pendant ce pas"""
+        target = self._target(game)
+        if target is None or self.rng.random() > self.skill:
+            return []
+        letter = game.data.assigned_letter[target]
+        return [letter] if letter else []
+
+
+class RandomBot:
+    """Bot qui coupe et tape au hasard (référence basse)"""
+
+    def __init__(self, rng, skill=0.5):
+        self.rng = rng
+        self.skill = skill
+
+    def mouse(self, game):
+        position = (self.rng.uniform(0, game.WIDTH), self.rng.uniform(0, game.HEIGHT))
+        return position, self.rng.random() < self.skill
+
+    def keys(self, game):
+        if self.rng.random() < self.skill:
+            return [self.rng.choice(game.letters)]
+        return []
+
+
+POLICIES = {
+    "greedy": GreedyBot,
+    "random": RandomBot,
+}
+
+
+def _init_worker():
+    """Initialise pygame (sans écran) dans chaque processus"""
+    pygame.init()
+
+
+def simulate_game(seed, mode=1, policy="greedy", duration=90, params=None):
+    """
+    Joue une partie complète sans écran
+
+    Args:
+        seed: Graine de la partie (jeu et bot)
+        mode: Mode de jeu (1 ou 2)
+        policy: Nom du bot ("greedy" ou "random")
+        duration: Durée maximale de la partie (secondes de jeu)
+        params: Attributs de Game à remplacer, ex: {"GRAVITY": 1.5}
+
+    Returns:
+        Dictionnaire des statistiques de la partie
+    """
+    if not pygame.get_init():
+        _init_worker()
+
+    game = Game(800, 500, rng=random.Random(seed), save_scores=False)
+    for name, value in (params or {}).items():
+        setattr(game, name, value)
+    # Pas de simulation dérivé de FPS dans Game.__init__ : le recalculer si FPS est remplacé
+    game.SIM_STEP = 1 / game.FPS
+
+    bot = POLICIES[policy](random.Random(seed + 1))
+    game.mouse_input = bot.mouse
+    game.set_game_mode(mode)
+    game.start_game()
+
+    max_steps = int(duration * game.FPS)
+    while game.steps < max_steps and not game.is_game_over():
+        if mode == 2:
+            for letter in bot.keys(game):
+                game.queue_letter(letter)
+        game.update()
+    game.end_game()
+
+    survival = game.steps * game.SIM_STEP
+    return {
+        "seed": seed,
+        "score": game.score,
+        "won": game.player_lives > 0,
+        "survival_time": survival,
+        "items_spawned": game.items_spawned,
+        "items_sliced": game.items_sliced,
+        "items_per_second": game.items_spawned / survival if survival else 0.0,
+    }
+
+
+def _distribution(values):
+    """Résumé statistique d'une série de valeurs"""
+    values = np.asarray(values, dtype=np.float64)
+    p10, p50, p90 = np.percentile(values, [10, 50, 90])
+    return {
+        "mean": float(values.mean()),
+        "std": float(values.std()),
+        "min": float(values.min()),
+        "p10": float(p10),
+        "median": float(p50),
+        "p90": float(p90),
+        "max": float(values.max()),
+    }
+
+
+def run_batch(games, base_seed=0, workers=None, mode=1, policy="greedy", duration=90, params=None):
+    """
+    Répartit games parties (graines base_seed..base_seed+games-1) sur un pool de processus
+
+    Returns:
+        Statistiques agrégées : survie, distribution des scores, éléments par seconde
+    """
+    seeds = range(base_seed, base_seed + games)
+    run = partial(simulate_game, mode=mode, policy=policy, duration=duration, params=params)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        results = list(pool.map(run, seeds, chunksize=max(1, games // (4 * (workers or os.cpu_count() or 1)))))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "games": games,
+        "mode": mode,
+        "policy": policy,
+        "params": {name: repr(value) for name, value in (params or {}).items()},
+        "win_rate": sum(r["won"] for r in results) / games,
+        "survival_time": _distribution([r["survival_time"] for r in results]),
+        "score": _distribution([r["score"] for r in results]),
+        "items_per_second": _distribution([r["items_per_second"] for r in results]),
+        "wall_time": elapsed,
+        "games_per_minute": games / elapsed * 60 if elapsed else 0.0,
+    }
+
+
+def _parse_param(text):
+    """Convertit 'NOM=valeur' en (NOM, valeur Python)"""
+    name, _, value = text.partition("=")
+    return name.strip(), ast.literal_eval(value.strip())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulation de parties sans écran")
+    parser.add_argument("--games", type=int, default=1000, help="Nombre de parties")
+    parser.add_argument("--seed", type=int, default=0, help="Première graine")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus")
+    parser.add_argument("--mode", type=int, choices=[1, 2], default=1)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("--duration", type=float, default=90, help="Durée d'une partie (s)")
+    parser.add_argument("--set", dest="params", action="append", default=[], type=_parse_param,
+                        metavar="NOM=VALEUR", help="Attribut de Game à remplacer (répétable)")
+    args = parser.parse_args()
+
+    stats = run_batch(args.games, args.seed, args.workers, args.mode,
+                      args.policy, args.duration, dict(args.params))
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
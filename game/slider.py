@@ -1,12 +1,13 @@
 import pygame
 from pygame.locals import MOUSEBUTTONDOWN, MOUSEMOTION
+from widget import Widget
 
 
-class Slider:
+class Slider(Widget):
     """Widget de curseur pour ajuster les valeurs."""
     
     def __init__(self, x, y, width, height, min_val, max_val, initial_val, color, handle_color):
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__((x, y, width, height))
         self.min_val = min_val
         self.max_val = max_val
         self.value = initial_val
@@ -42,10 +43,21 @@ class Slider:
             return True
         return False
     
-    def draw(self, screen):
-        """Dessine le curseur."""
+    def bounds(self):
+        """La poignée dépasse de la barre de 10 px sur les côtés et 5 px en haut et en bas."""
+        return self.rect.inflate(20, 10)
+    
+    def content_key(self):
+        return self.handle.x
+    
+    def render(self, state):
+        """Rend le curseur."""
+        bounds = self.bounds()
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
         # Barre de fond
-        pygame.draw.rect(screen, self.color, self.rect, border_radius=5)
+        pygame.draw.rect(surface, self.color, self.rect.move(-bounds.x, -bounds.y), border_radius=5)
         # Curseur
-        pygame.draw.rect(screen, self.handle_color, self.handle, border_radius=5)
-        pygame.draw.rect(screen, (0, 0, 0), self.handle, 2, border_radius=5)
\ No newline at end of file
+        handle = self.handle.move(-bounds.x, -bounds.y)
+        pygame.draw.rect(surface, self.handle_color, handle, border_radius=5)
+        pygame.draw.rect(surface, (0, 0, 0), handle, 2, border_radius=5)
+        return surface
\ No newline at end of file
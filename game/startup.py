@@ -0,0 +1,90 @@
+import threading
+import time
+
+
+class StartupReport:
+    """
+    Temps passé dans chaque étape du démarrage (option --startup-report)
+
+    Désactivé, chaque appel se limite à un test de booléen.
+    """
+
+    def __init__(self, enabled=False, start=None):
+        self.enabled = enabled
+        # (étape, secondes), dans l'ordre
+        self.steps = []
+        self._last = start if start is not None else time.perf_counter()
+
+    def mark(self, step):
+        """Clôt l'étape en cours (depuis la marque précédente)"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.steps.append((step, now - self._last))
+        self._last = now
+
+    def measure(self, step, build, *args, **kwargs):
+        """Appelle build(*args, **kwargs) et enregistre sa durée sous le nom step"""
+        if self.enabled:
+            self._last = time.perf_counter()
+        result = build(*args, **kwargs)
+        self.mark(step)
+        return result
+
+    def print(self, title="Démarrage", extra=()):
+        """Affiche les étapes mesurées, puis les lignes (étape, secondes) supplémentaires"""
+        if not self.enabled:
+            return
+        print(f"=== {title} ===")
+        for step, seconds in list(self.steps) + list(extra):
+            print(f"  {step:<36} {seconds * 1000:8.1f} ms")
+        total = sum(seconds for _, seconds in self.steps)
+        print(f"  {'total':<36} {total * 1000:8.1f} ms")
+        self.steps.clear()
+
+
+class Preloader:
+    """
+    Exécute des tâches de chargement (décodage d'images, sons) sur un thread
+
+    Le thread principal continue d'afficher le menu ; wait() sert de point de
+    rendez-vous pour les scènes qui ont besoin des ressources. Une tâche qui
+    échoue est signalée puis ignorée : le constructeur de la scène chargera
+    (ou remplacera) la ressource lui-même.
+    """
+
+    def __init__(self, tasks):
+        # (nom, fonction sans argument)
+        self.tasks = list(tasks)
+        # (nom, secondes) des tâches terminées, lu par StartupReport
+        self.timings = []
+        self._done = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Lance le thread de chargement ; retourne self"""
+        self._thread = threading.Thread(target=self._run, name="preload", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            for name, task in self.tasks:
+                start = time.perf_counter()
+                try:
+                    task()
+                except Exception as e:
+                    print(f"⚠ Préchargement de {name} impossible: {e}")
+                self.timings.append((name, time.perf_counter() - start))
+        finally:
+            self._done.set()
+
+    def done(self):
+        """True quand toutes les tâches sont terminées"""
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """Attend la fin du chargement ; retourne True s'il est terminé"""
+        if self._thread is None:
+            self.start()
+        return self._done.wait(timeout)
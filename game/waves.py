@@ -0,0 +1,142 @@
+"""
+Vagues de lancement : qui est lancé, combien à la fois, et à quel rythme
+
+Une chronologie est une liste de vagues (délai, éléments) jouée en boucle :
+le délai est le nombre de pas de simulation depuis la vague précédente
+(None : Game.SPAWN_DELAY), et chaque élément est un nom de groupe :
+
+    "any"    : tous les éléments du mode, à tour de rôle
+    "fruit"  : les fruits seulement
+    "bomb", "ice_cube2", "melon"... : cet élément (en Mode 2, ses variantes
+                                      à lettre, "melon_A", "melon_E"...)
+"""
+from entities import KIND_FRUIT, kind_of
+
+
+# Éléments du même type en l'air au plus, par difficulté (None : pas de limite)
+MAX_PER_ITEM = {
+    "normal": 1,
+    "hard": None,
+    "extreme": None,
+}
+
+# Chronologies par difficulté
+TIMELINES = {
+    # Un élément à la fois, tous les SPAWN_DELAY pas, un seul de chaque type (le rythme d'origine)
+    "normal": [
+        (None, ("any",)),
+    ],
+    # Paires de fruits et salves régulières de 5 fruits avec une bombe
+    "hard": [
+        (10, ("fruit", "fruit")),
+        (10, ("any",)),
+        (12, ("fruit", "bomb")),
+        (18, ("fruit",) * 5 + ("bomb",)),
+        (10, ("ice_cube2", "fruit")),
+    ],
+    # Plusieurs dizaines d'éléments en l'air
+    "extreme": [
+        (6, ("fruit",) * 3),
+        (6, ("any", "fruit")),
+        (12, ("fruit",) * 8 + ("bomb", "bomb")),
+        (6, ("fruit",) * 4 + ("ice_cube2",)),
+        (14, ("fruit",) * 12 + ("bomb",) * 3),
+    ],
+}
+
+
+class WaveScheduler:
+    """
+    Déroule une chronologie de vagues, sans allocation pendant la partie
+
+    Les groupes sont résolus une fois en tuples de clés ; chaque vague est un
+    tuple d'index de groupe, et pick() fait tourner un curseur par groupe.
+    """
+
+    def __init__(self, timeline, items, max_per_item=None):
+        """
+        Args:
+            timeline: Liste de (délai en pas ou None, noms de groupes)
+            items: Clés des éléments du mode ('melon', 'bomb', 'melon_A'...)
+            max_per_item: Éléments du même type en l'air au plus, ou None
+        """
+        self.max_per_item = max_per_item
+        self.group_keys = []
+        self.cursors = []
+        names = {}
+        self.waves = []
+        for delay, members in timeline:
+            wave = []
+            for name in members:
+                if name not in names:
+                    keys = self._resolve(name, items)
+                    if not keys:
+                        continue  # Groupe absent de ce mode
+                    names[name] = len(self.group_keys)
+                    self.group_keys.append(keys)
+                    self.cursors.append(0)
+                wave.append(names[name])
+            self.waves.append((delay, tuple(wave)))
+
+        self.position = 0
+        self.timer = 0
+
+    @staticmethod
+    def _resolve(name, items):
+        """Clés des éléments d'un groupe, dans l'ordre du mode"""
+        if name == "any":
+            return tuple(items)
+        if name == "fruit":
+            return tuple(key for key in items if kind_of(key) == KIND_FRUIT)
+        return tuple(key for key in items if key == name or key.startswith(name + '_'))
+
+    def reset(self):
+        """Reprend la chronologie au début"""
+        self.position = 0
+        self.timer = 0
+        for i in range(len(self.cursors)):
+            self.cursors[i] = 0
+
+    def tick(self, default_delay):
+        """
+        Avance d'un pas de simulation
+
+        Args:
+            default_delay: Délai des vagues sans délai propre (Game.SPAWN_DELAY)
+
+        Returns:
+            Tuple des groupes de la vague à lancer maintenant, ou None. La vague
+            reste due (retournée à chaque pas) jusqu'à l'appel de fired().
+        """
+        if not self.waves:
+            return None
+        self.timer += 1
+        delay, wave = self.waves[self.position]
+        if self.timer < (default_delay if delay is None else delay):
+            return None
+        return wave
+
+    def fired(self):
+        """Vague lancée (au moins un élément) : passe à la suivante et relance le délai"""
+        self.timer = 0
+        self.position = (self.position + 1) % len(self.waves)
+
+    def pick(self, group, live):
+        """
+        Prochaine clé du groupe (à tour de rôle), en sautant les types à leur limite
+
+        Args:
+            live: Type -> nombre d'éléments en l'air (EntityStore.live)
+
+        Returns:
+            La clé, ou None si tous les types du groupe sont à leur limite
+        """
+        keys = self.group_keys[group]
+        cursor = self.cursors[group]
+        for _ in range(len(keys)):
+            key = keys[cursor]
+            cursor = (cursor + 1) % len(keys)
+            if self.max_per_item is None or live.get(key, 0) < self.max_per_item:
+                self.cursors[group] = cursor
+                return key
+        return None
@@ -0,0 +1,175 @@
+import abc
+
+import pygame
+
+from fonts import fonts
+
+
+class Widget(abc.ABC):
+    """
+    Base des widgets en mode retenu (boutons, curseurs, textes)
+
+    Chaque état visuel ("normal", "hover", "pressed") est rendu une seule fois
+    dans une surface en cache. Le cache est vidé quand le contenu (texte,
+    position du curseur...) change, et le widget sait s'il doit être redessiné
+    depuis son dernier affichage (draw_dirty).
+    """
+
+    # Nombre de rendus réels (hors cache), tous widgets confondus, lu par le profileur
+    renders = 0
+
+    def __init__(self, rect):
+        self.rect = pygame.Rect(rect)
+        self.hovered = False
+        self.pressed = False
+
+        # État visuel -> surface, valable pour le contenu self.content
+        self.surfaces = {}
+        self.content = None
+        # Zone couverte par le dernier rendu, si elle dépasse rect (texte plus large)
+        self.area = None
+        # (contenu, état) et zone à l'écran, drawn = None : à redessiner
+        self.drawn = None
+        self.drawn_bounds = None
+
+    def content_key(self):
+        """Ce qui détermine le rendu en dehors de l'état visuel (à redéfinir)"""
+        return None
+
+    @abc.abstractmethod
+    def render(self, state):
+        """Rend le widget dans l'état donné, en coordonnées locales à bounds()"""
+
+    def bounds(self):
+        """Zone de l'écran couverte par le rendu"""
+        return self.area or self.rect
+
+    def render_box(self, color, border_color, border_width, radius, content=None):
+        """
+        Rend un rectangle arrondi avec bordure et un contenu centré (texte, icône)
+
+        Le contenu peut déborder du rectangle : la surface rendue couvre les deux.
+        """
+        area = self.rect
+        if content is not None:
+            content_rect = content.get_rect(center=self.rect.center)
+            area = self.rect.union(content_rect)
+        surface = pygame.Surface(area.size, pygame.SRCALPHA)
+        box = self.rect.move(-area.x, -area.y)
+        pygame.draw.rect(surface, color, box, border_radius=radius)
+        pygame.draw.rect(surface, border_color, box, border_width, border_radius=radius)
+        if content is not None:
+            surface.blit(content, content_rect.move(-area.x, -area.y))
+        self.area = area
+        return surface
+
+    def visual_state(self):
+        if self.pressed:
+            return "pressed"
+        if self.hovered:
+            return "hover"
+        return "normal"
+
+    def update_hover(self, pos):
+        """Met à jour le survol ; retourne True si le widget vient d'être survolé"""
+        hovered = self.rect.collidepoint(pos)
+        entered = hovered and not self.hovered
+        self.hovered = hovered
+        return entered
+
+    def surface(self):
+        """Surface de l'état courant, rendue seulement si elle n'est pas en cache"""
+        content = self.content_key()
+        if content != self.content:
+            self.surfaces.clear()
+            self.content = content
+        state = self.visual_state()
+        surface = self.surfaces.get(state)
+        if surface is None:
+            surface = self.surfaces[state] = self.render(state)
+            Widget.renders += 1
+        return surface
+
+    def draw(self, screen):
+        """Dessine le widget ; retourne la zone modifiée"""
+        surface = self.surface()
+        bounds = self.bounds()
+        screen.blit(surface, bounds)
+        self.drawn = (self.content, self.visual_state())
+        self.drawn_bounds = bounds.copy()
+        return bounds
+
+    def needs_redraw(self):
+        return self.drawn != (self.content_key(), self.visual_state())
+
+    def invalidate(self):
+        """Force le prochain draw_dirty à redessiner le widget"""
+        self.drawn = None
+
+
+def draw_dirty(screen, background, widgets):
+    """
+    Redessine les widgets qui ont changé depuis leur dernier affichage
+
+    Chaque zone modifiée (ancienne et nouvelle position du widget) est
+    restaurée depuis le fond, puis tous les widgets qui la touchent y sont
+    redessinés dans l'ordre, pour les widgets qui se chevauchent.
+
+    Args:
+        background: Surface (à la taille de l'écran) à restaurer sous les widgets
+        widgets: Widgets dans l'ordre de dessin
+
+    Returns:
+        Liste des zones modifiées (vide si rien n'a changé)
+    """
+    dirty = []
+    for widget in widgets:
+        if widget.needs_redraw():
+            # L'ancienne zone peut dépasser de la nouvelle (curseur déplacé, texte raccourci)
+            old = widget.drawn_bounds
+            widget.surface()
+            dirty.append(widget.bounds().union(old) if old else widget.bounds().copy())
+
+    clip = screen.get_clip()
+    for area in dirty:
+        screen.set_clip(area)
+        screen.blit(background, area, area)
+        for widget in widgets:
+            widget.surface()
+            if widget.bounds().colliderect(area):
+                widget.draw(screen)
+    screen.set_clip(clip)
+    return dirty
+
+
+class Label(Widget):
+    """Texte statique, rendu seulement quand il change"""
+
+    def __init__(self, text, font, color, pos):
+        super().__init__((pos, (0, 0)))
+        self.text = text
+        self.font = font
+        self.color = color
+
+    def content_key(self):
+        return (self.text, self.color)
+
+    def render(self, state):
+        surface = fonts.render(self.font, self.text, self.color)
+        self.rect.size = surface.get_size()
+        return surface
+
+
+class IconButton(Widget):
+    """Bouton carré arrondi avec une icône centrée"""
+
+    def __init__(self, rect, icon, color, hover_color, border_color=(255, 255, 255)):
+        super().__init__(rect)
+        self.icon = icon
+        self.color = color
+        self.hover_color = hover_color
+        self.border_color = border_color
+
+    def render(self, state):
+        color = self.color if state == "normal" else self.hover_color
+        return self.render_box(color, self.border_color, 3, 10, self.icon)
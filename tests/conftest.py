@@ -0,0 +1,35 @@
+"""
+Configuration commune des tests (lancer depuis la racine du dépôt : python -m pytest)
+"""
+import os
+import sys
+
+import pytest
+
+# Pilotes SDL factices : aucune fenêtre ni sortie audio
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Les modules du jeu s'importent par leur nom (comme depuis game/main.py)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GAME_DIR = os.path.join(ROOT_DIR, "game")
+if GAME_DIR not in sys.path:
+    sys.path.insert(0, GAME_DIR)
+
+
+@pytest.fixture(scope="session")
+def pygame_ready():
+    """
+    pygame initialisé, depuis la racine du dépôt (chemins ./images, ./musique)
+
+    Une seule fois par session : les polices et images mises en cache par
+    les modules du jeu ne survivent pas à pygame.quit().
+    """
+    import pygame
+
+    cwd = os.getcwd()
+    os.chdir(ROOT_DIR)
+    pygame.init()
+    yield pygame
+    pygame.quit()
+    os.chdir(cwd)
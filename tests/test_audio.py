@@ -0,0 +1,78 @@
+"""
+AudioManager : groupes de canaux réservés, limite de voix et vol de la plus ancienne voix
+"""
+import random
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def manager(pygame_ready):
+    from audio import AudioManager
+
+    pygame = pygame_ready
+    if not pygame.mixer.get_init():
+        pytest.skip("mixer indisponible")
+    manager = AudioManager()
+    manager.rng = random.Random(0)
+    manager.start()
+    yield manager
+    pygame.mixer.stop()
+
+
+def long_sound(pygame, seconds=5.0):
+    """Silence assez long pour rester en lecture pendant tout le test"""
+    frequency, _, channels = pygame.mixer.get_init()
+    return pygame.sndarray.make_sound(np.zeros((int(frequency * seconds), channels), np.int16))
+
+
+def test_groups_are_reserved_channel_ranges(manager, pygame_ready):
+    assert manager.groups == {"ui": range(0, 2), "sfx": range(2, 14)}
+    # Les canaux des groupes et la sonde ne sont jamais pris par un Sound.play() direct
+    assert pygame_ready.mixer.find_channel() not in manager.channels + [manager.probe]
+
+
+def test_voice_limit_steals_oldest_voice_of_same_sound(manager, pygame_ready):
+    manager.register("impact", long_sound(pygame_ready), "sfx", max_voices=2)
+    manager.register("bomb", long_sound(pygame_ready), "sfx", max_voices=4)
+
+    first = manager.play("impact")
+    second = manager.play("impact")
+    other = manager.play("bomb")
+    assert len({first, second, other}) == 3
+    assert manager.voices("impact") == 2
+
+    # Troisième voix : la plus ancienne du même son est coupée, pas celle d'un autre son
+    assert manager.play("impact") == first
+    assert manager.play("impact") == second
+    assert manager.voices("impact") == 2 and manager.voices("bomb") == 1
+
+
+def test_full_group_steals_oldest_voice(manager, pygame_ready):
+    manager.register("click", long_sound(pygame_ready), "ui", max_voices=8)
+    manager.register("hover", long_sound(pygame_ready), "ui", max_voices=8)
+
+    first = manager.play("click")
+    second = manager.play("hover")
+    assert {first, second} == set(manager.groups["ui"])
+    assert manager.play("hover") == first
+    assert manager.owner[first] == "hover"
+
+
+def test_variants_are_played_in_turn(manager, pygame_ready):
+    manager.register("impact", long_sound(pygame_ready, 0.1), pitches=(0.9, 1.0, 1.12), gains=(0.8, 1.0))
+    entry = manager.sounds["impact"]
+    assert len(entry.variants) == 6
+    assert sorted(entry.order) == list(range(6))
+    # Plus aigu = plus court
+    lengths = [variant.get_length() for variant in entry.variants]
+    assert lengths[0] > lengths[2] > lengths[4]
+
+    for _ in range(6):
+        manager.play("impact")
+    assert entry.cursor == 0
+
+
+def test_unknown_sound_is_ignored(manager):
+    assert manager.play("missing") is None
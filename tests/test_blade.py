@@ -0,0 +1,74 @@
+"""
+Blade et EntityStore.sweep_test : coupe le long de toute la trajectoire de la souris
+"""
+import numpy as np
+import pygame
+
+from blade import Blade
+from entities import EntityStore
+
+
+def motion(pos, pressed=True):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(int(pressed), 0, 0))
+
+
+def test_segments_follow_every_position_since_last_step():
+    blade = Blade()
+    for pos in ((10, 10), (60, 10), (110, 40)):
+        blade.handle_event(motion(pos))
+
+    segments = blade.segments((160, 40), True)
+    # Premier point sans point précédent : segment de longueur nulle
+    assert segments.tolist() == [[10, 10, 10, 10], [10, 10, 60, 10], [60, 10, 110, 40], [110, 40, 160, 40]]
+    assert blade.samples == []
+
+    # Le pas suivant repart du dernier point
+    assert blade.segments((200, 40), True).tolist() == [[160, 40, 200, 40]]
+
+
+def test_only_pressed_stretches_cut():
+    blade = Blade()
+    blade.handle_event(motion((0, 0), pressed=False))
+    blade.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(20, 0), button=1))
+    blade.handle_event(motion((40, 0)))
+    blade.handle_event(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(60, 0), button=1))
+    blade.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+
+    segments = blade.segments((80, 0), False)
+    assert segments.tolist() == [[20, 0, 20, 0], [20, 0, 40, 0]]
+    assert blade.segments((90, 0), False).shape == (0, 4)
+
+
+def test_reset_forgets_path():
+    blade = Blade()
+    blade.segments((10, 10), True)
+    blade.reset()
+    assert blade.segments((50, 10), True).tolist() == [[50, 10, 50, 10]]
+
+
+def test_fast_swipe_hits_items_between_samples():
+    store = EntityStore(capacity=4)
+    crossed = store.spawn("melon", None, 300, 200, 0, 0, 60)
+    beside = store.spawn("kiwi", None, 300, 400, 0, 0, 60)
+    hit = store.spawn("bomb", None, 500, 200, 0, 0, 60)
+    store.hit[hit] = True
+
+    # Un seul segment de 700 px, sans point sur les fruits
+    swipe = np.array([[0.0, 230.0, 700.0, 230.0]])
+    assert list(store.sweep_test(swipe)) == [crossed]
+
+    # Segment en diagonale qui passe à côté de la boîte, et trajectoire vide
+    assert list(store.sweep_test(np.array([[0.0, 0.0, 400.0, 190.0]]))) == []
+    assert list(store.sweep_test(np.empty((0, 4)))) == []
+    assert list(store.sweep_test(np.array([[330.0, 430.0, 330.0, 430.0]]))) == [beside]
+
+
+def test_sweep_uses_box_swept_since_previous_step():
+    store = EntityStore(capacity=2)
+    index = store.spawn("melon", None, 100, 400, 0, -20, 60)
+    store.snapshot()
+    store.y[index] = 300  # Affiché (interpolé) entre 300 et 400 pendant ce pas
+
+    # La lame traverse la position encore affichée, pas seulement la position finale
+    assert list(store.sweep_test(np.array([[0.0, 420.0, 800.0, 420.0]]))) == [index]
+    assert list(store.sweep_test(np.array([[0.0, 200.0, 800.0, 200.0]]))) == []
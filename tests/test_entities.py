@@ -0,0 +1,109 @@
+"""
+EntityStore : emplacements, comptes des éléments en l'air (live), physique vectorisée
+et index des lettres (by_letter)
+"""
+from entities import KIND_BOMB, KIND_FRUIT, EntityStore
+
+
+def spawn(store, key, x=100, y=400, letter=None):
+    return store.spawn(key, None, x, y, 0, -20, 60, assigned_letter=letter)
+
+
+def test_spawn_fills_first_free_slot_and_counts_live():
+    store = EntityStore(capacity=3)
+    assert [spawn(store, "melon"), spawn(store, "melon"), spawn(store, "bomb")] == [0, 1, 2]
+    assert spawn(store, "melon") is None  # Réserve pleine
+    assert store.live == {"melon": 2, "bomb": 1}
+    assert list(store.kind) == [KIND_FRUIT, KIND_FRUIT, KIND_BOMB]
+    assert store.active_count() == 3
+
+
+def test_view_reads_and_writes_fields():
+    store = EntityStore(capacity=2)
+    item = store.view(spawn(store, "melon"))
+    assert item["x"] == 100.0 and item["throw"] is True
+    assert item.get("unknown", "absent") == "absent"
+    item["speed_x"] = 5
+    assert store.speed_x[item.index] == 5
+
+
+def test_integrate_applies_gravity_clamp_and_bounce():
+    store = EntityStore(capacity=2)
+    left = store.spawn("melon", None, 5, 300, -10, -20, 60)
+    right = store.spawn("kiwi", None, 735, 300, 10, 45, 60)
+
+    store.integrate(1.0, 10.0, 50, 800, 500)
+
+    assert (store.x[left], store.speed_x[left]) == (0, 10)  # Rebond à gauche
+    assert (store.x[right], store.speed_x[right]) == (740, -10)  # Rebond à droite (800 - taille)
+    assert store.y[left] == 280 and store.speed_y[left] == -10
+    assert store.speed_y[right] == 50  # Vitesse de chute maximale
+
+
+def test_integrate_releases_missed_items():
+    store = EntityStore(capacity=4)
+    low = spawn(store, "melon", y=490)
+    spawn(store, "kiwi", y=100)
+    store.speed_y[:] = 20
+
+    missed = store.integrate(1.0, 0.0, 50, 800, 500)
+
+    assert list(missed) == [low]
+    assert store.live == {"melon": 0, "kiwi": 1}
+    assert store.active_count() == 1
+    # L'emplacement libéré est réutilisé ; count reste le plus haut emplacement utilisé
+    assert spawn(store, "bomb") == low
+    assert store.count == 2
+
+
+def test_clear_resets_accounting():
+    store = EntityStore(capacity=2)
+    spawn(store, "melon")
+    store.clear()
+    assert store.count == 0 and store.active_count() == 0
+    assert store.live == {}
+
+
+def test_letter_index_follows_spawn_hit_and_miss():
+    store = EntityStore(capacity=4)
+    first = spawn(store, "melon_A", y=490, letter="A")
+    second = spawn(store, "kiwi_A", y=100, letter="A")
+    third = spawn(store, "melon_B", letter="B")
+    assert list(store.by_letter["A"]) == [first, second]
+
+    store.view(third)["hit"] = True
+    assert store.find_letter("B") is None
+    assert store.live["melon_B"] == 1  # Touché mais encore en l'air
+
+    store.speed_y[:] = 20
+    store.integrate(1.0, 0.0, 50, 800, 500)
+    assert store.find_letter("A") == second
+
+
+def test_set_field_throw_releases_slot_once():
+    store = EntityStore(capacity=4)
+    index = spawn(store, "melon_A", letter="A")
+    spawn(store, "bomb")
+
+    store.view(index)["throw"] = False
+    store.view(index)["throw"] = False  # Déjà libéré : pas de double décompte
+    assert store.find_letter("A") is None
+    assert store.live == {"melon_A": 0, "bomb": 1}
+    assert len(store) == 1
+
+
+def test_find_letter_policies():
+    store = EntityStore(capacity=4)
+    oldest = spawn(store, "melon_E", y=200, letter="E")
+    lowest = spawn(store, "kiwi_E", y=450, letter="E")
+
+    assert store.find_letter("E", policy="oldest") == oldest
+    assert store.find_letter("E", policy="lowest") == lowest
+    assert store.find_letter("Z") is None
+
+
+def test_clear_empties_letter_index():
+    store = EntityStore(capacity=2)
+    spawn(store, "melon_A", letter="A")
+    store.clear()
+    assert store.by_letter == {} and store.find_letter("A") is None
@@ -0,0 +1,54 @@
+"""
+ParticleSystem : capacité fixe, recyclage des plus anciennes et rendu limité au clip
+"""
+import numpy as np
+
+from particles import ParticleSystem
+
+
+def make_system(capacity):
+    return ParticleSystem(capacity=capacity, rng=np.random.default_rng(0))
+
+
+def test_emit_reuses_oldest_slots_when_full():
+    particles = make_system(100)
+    particles.emit(10, 10, 60, [0])
+    particles.emit(500, 500, 60, [1], life=(5.0, 5.0))
+
+    assert particles.live_count() == 100
+    assert particles.pos.shape == (100, 2)  # Jamais réalloué
+    # La deuxième gerbe a écrasé les 20 premiers emplacements de la première
+    assert (particles.color[:20] == 1).all() and (particles.color[20:60] == 0).all()
+    assert particles.cursor == 20
+
+    # Gerbe plus grande que la réserve : tronquée
+    particles.emit(0, 0, 500, [2])
+    assert particles.live_count() == 100
+
+
+def test_update_moves_and_expires_particles():
+    particles = make_system(10)
+    particles.emit(100, 100, 10, [0], life=(0.5, 0.5))
+    start = particles.pos.copy()
+
+    particles.update(0.25)
+    assert particles.live_count() == 10
+    assert not np.array_equal(particles.pos, start)
+    particles.update(0.3)
+    assert particles.live_count() == 0
+    assert particles.bounds() is None
+
+
+def test_draw_stays_inside_clip(pygame_ready):
+    pygame = pygame_ready
+    particles = make_system(500)
+    particles.emit(50, 50, 500, [7], speed=(0, 200), drops=0.5)
+    surface = pygame.Surface((100, 100))
+    surface.set_clip(pygame.Rect(0, 0, 50, 100))
+
+    particles.draw(surface)
+
+    pixels = pygame.surfarray.array3d(surface)
+    assert pixels[:50].any()
+    assert not pixels[50:].any()
+    assert particles.bounds().collidepoint(50, 50)
@@ -0,0 +1,75 @@
+"""
+Enregistrement puis relecture d'une session : même état final (empreinte)
+"""
+import random
+
+import pytest
+
+SEED = 99
+Y_OFFSET = 80
+
+
+@pytest.fixture
+def recorded(pygame_ready, tmp_path):
+    """Session de quelques centaines d'images jouée par le bot, dans les deux modes"""
+    from game import Game
+    from replay import Recorder, state_digest
+    from simulator import GreedyBot
+
+    path = str(tmp_path / "session.rec")
+    game = Game(800, 500, rng=random.Random(SEED), save_scores=False)
+    recorder = Recorder(path, SEED).attach(game, y_offset=Y_OFFSET)
+    bot = GreedyBot(random.Random(1), skill=0.5)
+    game.mouse_input = bot.mouse
+    frames = random.Random(2)
+
+    game.start_game()
+    for frame in range(900):
+        if frame == 450:
+            game.set_game_mode(2)
+        if game.game_mode == 2:
+            for letter in bot.keys(game):
+                game.queue_letter(letter)
+        if game.is_game_over():
+            game.start_game()
+        game.advance(frames.choice([0.016, 0.033, 0.1]), Y_OFFSET)
+    digest = state_digest(game)
+    recorder.close()
+    return path, game, digest
+
+
+def test_replay_reproduces_recorded_session(recorded):
+    from replay import Replay, state_digest
+
+    path, game, digest = recorded
+    replay = Replay.open(path)
+    assert replay.header["seed"] == SEED
+    assert replay.header["difficulty"] == game.difficulty
+
+    replayed = replay.make_game()
+    stats = replay.play(replayed)
+    assert stats["identical"] is True
+    assert stats["frames"] == 900
+    assert stats["steps"] == game.steps
+    assert (stats["score"], stats["items_spawned"]) == (game.score, game.items_spawned)
+    assert state_digest(replayed) == digest
+
+
+def test_replay_detects_different_final_state(recorded):
+    from replay import DIGEST, Replay
+
+    path, _, _ = recorded
+    replay = Replay.open(path)
+    code, value = replay.records[-1]
+    assert code == DIGEST
+    replay.records[-1] = (DIGEST, bytes(len(value)))
+    assert replay.play()["identical"] is False
+
+
+def test_open_rejects_unknown_file(tmp_path):
+    from replay import Replay
+
+    path = tmp_path / "other.rec"
+    path.write_bytes(b"not a recording")
+    with pytest.raises(ValueError):
+        Replay.open(str(path))
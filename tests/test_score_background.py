@@ -0,0 +1,48 @@
+"""
+Fond du tableau des scores : dégradé mis en cache et particules en tableaux NumPy
+"""
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def score(pygame_ready):
+    from score import Score
+
+    score = Score()
+    score.rng = np.random.default_rng(0)
+    return score
+
+
+def test_gradient_is_built_once_per_size(score):
+    gradient = score.gradient((200, 100))
+    assert score.gradient((200, 100)) is gradient
+    assert score.gradient((100, 50)) is not gradient
+    assert gradient.get_size() == (200, 100)
+    assert tuple(gradient.get_at((0, 0)))[:3] == (20, 20, 40)
+    assert tuple(gradient.get_at((199, 99)))[:3] == (49, 59, 59)
+
+
+def test_particles_fade_and_respawn_inside_screen(score):
+    particles = score.create_particles(200, 100, count=50)
+    assert particles['pos'].shape == (50, 2)
+    particles['pos'][0] = (-5, 50)  # Sortie de l'écran
+    particles['alpha'][1] = 1  # Presque invisible
+    particles['pos'][2:] = (100, 50)
+
+    score.update_particles(particles, 200, 100)
+
+    pos = particles['pos']
+    assert ((pos >= 0) & (pos <= (200, 100))).all()
+    assert particles['alpha'][0] == 255 and particles['alpha'][1] == 255
+    assert (particles['alpha'][2:] == 253).all()
+
+
+def test_draw_background_reuses_gradient_and_sprites(score, pygame_ready):
+    screen = pygame_ready.Surface((200, 100))
+    score.particles = score.create_particles(200, 100)
+    score.draw_background(screen)
+    sprites = score.particle_sprites
+    score.draw_background(screen)
+    assert score.particle_sprites is sprites
+    assert list(score.gradients) == [(200, 100)]
@@ -0,0 +1,179 @@
+"""
+ScoreLog : journal en ajout seul, index trié en mémoire, compaction, relecture incrémentale
+et pages du classement par l'index des lignes
+"""
+import random
+
+from score_log import ScoreLog, format_score_line, parse_score_line, sort_key
+
+
+def make_score(points, timestamp, mode="Mode 1"):
+    return {"player": "Player", "mode": mode, "result": "LOSE", "score": points,
+            "attempts": 3, "max_attempts": 3, "date": "02/02/2026 09:42", "timestamp": timestamp}
+
+
+def random_scores(count, seed=0):
+    rng = random.Random(seed)
+    return [make_score(rng.randint(0, 50), 1770000000.0 + i, rng.choice(["Mode 1", "Mode 2"]))
+            for i in range(count)]
+
+
+def write_lines(path, scores, mode="a"):
+    with open(path, mode, encoding="utf-8") as f:
+        f.writelines(format_score_line(score) for score in scores)
+
+
+def ranked(scores):
+    return sorted(scores, key=sort_key)
+
+
+def test_line_format_round_trip():
+    score = make_score(12, 1770000000.5, "Mode 2")
+    assert parse_score_line(format_score_line(score)) == score
+    assert parse_score_line("Player|Mode 1|LOSE|abc|3|3|date") is None
+    assert parse_score_line("incomplete|line") is None
+
+
+def test_append_keeps_sorted_index_per_mode(tmp_path):
+    path = str(tmp_path / "scores.txt")
+    scores = random_scores(20)
+    log = ScoreLog(path)
+    for score in scores:
+        log.append(score)
+
+    assert log.scores() == ranked(scores)
+    assert log.scores("Mode 2") == ranked([s for s in scores if s["mode"] == "Mode 2"])
+    assert log.top(3) == ranked(scores)[:3]
+    assert log.scores("Mode 9") == []
+    # Le fichier n'est qu'ajouté : lignes dans l'ordre des parties
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "".join(format_score_line(score) for score in scores)
+    assert ScoreLog(path).scores() == ranked(scores)
+
+
+def test_compaction_rewrites_sorted_file_after_threshold(tmp_path):
+    path = str(tmp_path / "scores.txt")
+    log = ScoreLog(path)
+    log.COMPACT_THRESHOLD = 10
+    scores = random_scores(10)
+    for score in scores[:9]:
+        log.append(score)
+    assert log.appended == 9
+
+    log.append(scores[9])
+    assert log.appended == 0
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "".join(format_score_line(score) for score in ranked(scores))
+    assert log.scores() == ranked(scores)
+
+
+def test_write_all_replaces_content(tmp_path):
+    path = str(tmp_path / "scores.txt")
+    log = ScoreLog(path)
+    log.write_all(random_scores(5))
+    log.write_all([])
+    assert log.scores() == []
+    assert ScoreLog(path).scores() == []
+
+
+def test_refresh_reads_lines_appended_by_another_process(tmp_path):
+    path = str(tmp_path / "scores.txt")
+    first = random_scores(5)
+    write_lines(path, first)
+    log = ScoreLog(path)
+    assert log.scores() == ranked(first)
+    assert not log.refresh(force=True)  # Fichier inchangé : rien à relire
+
+    # Autre processus : ajout d'une ligne complète et d'une ligne en cours d'écriture
+    added = make_score(99, 1780000000.0, "Mode 2")
+    write_lines(path, [added])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("Player|Mode 2|LO")
+    assert not log.refresh()  # Moins de REFRESH_INTERVAL depuis la dernière vérification
+    assert log.refresh(force=True)
+    assert log.scores()[0] == added
+    assert log.scores("Mode 2")[0] == added
+    assert len(log.scores()) == 6
+
+    # Notre ajout termine la ligne incomplète avant d'écrire la sienne
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("SE|1|3|3|02/02/2026 09:42|1780000001.0")
+    log.append(make_score(2, 1780000002.0))
+    assert len(log.scores()) == 8
+    assert not log.refresh(force=True)
+    assert len(ScoreLog(path).scores()) == 8
+
+
+def test_refresh_reloads_rewritten_file(tmp_path):
+    path = str(tmp_path / "scores.txt")
+    write_lines(path, random_scores(5))
+    log = ScoreLog(path)
+    log.scores()
+
+    replacement = random_scores(3, seed=1)
+    write_lines(path, replacement, mode="w")
+    assert log.refresh(force=True)
+    assert log.scores() == ranked(replacement)
+
+
+def test_open_view_indexes_large_file_without_rewriting_it(tmp_path):
+    path = str(tmp_path / "scores.txt")
+    scores = random_scores(40)
+    write_lines(path, scores)
+    with open(path, "rb") as f:
+        original = f.read()
+
+    log = ScoreLog(path)
+    log.INDEX_MIN_LINES = 20
+    assert log.count() == 40
+    with open(path, "rb") as f:
+        assert f.read() == original
+    assert (tmp_path / "scores.txt.idx").exists()
+
+    # Nouveau lancement : lecture paresseuse par l'index, pages identiques au tri complet
+    lazy = ScoreLog(path)
+    assert lazy.count() == 40
+    assert not lazy.loaded
+    expected = ranked(scores)
+    for start in (0, 7, 35, 39):
+        assert lazy.page(start, 5) == expected[start:start + 5]
+    assert lazy.page(40, 5) == []
+
+
+def test_page_merges_lines_appended_after_index(tmp_path):
+    path = str(tmp_path / "scores.txt")
+    scores = random_scores(30)
+    log = ScoreLog(path)
+    log.write_all(scores)
+    assert (tmp_path / "scores.txt.idx").exists()
+
+    # Lignes ajoutées après l'index : fusionnées à leur rang dans les pages
+    extra = [dict(score, timestamp=score["timestamp"] + 100) for score in random_scores(6, seed=2)]
+    write_lines(path, extra)
+    lazy = ScoreLog(path)
+    assert lazy.count() == 36
+    assert not lazy.loaded
+    expected = ranked(scores + extra)
+    assert [lazy.page(start, 4) for start in range(0, 36, 4)] == [expected[i:i + 4] for i in range(0, 36, 4)]
+
+    # Un ajout pendant l'affichage aussi
+    late = make_score(25, 1790000000.0)
+    lazy.append(late)
+    assert lazy.count() == 37
+    assert lazy.page(0, 37) == ranked(scores + extra + [late])
+
+
+def test_stale_index_falls_back_to_full_read(tmp_path):
+    path = str(tmp_path / "scores.txt")
+    log = ScoreLog(path)
+    log.write_all(random_scores(10))
+
+    # Dernière ligne indexée modifiée sans passer par le journal
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "r+b") as f:
+        f.seek(len(data) - 2)
+        f.write(b"9\n")
+    reopened = ScoreLog(path)
+    assert reopened.count() == 10
+    assert reopened.loaded
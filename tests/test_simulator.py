@@ -0,0 +1,19 @@
+"""
+Simulateur sans écran : statistiques d'une partie jouée par un bot
+"""
+import pytest
+
+
+@pytest.mark.parametrize("fps", [12, 24])
+def test_survival_time_is_in_game_seconds(pygame_ready, fps):
+    from simulator import simulate_game
+
+    stats = simulate_game(3, duration=20, params={"FPS": fps})
+    assert stats["survival_time"] == pytest.approx(20.0)
+    assert stats["items_per_second"] == pytest.approx(stats["items_spawned"] / 20.0)
+
+
+def test_same_seed_same_game(pygame_ready):
+    from simulator import simulate_game
+
+    assert simulate_game(5, mode=2, duration=10) == simulate_game(5, mode=2, duration=10)
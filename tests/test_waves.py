@@ -0,0 +1,71 @@
+"""
+WaveScheduler : rythme des chronologies, rotation des groupes et limites par type
+"""
+from waves import MAX_PER_ITEM, TIMELINES, WaveScheduler
+
+ITEMS = ["melon", "kiwi", "bomb", "ice_cube2"]
+
+
+def fire_steps(scheduler, steps, live=None, default_delay=15):
+    """Pas où une vague est lancée, avec les clés choisies (comme Game.update)"""
+    live = {} if live is None else live
+    fired = []
+    for step in range(1, steps + 1):
+        wave = scheduler.tick(default_delay)
+        if not wave:
+            continue
+        keys = [scheduler.pick(group, live) for group in wave]
+        keys = [key for key in keys if key is not None]
+        if keys:
+            scheduler.fired()
+            fired.append((step, keys))
+    return fired
+
+
+def test_default_delay_and_round_robin():
+    scheduler = WaveScheduler([(None, ("any",))], ITEMS)
+    fired = fire_steps(scheduler, 60, default_delay=15)
+    assert [step for step, _ in fired] == [15, 30, 45, 60]
+    assert [keys for _, keys in fired] == [["melon"], ["kiwi"], ["bomb"], ["ice_cube2"]]
+
+
+def test_timeline_loops_with_own_delays_and_groups():
+    scheduler = WaveScheduler(TIMELINES["hard"], ITEMS)
+    fired = fire_steps(scheduler, 60)
+    assert [step for step, _ in fired] == [10, 20, 32, 50, 60]
+    assert fired[0][1] == ["melon", "kiwi"]
+    # Un curseur par groupe, partagé par toutes les vagues ("fruit" a déjà servi 3 fois)
+    assert fired[2][1] == ["melon", "bomb"]
+    assert fired[3][1] == ["kiwi", "melon", "kiwi", "melon", "kiwi", "bomb"]
+    # Retour au début de la chronologie
+    assert [step for step, _ in fire_steps(scheduler, 10)] == [10]
+
+
+def test_groups_missing_from_mode_are_dropped():
+    scheduler = WaveScheduler([(5, ("ice_cube2", "fruit"))], ["melon_A", "bomb"])
+    assert fire_steps(scheduler, 5) == [(5, ["melon_A"])]
+
+
+def test_pick_skips_types_at_limit():
+    scheduler = WaveScheduler([(1, ("any",))], ITEMS, max_per_item=1)
+    live = {"melon": 1, "kiwi": 1}
+    assert scheduler.pick(0, live) == "bomb"
+    assert scheduler.pick(0, dict.fromkeys(ITEMS, 1)) is None
+
+
+def test_wave_stays_armed_while_every_type_is_at_limit():
+    scheduler = WaveScheduler([(None, ("any",))], ITEMS, MAX_PER_ITEM["normal"])
+    live = dict.fromkeys(ITEMS, 1)
+    assert fire_steps(scheduler, 20, live) == []
+
+    # Un type se libère : la vague part au pas suivant, sans attendre un nouveau délai
+    live["kiwi"] = 0
+    assert fire_steps(scheduler, 1, live) == [(1, ["kiwi"])]
+    assert scheduler.timer == 0
+
+
+def test_reset_restarts_timeline():
+    scheduler = WaveScheduler(TIMELINES["hard"], ITEMS)
+    fire_steps(scheduler, 25)
+    scheduler.reset()
+    assert fire_steps(scheduler, 10) == [(10, ["melon", "kiwi"])]